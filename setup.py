@@ -106,16 +106,23 @@ setup(name='zope.app.component',
           'zope.app.container >= 4.0',
           'zope.app.pagetemplate >= 4.0',
           'zope.component[hook,zcml] >= 4.3.0',
+          'zope.container',
+          'zope.copy',
           'zope.deprecation',
+          'zope.dottedname',
+          'zope.event',
           'zope.exceptions',
           'zope.formlib',
           'zope.i18nmessageid',
           'zope.interface',
+          'zope.lifecycleevent',
+          'zope.location',
           'zope.publisher >= 4.3.1',
           'zope.schema',
           'zope.security',
           'zope.traversing',
           'zope.componentvocabulary',
+          'transaction',
       ],
       include_package_data=True,
       zip_safe=False,
@@ -0,0 +1,70 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Lazy backwards compatible names
+
+The modules kept for backwards compatibility only re-export names of other
+packages.  They import these packages when a name is first used, not when
+the module is imported.
+"""
+import collections
+import importlib
+import sys
+import warnings
+
+
+#: How many times each backwards compatible name (``module.name``) was
+#: resolved.  A name is resolved once per process and module.
+resolved = collections.Counter()
+
+#: Set to true to issue a `DeprecationWarning` when a backwards compatible
+#: name is resolved.
+warn = False
+
+
+def lazyImports(module_name, imports):
+    """Return the ``__getattr__`` and ``__dir__`` functions and the
+    ``__all__`` list of a module
+
+    `imports` maps the names of the modules the names are imported from to
+    the sequences of the names.  The imported names are stored in the
+    module, so that only their first use goes through ``__getattr__``.
+    ``__all__`` lists the imported names not starting with an underscore,
+    which star imports of the module import, as before.
+    """
+    origins = {name: origin
+               for origin, names in imports.items()
+               for name in names}
+
+    def __getattr__(name):
+        try:
+            origin = origins[name]
+        except KeyError:
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(
+                    module_name, name)) from None
+        value = getattr(importlib.import_module(origin), name)
+        setattr(sys.modules[module_name], name, value)
+        resolved[module_name + '.' + name] += 1
+        if warn:
+            warnings.warn(
+                '{}.{} is deprecated, import it from {}'.format(
+                    module_name, name, origin),
+                DeprecationWarning, stacklevel=2)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(origins))
+
+    __all__ = sorted(name for name in origins if not name.startswith('_'))
+    return __getattr__, __dir__, __all__
@@ -0,0 +1,383 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Benchmarks for the registration and site-management views.
+
+The benchmarks run against a site built with `testing.PlacefulSetup` and
+don't need a database or a server::
+
+    python -m zope.app.component.benchmark --utilities 10000
+
+Run with ``--help`` for all the options.  The results can be saved with
+``--output`` and later be used as ``--baseline``; the command then fails if
+the throughput of any benchmark dropped by more than ``--tolerance``.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from zope.component import hooks
+from zope.interface.interfaces import IUtilityRegistration
+from zope.publisher.browser import TestRequest
+from zope.publisher.interfaces.browser import IBrowserRequest
+from zope.site.folder import Folder
+from zope.site.site import SiteManagerAdapter
+
+from zope import component
+from zope import interface
+from zope.app.component import testing
+from zope.app.component.browser import MakeSite
+from zope.app.component.browser import registration
+from zope.app.component.lookupcache import LookupCache
+from zope.app.component.registrations import registerUtilities
+from zope.app.component.registrations import registrationChanged
+
+
+class IBenchmarkUtility(interface.Interface):
+    """Provided by the utilities registered for the benchmarks"""
+
+
+class IBenchmarkAdapted(interface.Interface):
+    """Required by the adapters, subscribers and handlers"""
+
+
+@interface.implementer(IBenchmarkUtility)
+class BenchmarkUtility:
+    pass
+
+
+@interface.implementer(IBenchmarkAdapted)
+class BenchmarkAdapted(Folder):
+    """Content adapted in the adapter lookup benchmarks"""
+
+
+@interface.implementer(IBenchmarkUtility)
+@component.adapter(IBenchmarkAdapted)
+class BenchmarkAdapter:
+
+    def __init__(self, context):
+        self.context = context
+
+
+def benchmarkHandler(event):
+    pass  # pragma: no cover
+
+
+class BenchmarkSetup(testing.PlacefulSetup):
+    """A site with the given number of local registrations
+
+    The ``target`` folder in the root folder is registered
+    `target_registrations` times as a utility.
+    """
+
+    target_registrations = 5
+
+    def __init__(self, utilities=1000, adapters=100, subscribers=100,
+                 handlers=100):
+        self.utilities = utilities
+        self.adapters = adapters
+        self.subscribers = subscribers
+        self.handlers = handlers
+
+    def setUp(self):
+        self.sm = super().setUp(site=True)
+        component.provideAdapter(SiteManagerAdapter)
+        component.provideHandler(registrationChanged)
+        component.provideAdapter(registration.UtilityRegistrationDisplay)
+        component.provideAdapter(
+            registration.UtilitySiteRegistrationDisplay,
+            (IUtilityRegistration, IBrowserRequest),
+            registration.ISiteRegistrationDisplay)
+
+        self.target = self.rootFolder['target'] = Folder()
+        registerUtilities(self.sm, [
+            (self.target, IBenchmarkUtility, 'target%d' % i, '')
+            for i in range(self.target_registrations)])
+        registerUtilities(self.sm, [
+            (BenchmarkUtility(), IBenchmarkUtility, 'utility%d' % i, '')
+            for i in range(self.utilities)])
+        for i in range(self.adapters):
+            self.sm.registerAdapter(BenchmarkAdapter, name='adapter%d' % i)
+        for i in range(self.subscribers):
+            self.sm.registerSubscriptionAdapter(BenchmarkAdapter)
+        for i in range(self.handlers):
+            self.sm.registerHandler(benchmarkHandler, (IBenchmarkAdapted,))
+        self._counter = 0
+        self._nestedSite = None
+        return self.sm
+
+    def nestedSite(self, depth=3):
+        """Return a site `depth` sites below the root site
+
+        It is created the first time, with a `BenchmarkAdapted` item named
+        ``adapted``.
+        """
+        if self._nestedSite is None:
+            folder = self.rootFolder
+            for i in range(depth):
+                folder['nested'] = Folder()
+                folder = folder['nested']
+                testing.createSiteManager(folder)
+            folder['adapted'] = BenchmarkAdapted()
+            self._nestedSite = folder
+        return self._nestedSite
+
+    def newName(self, prefix):
+        self._counter += 1
+        return '%s%d' % (prefix, self._counter)
+
+
+# Every benchmark takes a `BenchmarkSetup` and returns ``(prepare, run,
+# ops)``: ``prepare()`` is called (untimed) before every timed call to
+# ``run(prepare())``, which performs `ops` operations.
+
+def _noPrepare():
+    return None
+
+
+def benchObjectRegistrations(setup):
+    def run(arg):
+        list(registration._registrations(setup.target, setup.target))
+    return _noPrepare, run, 1
+
+
+def benchAllRegistrations(setup):
+    total = (setup.utilities + setup.adapters + setup.subscribers
+             + setup.handlers + setup.target_registrations)
+
+    def run(arg):
+        for r in registration._registrations(setup.sm, None):
+            pass
+    return _noPrepare, run, total
+
+
+def benchRegistrationView(setup):
+    def run(arg):
+        registration.RegistrationView(
+            setup.target, TestRequest()).registrations()
+    return _noPrepare, run, 1
+
+
+def benchSiteRegistrationView(setup):
+    def run(arg):
+        registration.SiteRegistrationView(
+            setup.sm, TestRequest(form={'kind': 'utility'})).registrations()
+    return _noPrepare, run, 1
+
+
+def benchBulkUnregister(setup, count=100):
+    def prepare():
+        names = [setup.newName('bulk') for i in range(count)]
+        registerUtilities(setup.sm, [
+            (BenchmarkUtility(), IBenchmarkUtility, name, '')
+            for name in names])
+        ids = [registration._utilityId(IBenchmarkUtility.__identifier__,
+                                       name)
+               for name in names]
+        return registration.SiteRegistrationView(
+            setup.sm, TestRequest(form={'ids': ids}))
+
+    def run(view):
+        view.update()
+    return prepare, run, count
+
+
+def benchAddUtilityRegistration(setup):
+    register = registration.AddUtilityRegistration.register.success_handler
+
+    def prepare():
+        folder = setup.rootFolder[setup.newName('added')] = Folder()
+        return registration.AddUtilityRegistration(folder, TestRequest())
+
+    def run(view):
+        register(view, None, {'name': 'added', 'provided': IBenchmarkUtility,
+                              'comment': ''})
+    return prepare, run, 1
+
+
+def benchMakeSite(setup):
+    def prepare():
+        folder = setup.rootFolder[setup.newName('site')] = Folder()
+        return MakeSite(folder, TestRequest())
+
+    def run(view):
+        view.addSiteManager()
+    return prepare, run, 1
+
+
+def _coldRegistryLookups(setup, hook):
+    # Adapt content to every named adapter once per run in a nested site,
+    # after the adapter registries lost their lookup caches, as persistent
+    # registries do when they are deactivated by the database between
+    # requests
+    site = setup.nestedSite()
+    ob = site['adapted']
+    names = ['adapter%d' % i for i in range(setup.adapters)]
+    registries = site.getSiteManager().adapters.ro
+
+    def prepare():
+        for registry in registries:
+            registry._createLookup()
+
+    def run(arg):
+        with hooks.site(site):
+            for name in names:
+                hook(IBenchmarkUtility, ob, name)
+    return prepare, run, len(names)
+
+
+def benchAdapterHook(setup):
+    return _coldRegistryLookups(setup, hooks.adapter_hook)
+
+
+def benchCachedAdapterHook(setup):
+    cache = LookupCache(maxsize=setup.adapters)
+    return _coldRegistryLookups(setup, cache.adapter_hook)
+
+
+BENCHMARKS = (
+    ('_registrations(object)', benchObjectRegistrations),
+    ('_registrations(all)', benchAllRegistrations),
+    ('RegistrationView.registrations', benchRegistrationView),
+    ('SiteRegistrationView.registrations', benchSiteRegistrationView),
+    ('SiteRegistrationView.update', benchBulkUnregister),
+    ('AddUtilityRegistration.register', benchAddUtilityRegistration),
+    ('MakeSite.addSiteManager', benchMakeSite),
+    ('adapter_hook(cold registry)', benchAdapterHook),
+    ('LookupCache.adapter_hook(cold registry)', benchCachedAdapterHook),
+)
+
+
+def runBenchmark(setup, benchmark, repeat=20):
+    """Run a benchmark and return its results
+
+    The result is a dictionary with the throughput in operations per second
+    (based on the median time), the median and best time per run in
+    seconds and the peak memory allocated by a run in bytes.
+    """
+    prepare, run, ops = benchmark(setup)
+    run(prepare())  # warm up
+    times = []
+    for i in range(repeat):
+        arg = prepare()
+        start = time.perf_counter()
+        run(arg)
+        times.append(time.perf_counter() - start)
+
+    arg = prepare()
+    tracemalloc.start()
+    try:
+        run(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "ops_per_second": ops / median if median else float('inf'),
+        "median": median,
+        "best": min(times),
+        "peak_memory": peak,
+    }
+
+
+def runBenchmarks(setup, repeat=20, names=None):
+    """Run the benchmarks (all or the ones named) against a new site"""
+    results = {}
+    setup.setUp()
+    try:
+        for name, benchmark in BENCHMARKS:
+            if names and name not in names:
+                continue
+            results[name] = runBenchmark(setup, benchmark, repeat)
+    finally:
+        setup.tearDown()
+    return results
+
+
+def compareResults(results, baseline, tolerance):
+    """Return the names of the benchmarks slower than in the baseline
+
+    A benchmark regressed if its throughput is lower than the baseline
+    throughput by more than the `tolerance` fraction.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        minimum = expected['ops_per_second'] * (1 - tolerance)
+        if result['ops_per_second'] < minimum:
+            regressions.append(name)
+    return regressions
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m zope.app.component.benchmark',
+        description=__doc__.splitlines()[0])
+    parser.add_argument('--utilities', type=int, default=1000)
+    parser.add_argument('--adapters', type=int, default=100)
+    parser.add_argument('--subscribers', type=int, default=100)
+    parser.add_argument('--handlers', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="timed runs per benchmark")
+    parser.add_argument('--benchmark', action='append', dest='names',
+                        metavar='NAME', choices=[n for n, b in BENCHMARKS],
+                        help="run only this benchmark (repeatable)")
+    parser.add_argument('--output', metavar='FILE',
+                        help="save the results as JSON")
+    parser.add_argument('--baseline', metavar='FILE',
+                        help="fail if slower than the results in FILE")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed throughput loss relative to the "
+                             "baseline (default: %(default)s)")
+    return parser
+
+
+def main(argv=None, out=None):
+    out = sys.stdout if out is None else out
+    options = _parser().parse_args(argv)
+    setup = BenchmarkSetup(options.utilities, options.adapters,
+                           options.subscribers, options.handlers)
+    results = runBenchmarks(setup, options.repeat, options.names)
+
+    print("{:<38} {:>14} {:>11} {:>11} {:>11}".format(
+        "benchmark", "ops/s", "median ms", "best ms", "peak KiB"), file=out)
+    for name, result in results.items():
+        print("{:<38} {:>14.1f} {:>11.3f} {:>11.3f} {:>11.1f}".format(
+            name, result['ops_per_second'], result['median'] * 1000,
+            result['best'] * 1000, result['peak_memory'] / 1024), file=out)
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        regressions = compareResults(results, baseline, options.tolerance)
+        for name in regressions:
+            print("REGRESSION: {} ({:.1f} ops/s, baseline {:.1f})".format(
+                name, results[name]['ops_per_second'],
+                baseline[name]['ops_per_second']), file=out)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,17 +13,50 @@
 ##############################################################################
 """View support for adding and configuring utilities and adapters.
 """
+import weakref
+
+import transaction
+import zope.app.pagetemplate
 import zope.component
 import zope.component.interfaces
 from zope.app.container.browser.adding import Adding
 from zope.component.interfaces import IFactory
+from zope.component.interfaces import IPossibleSite
+from zope.component.interfaces import ISite
 from zope.exceptions.interfaces import UserError
+from zope.publisher.browser import BrowserPage
 from zope.publisher.browser import BrowserView
 from zope.security.proxy import removeSecurityProxy
 from zope.site.site import LocalSiteManager
+from zope.traversing.api import traverse
 from zope.traversing.browser.absoluteurl import absoluteURL
 
 from zope.app.component.i18n import ZopeMessageFactory as _
+from zope.app.component.sites import makeSites
+from zope.app.component.sites import possibleSites
+
+
+# Whether the interfaces of a factory extend an interface, by utility
+# registry of the current site.  The decisions are dropped when any of the
+# registries the lookups were made in changes.
+_factory_decisions = weakref.WeakKeyDictionary()
+
+
+def _factoryExtends(factoryname, interface):
+    utilities = zope.component.getSiteManager().utilities
+    generations = tuple(r._generation for r in utilities.ro)
+    cached = _factory_decisions.get(utilities)
+    if cached is None or cached[0] != generations:
+        cached = _factory_decisions[utilities] = (generations, {})
+    decisions = cached[1]
+    key = (factoryname, interface)
+    try:
+        return decisions[key]
+    except KeyError:
+        factory = zope.component.getUtility(IFactory, factoryname)
+        result = decisions[key] = bool(
+            factory.getInterfaces().extends(interface))
+        return result
 
 
 class ComponentAdding(Adding):
@@ -75,9 +108,8 @@ class ComponentAdding(Adding):
             if extra:
                 factoryname = extra.get('factory')
                 if factoryname:
-                    factory = zope.component.getUtility(IFactory, factoryname)
-                    intf = factory.getInterfaces()
-                    if not intf.extends(self._addFilterInterface):
+                    if not _factoryExtends(factoryname,
+                                           self._addFilterInterface):
                         # We only skip new addMenuItem style objects
                         # that don't implement our wanted interface.
                         continue
@@ -160,3 +192,59 @@ class MakeSite(BrowserView):
         self.context.setSiteManager(sm)
         self.request.response.redirect(
             "++etc++site/@@SelectedManagementView.html")
+
+
+class MakeSites(BrowserPage):
+    """View for converting many possible sites of a folder to sites
+
+    The selected items are made sites in one operation, and the possible
+    sites below them too if ``subtree`` is checked.  The new sites are
+    seeded from the site at the path given as ``template``, if any.
+    """
+
+    render = zope.app.pagetemplate.ViewPageTemplateFile('makesites.pt')
+
+    status = None
+
+    def items(self):
+        return sorted(
+            name for name, ob in self.context.items()
+            if IPossibleSite.providedBy(ob) and not ISite.providedBy(ob))
+
+    def _folders(self, ids, subtree):
+        for id in ids:
+            ob = self.context.get(id)
+            if ob is None or not IPossibleSite.providedBy(ob):
+                continue
+            yield ob
+            if subtree:
+                yield from possibleSites(ob)
+
+    def update(self):
+        form = self.request.form
+        if 'make' not in form:
+            return
+        template = None
+        path = form.get('template', '').strip()
+        if path:
+            site = traverse(self.context, path, None)
+            if not ISite.providedBy(site):
+                self.status = _("There is no site at ${path}.",
+                                mapping={"path": path})
+                return
+            template = site.getSiteManager()
+        folders = self._folders(form.get('ids', ()), form.get('subtree'))
+        try:
+            managers = makeSites(folders, template)
+        except (ValueError, LookupError, ImportError) as e:
+            # Don't keep the sites made before the error
+            transaction.doom()
+            self.status = _("The sites could not be made: ${error}",
+                            mapping={"error": str(e)})
+            return
+        self.status = _("Made ${count} sites.",
+                        mapping={"count": len(managers)})
+
+    def __call__(self):
+        self.update()
+        return self.render()
@@ -14,30 +14,254 @@
 """General registry-related views
 """
 import base64
+import collections
+import functools
+import heapq
+import itertools
+import json
+import operator
+import tempfile
+from urllib.parse import urlencode
 
 import zope.app.pagetemplate
 import zope.component.interfaces
 import zope.publisher.interfaces.browser
 from zope.formlib import form
+from zope.interface import implementedBy
+from zope.interface.registry import AdapterRegistration
+from zope.interface.registry import HandlerRegistration
+from zope.interface.registry import SubscriptionRegistration
+from zope.interface.registry import UtilityRegistration
+from zope.location.interfaces import ILocation
+from zope.proxy import sameProxiedObjects
 from zope.publisher.browser import BrowserPage
+from zope.publisher.http import DirectResult
 from zope.security.proxy import removeSecurityProxy
+from zope.traversing.api import getPath
+from zope.traversing.browser.absoluteurl import AbsoluteURL
+from zope.traversing.browser.absoluteurl import _safe
+from zope.traversing.browser.absoluteurl import quote
 
 from zope import component
 from zope import interface
 from zope import schema
 from zope.app.component.i18n import ZopeMessageFactory as _
+from zope.app.component.registrations import KIND_NAMES
+from zope.app.component.registrations import bulkChanges
+from zope.app.component.registrations import getRegistrationIndex
+from zope.app.component.registrations import iterRegistrations
+from zope.app.component.registrations import registeredObject
+from zope.app.component.registrations import registerUtilities
+from zope.app.component.registrations import registrationKind
+from zope.app.component.registrations import sortKey
+from zope.app.component.snapshot import exportRegistrations
+from zope.app.component.snapshot import loadRegistrations
+from zope.app.component.stats import installedSampler
+from zope.app.component.stats import registrationStats
+from zope.app.component.vocabulary import \
+    CachedUtilityComponentInterfacesVocabulary
+
+
+# The classes of the registrations of each kind
+_REGISTRATION_CLASSES = {
+    'utility': UtilityRegistration,
+    'adapter': AdapterRegistration,
+    'subscriber': SubscriptionRegistration,
+    'handler': HandlerRegistration,
+}
 
 
 def _registrations(context, comp):
-    comp = removeSecurityProxy(comp)
     sm = component.getSiteManager(context)
-    for meth, attrname in ((sm.registeredUtilities, 'component'),
-                           (sm.registeredAdapters, 'factory'),
-                           (sm.registeredSubscriptionAdapters, 'factory'),
-                           (sm.registeredHandlers, 'factory')):
-        for registration in meth():
-            if getattr(registration, attrname) == comp or comp is None:
-                yield registration
+    if comp is None:
+        return iterRegistrations(sm)
+    comp = removeSecurityProxy(comp)
+    return iter(getRegistrationIndex(sm).registrationsFor(comp))
+
+
+def _utilityId(provided, name):
+    joined = f"{provided} {name}"
+    joined_bytes = joined.encode("utf8")
+    j_str = base64.b64encode(joined_bytes).decode('ascii')
+    escaped = j_str.replace('+', '_').replace('=', '').replace('\n', '')
+    return 'R' + escaped
+
+
+def _parseUtilityId(id):
+    """Return the provided interface name and name encoded in an id
+
+    None is returned if `id` wasn't made by `_utilityId`.
+    """
+    if not id.startswith('R'):
+        return None
+    encoded = id[1:].replace('_', '+')
+    encoded += '=' * (-len(encoded) % 4)
+    try:
+        joined = base64.b64decode(encoded, validate=True).decode('utf8')
+    except ValueError:
+        return None
+    provided, sep, name = joined.partition(' ')
+    if not sep:
+        return None
+    return provided, name
+
+
+def _path(ob):
+    ob = removeSecurityProxy(ob)
+    if not ILocation.providedBy(ob) or ob.__parent__ is None:
+        return None
+    try:
+        return getPath(ob)
+    except TypeError:  # pragma: no cover
+        return None  # not in a rooted tree
+
+
+def _registrationData(registration):
+    # What the JSON views tell about a registration
+    kind = registrationKind(registration)
+    provided = registration.provided
+    id = None
+    if kind == 'utility':
+        id = _utilityId(provided.__module__ + '.' + provided.__name__,
+                        registration.name)
+    info = registration.info
+    return {
+        "id": id,
+        "kind": kind,
+        "provided": getattr(provided, '__identifier__', None),
+        "name": registration.name,
+        "comment": info if isinstance(info, str) else str(info),
+        "path": _path(registeredObject(registration)),
+    }
+
+
+def _pathSortKey(registration):
+    # Registered objects without a path come last
+    path = _path(registeredObject(registration))
+    return (path is None, path or '', sortKey(registration))
+
+
+def _commentSortKey(registration):
+    info = registration.info
+    return (info if isinstance(info, str) else str(info),
+            sortKey(registration))
+
+
+def _objectName(ob):
+    if not hasattr(ob, '__qualname__'):
+        ob = type(ob)
+    return '{}.{}'.format(getattr(ob, '__module__', ''), ob.__qualname__)
+
+
+def _identityKey(registration):
+    # Tells apart the registrations the orderings sort alike: adapters,
+    # subscribers and handlers for different interfaces or factories
+    required = getattr(registration, 'required', ())
+    return (tuple(getattr(r, '__identifier__', None) or '' for r in required),
+            _objectName(registeredObject(registration)))
+
+
+def _tuples(value):
+    # Keys decoded from JSON, which made their tuples lists
+    if isinstance(value, list):
+        return tuple(_tuples(v) for v in value)
+    return value
+
+
+def _spooledResult(response, chunks, max_size=1 << 20):
+    """Return a result with the body made of `chunks` (bytes)
+
+    The body is read after the publication is done, when the database
+    connection of the request is closed, so it is written to a temporary
+    file first, kept in memory while it is smaller than `max_size`.
+    """
+    body = tempfile.SpooledTemporaryFile(max_size=max_size)
+    try:
+        for chunk in chunks:
+            body.write(chunk)
+    except BaseException:
+        body.close()
+        raise
+    response.setHeader('Content-Length', str(body.tell()))
+    body.seek(0)
+    return DirectResult(_read(body))
+
+
+def _read(body):
+    with body:
+        for chunk in iter(functools.partial(body.read, 1 << 16), b''):
+            yield chunk
+
+
+def _intParameter(request, name, default):
+    # A non-negative integer form variable
+    try:
+        value = int(request.form.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    return max(value, 0)
+
+
+class URLResolver:
+    """Compute the absolute URLs of many objects for one request
+
+    The URLs of containers are remembered, so the URL of an object in a
+    container seen before is the container URL with the object name
+    appended.  Objects with an ``absolute_url`` view other than the
+    default one get the URL computed by their view.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self._urls = {}  # id(container) -> (container, url)
+        self._default = {}  # spec -> whether the default view is used
+
+    def _absoluteURL(self, ob):
+        url = component.getMultiAdapter((ob, self.request),
+                                        name='absolute_url')
+        return url()
+
+    def _usesDefault(self, ob):
+        spec = interface.providedBy(ob)
+        default = self._default.get(spec)
+        if default is None:
+            # The view may be made by a wrapper of the class, like the
+            # views registered with a permission, so check what it makes
+            view = component.queryMultiAdapter((ob, self.request),
+                                               name='absolute_url')
+            default = self._default[spec] = (
+                type(removeSecurityProxy(view)) is AbsoluteURL)
+        return default
+
+    def _containerURL(self, container):
+        cached = self._urls.get(id(container))
+        if cached is None:
+            cached = (container, self.url(container))
+            self._urls[id(container)] = cached
+        return cached[1]
+
+    def url(self, ob):
+        """Return the URL of `ob`, like its ``absolute_url`` view"""
+        container = getattr(ob, '__parent__', None)
+        name = getattr(ob, '__name__', None)
+        if (container is None or name is None or not self._usesDefault(ob)
+                or sameProxiedObjects(ob, self.request.getVirtualHostRoot())):
+            return self._absoluteURL(ob)
+        url = self._containerURL(container)
+        if name:
+            url += '/' + quote(name.encode('utf-8'), _safe)
+        return url
+
+
+_REQUEST_KEY = __name__ + '.URLResolver'
+
+
+def requestURLResolver(request):
+    """Return the `URLResolver` shared by the displays of a request"""
+    urls = request.annotations.get(_REQUEST_KEY)
+    if urls is None:
+        urls = request.annotations[_REQUEST_KEY] = URLResolver(request)
+    return urls
 
 
 class IRegistrationDisplay(interface.Interface):
@@ -65,31 +289,113 @@ class RegistrationView(BrowserPage):
 
     render = zope.app.pagetemplate.ViewPageTemplateFile('registration.pt')
 
-    def registrations(self):
-        registrations = [
-            component.getMultiAdapter((r, self.request), IRegistrationDisplay)
-            for r in sorted(_registrations(self.context, self.context))
+    # The templates use the registrations several times per rendering, so
+    # they are computed once per request (view) and only recomputed when
+    # update() unregisters something.
+    _displays = None
+
+    display_interface = IRegistrationDisplay
+
+    # The orderings selected by the ``order`` form variable and the keys
+    # they sort the registrations by, computed once per registration.
+    orderings = {
+        'registration': sortKey,
+        'path': _pathSortKey,
+        'comment': _commentSortKey,
+    }
+
+    default_order = 'registration'
+
+    @property
+    def order(self):
+        order = self.request.form.get('order')
+        return order if order in self.orderings else self.default_order
+
+    def _getRegistrations(self):
+        key = self.orderings[self.order]
+        return [
+            component.getMultiAdapter((r, self.request),
+                                      self.display_interface)
+            for r in sorted(_registrations(self.context, self.context),
+                            key=key)
         ]
-        return registrations
+
+    def registrations(self):
+        if self._displays is None:
+            self._displays = self._getRegistrations()
+        return self._displays
+
+    def _listed(self, registration):
+        return registration.component is removeSecurityProxy(self.context)
+
+    def _getDisplay(self, id):
+        key = _parseUtilityId(id)
+        if key is None:
+            return None
+        sm = component.getSiteManager(self.context)
+        registration = getRegistrationIndex(sm).utilityRegistration(*key)
+        if registration is None or not self._listed(registration):
+            return None
+        return component.getMultiAdapter((registration, self.request),
+                                         self.display_interface)
 
     def update(self):
-        registrations = {r.id(): r for r in self.registrations()}
-        for id in self.request.form.get('ids', ()):
-            r = registrations.get(id)
-            if r is not None:
-                r.unregister()
+        # Utility registration ids are resolved directly.  Other ids can
+        # only be found among the listed registrations.
+        ids = self.request.form.get('ids', ())
+        if not ids:
+            return
+        displays = None
+        changed = False
+        with bulkChanges(component.getSiteManager(self.context)):
+            for id in ids:
+                if id.startswith('R'):
+                    r = self._getDisplay(id)
+                else:
+                    if displays is None:
+                        displays = {r.id(): r for r in self.registrations()}
+                    r = displays.get(id)
+                if r is not None:
+                    r.unregister()
+                    changed = True
+        if changed:
+            self._displays = None
 
     def __call__(self):
         self.update()
         return self.render()
 
 
+# What the registration displays render; the fields are used by the
+# templates as ``info/info``, ``info/comment`` and so on.
+RenderedRegistration = collections.namedtuple(
+    'RenderedRegistration', 'info comment')
+RenderedSiteRegistration = collections.namedtuple(
+    'RenderedSiteRegistration', 'cname url info comment')
+
+
+# Messages are immutable, so the displays share them
+@functools.lru_cache(maxsize=1024)
+def _commentMessage(comment):
+    return _("comment: ${comment}", mapping={"comment": comment})
+
+
+@functools.lru_cache(maxsize=1024)
+def _providedMessage(provided, name):
+    if name:
+        return _("${provided} utility named '${name}'",
+                 mapping={"provided": provided, "name": name})
+    return _("${provided} utility", mapping={"provided": provided})
+
+
 @component.adapter(zope.interface.interfaces.IUtilityRegistration,
                    zope.publisher.interfaces.browser.IBrowserRequest)
 @interface.implementer(IRegistrationDisplay)
 class UtilityRegistrationDisplay:
     """Utility Registration Details"""
 
+    __slots__ = ('context', 'request')
+
     def __init__(self, context, request):
         self.context = context
         self.request = request
@@ -99,38 +405,24 @@ class UtilityRegistrationDisplay:
         return provided.__module__ + '.' + provided.__name__
 
     def id(self):
-        joined = f"{self.provided()} {self.context.name}"
-        joined_bytes = joined.encode("utf8")
-        j64_bytes = base64.b64encode(joined_bytes)
-        if not isinstance(j64_bytes, str):
-            j_str = j64_bytes.decode('ascii')
-        else:
-            j_str = j64_bytes
-        escaped = j_str.replace('+', '_').replace('=', '').replace('\n', '')
-        return 'R' + escaped
+        return _utilityId(self.provided(), self.context.name)
 
     def _comment(self):
         comment = self.context.info or ''
         if comment:
-            comment = _("comment: ${comment}", mapping={"comment": comment})
+            try:
+                comment = _commentMessage(comment)
+            except TypeError:  # pragma: no cover
+                # unhashable
+                comment = _("comment: ${comment}",
+                            mapping={"comment": comment})
         return comment
 
     def _provided(self):
-        name = self.context.name
-        provided = self.provided()
-        if name:
-            info = _("${provided} utility named '${name}'",
-                     mapping={"provided": provided, "name": name})
-        else:
-            info = _("${provided} utility",
-                     mapping={"provided": provided})
-        return info
+        return _providedMessage(self.provided(), self.context.name)
 
     def render(self):
-        return {
-            "info": self._provided(),
-            "comment": self._comment()
-        }
+        return RenderedRegistration(self._provided(), self._comment())
 
     def unregister(self):
         self.context.registry.unregisterUtility(
@@ -141,27 +433,273 @@ class UtilityRegistrationDisplay:
 
 
 class SiteRegistrationView(RegistrationView):
+    """List the registrations of a site manager one batch at a time.
+
+    The form variables ``kind`` and ``provided`` restrict the listing to
+    one kind of registration or to one provided interface (given by its
+    dotted name).  ``order`` selects one of the `orderings`.  ``size``
+    is the size of the batch.  ``after`` and ``before``, the JSON encoded
+    sort key of the last or first registration of the neighbouring batch,
+    select the batch following or preceding it; the links to the next and
+    previous batches use them.  Without them, ``start`` selects the batch.
+    Only the registrations of the current batch are kept in memory and
+    adapted to `ISiteRegistrationDisplay`, but selecting a batch by its
+    ``start`` alone keeps the ones before it in memory too.
+    """
 
     render = zope.app.pagetemplate.ViewPageTemplateFile('siteregistration.pt')
 
-    def registrations(self):
-        registrations = [
+    batch_size = 50
+    max_batch_size = 1000
+
+    display_interface = ISiteRegistrationDisplay
+
+    @property
+    def kinds(self):
+        """The kinds of registrations that can be displayed"""
+        required = interface.providedBy(self.request)
+        adapters = component.getSiteManager().adapters
+        return tuple(
+            kind for kind in KIND_NAMES
+            if adapters.lookup((implementedBy(_REGISTRATION_CLASSES[kind]),
+                                required), self.display_interface))
+
+    # The number of registrations matching the filters and the position
+    # of the current batch among them, computed along with the batch.
+    total = 0
+    offset = 0
+
+    # The keys of the first and last registrations of the current batch
+    _firstKey = _lastKey = None
+
+    @property
+    def start(self):
+        return _intParameter(self.request, 'start', 0)
+
+    @property
+    def size(self):
+        size = _intParameter(self.request, 'size', self.batch_size)
+        size = size or self.batch_size
+        return min(size, self.max_batch_size)
+
+    @property
+    def kind(self):
+        kind = self.request.form.get('kind')
+        return kind if kind in self.kinds else None
+
+    @property
+    def provided(self):
+        return self.request.form.get('provided') or None
+
+    def _matching(self):
+        sm = component.getSiteManager(self.context)
+        kinds = self.kinds
+        if self.kind is not None or kinds == KIND_NAMES:
+            return iterRegistrations(sm, self.kind, self.provided)
+        return itertools.chain.from_iterable(
+            iterRegistrations(sm, kind, self.provided) for kind in kinds)
+
+    def _batchKey(self):
+        # The ordering made total, so that a key tells where a batch ends
+        order = self.orderings[self.order]
+        return lambda r: (order(r), _identityKey(r))
+
+    def _cursor(self, name):
+        value = self.request.form.get(name)
+        if not value:
+            return None
+        try:
+            return _tuples(json.loads(value))
+        except (TypeError, ValueError):
+            return None
+
+    def _scan(self, key, counts, test):
+        # The (key, registration) of the matching registrations whose key
+        # passes `test`.  counts[0] is the number of matching registrations
+        # seen, counts[1] the number of those that didn't pass.
+        for r in self._matching():
+            counts[0] += 1
+            k = key(r)
+            if test(k):
+                yield k, r
+            else:
+                counts[1] += 1
+
+    def _batch(self):
+        # The registrations of the current batch; sets `total` and `offset`
+        key = self._batchKey()
+        size = self.size
+        first = operator.itemgetter(0)
+        after = self._cursor('after')
+        before = self._cursor('before') if after is None else None
+        batch = None
+        if after is not None or before is not None:
+            counts = [0, 0]
+            try:
+                if after is not None:
+                    batch = heapq.nsmallest(
+                        size, self._scan(key, counts, lambda k: k > after),
+                        key=first)
+                    offset = counts[1]
+                else:
+                    batch = heapq.nlargest(
+                        size, self._scan(key, counts, lambda k: k < before),
+                        key=first)
+                    batch.reverse()
+                    offset = counts[0] - counts[1] - len(batch)
+            except TypeError:
+                # A key of another shape, like from an older version
+                batch = None
+        if batch is None:
+            counts = [0, 0]
+            offset = self.start
+            batch = heapq.nsmallest(
+                offset + size, self._scan(key, counts, lambda k: True),
+                key=first)[offset:]
+        self.total = counts[0]
+        self.offset = offset
+        if batch:
+            self._firstKey = batch[0][0]
+            self._lastKey = batch[-1][0]
+        return [r for k, r in batch]
+
+    def _getRegistrations(self):
+        return [
             component.getMultiAdapter((r, self.request),
-                                      ISiteRegistrationDisplay)
-            for r in sorted(_registrations(self.context, None))
+                                      self.display_interface)
+            for r in self._batch()
         ]
-        return registrations
+
+    def _listed(self, registration):
+        return True
+
+    def batchURL(self, start=None, after=None, before=None):
+        """Return the URL of the batch beginning at `start`
+
+        The batch follows the registration with the sort key `after` or
+        precedes the one with the sort key `before`, if given.  Without
+        arguments, this is the URL of the current batch.  The current
+        filters and batch size are kept.
+        """
+        if start is None:
+            start = self.start
+            after = self._cursor('after')
+            before = self._cursor('before')
+        form = [('start', start), ('size', self.size)]
+        if after is not None:
+            form.append(('after', json.dumps(after, separators=(',', ':'))))
+        elif before is not None:
+            form.append(('before', json.dumps(before, separators=(',', ':'))))
+        if self.kind:
+            form.append(('kind', self.kind))
+        if self.provided:
+            form.append(('provided', self.provided))
+        if self.order != self.default_order:
+            form.append(('order', self.order))
+        return '{}?{}'.format(self.request.URL, urlencode(form))
+
+    def previousURL(self):
+        self.registrations()
+        offset = self.offset
+        if not offset:
+            return None
+        if offset <= self.size or self._firstKey is None:
+            return self.batchURL(max(offset - self.size, 0))
+        return self.batchURL(offset - self.size, before=self._firstKey)
+
+    def nextURL(self):
+        count = len(self.registrations())
+        if self.offset + count < self.total:
+            return self.batchURL(self.offset + count, after=self._lastKey)
+
+    def batchInfo(self):
+        count = len(self.registrations())
+        return {
+            "first": self.offset + 1 if count else 0,
+            "last": self.offset + count if count else 0,
+            "total": self.total,
+        }
+
+
+class SiteRegistrationData(SiteRegistrationView):
+    """The registrations of a site manager as JSON
+
+    The form variables are the ones of `SiteRegistrationView`.  Returns a
+    JSON object with the ``registrations`` of the batch, its ``first`` and
+    ``last`` position, the ``total`` number of matching registrations and
+    the URLs of the ``previous`` and ``next`` batches.  Each registration
+    has its ``id`` (for utilities), ``kind``, ``provided`` interface,
+    ``name``, ``comment`` and the ``path`` of the registered component or
+    factory, if it has one.
+    """
+
+    kinds = KIND_NAMES
+
+    def _getRegistrations(self):
+        return self._batch()
+
+    def __call__(self):
+        data = self.batchInfo()
+        data["registrations"] = [
+            _registrationData(r) for r in self.registrations()]
+        data["previous"] = self.previousURL()
+        data["next"] = self.nextURL()
+        self.request.response.setHeader('Content-Type', 'application/json')
+        return json.dumps(data)
+
+
+class RegistrationData(SiteRegistrationData):
+    """The registrations of any object as JSON, like `SiteRegistrationData`
+    """
+
+    def _matching(self):
+        kind = self.kind
+        provided = self.provided
+        for r in _registrations(self.context, self.context):
+            if kind is not None and registrationKind(r) != kind:
+                continue
+            if provided is not None and getattr(
+                    r.provided, '__identifier__', None) != provided:
+                continue
+            yield r
+
+
+class SiteRegistrationStream(SiteRegistrationView):
+    """Stream the registrations of a site manager, one JSON object per line
+
+    The registrations are written as they are found, not sorted, and
+    described like by `SiteRegistrationData`.  They are written to a
+    temporary file while the request is published, so the memory used
+    doesn't grow with their number.  The ``kind`` and
+    ``provided`` form variables filter them; ``start`` skips some and
+    ``size``, if given, limits their number.
+    """
+
+    kinds = KIND_NAMES
+
+    def _lines(self, registrations):
+        for r in registrations:
+            yield (json.dumps(_registrationData(r)) + '\n').encode('utf-8')
+
+    def __call__(self):
+        stop = None
+        if 'size' in self.request.form:
+            stop = self.start + self.size
+        registrations = itertools.islice(self._matching(), self.start, stop)
+        response = self.request.response
+        response.setHeader('Content-Type', 'application/x-ndjson')
+        return _spooledResult(response, self._lines(registrations))
 
 
 @interface.implementer_only(ISiteRegistrationDisplay)
 class UtilitySiteRegistrationDisplay(UtilityRegistrationDisplay):
     """Utility Registration Details"""
 
+    __slots__ = ()
+
     def render(self):
-        url = component.getMultiAdapter(
-            (self.context.component, self.request), name='absolute_url')
         try:
-            url = url()
+            url = requestURLResolver(self.request).url(self.context.component)
         except TypeError:  # pragma: no cover
             url = ""
 
@@ -171,12 +709,37 @@ class UtilitySiteRegistrationDisplay(UtilityRegistrationDisplay):
         if url:
             url += "/@@SelectedManagementView.html"
 
-        return {
-            "cname": cname,
-            "url": url,
-            "info": self._provided(),
-            "comment": self._comment()
-        }
+        return RenderedSiteRegistration(
+            cname, url, self._provided(), self._comment())
+
+
+@component.adapter(None, zope.publisher.interfaces.browser.IBrowserRequest)
+class UtilityInterfacesSearch(BrowserPage):
+    """Search the interfaces a component can be registered for as a utility
+
+    Returns a JSON object with the ``terms`` (token and title) of the
+    interfaces whose dotted name contains the ``q`` form variable, at most
+    ``limit`` of them beginning at ``start``, and whether there are
+    ``more`` matching interfaces.
+    """
+
+    max_limit = 100
+
+    def __call__(self):
+        query = self.request.form.get('q', '').lower()
+        start = _intParameter(self.request, 'start', 0)
+        limit = _intParameter(self.request, 'limit', 20) or 20
+        limit = min(limit, self.max_limit)
+        vocabulary = CachedUtilityComponentInterfacesVocabulary(self.context)
+        matching = (term for term in vocabulary
+                    if query in term.token.lower())
+        terms = list(itertools.islice(matching, start, start + limit + 1))
+        self.request.response.setHeader('Content-Type', 'application/json')
+        return json.dumps({
+            "terms": [{"token": term.token, "title": term.token}
+                      for term in terms[:limit]],
+            "more": len(terms) > limit,
+        })
 
 
 @component.adapter(None, zope.publisher.interfaces.browser.IBrowserRequest)
@@ -198,7 +761,7 @@ class AddUtilityRegistration(form.Form):
             __name__='provided',
             title=_("Provided interface"),
             description=_("The interface provided by the utility"),
-            vocabulary="Utility Component Interfaces",
+            vocabulary="Cached Utility Component Interfaces",
             required=True,
         ),
         schema.TextLine(
@@ -252,3 +815,160 @@ class AddUtilityRegistration(form.Form):
             data['comment'] or '')
 
         self.request.response.redirect('@@registration.html')
+
+
+def _providedInterface(ob, provided):
+    # Find the interface with the dotted name `provided` among the
+    # interfaces provided by `ob`.
+    for iface in interface.providedBy(ob).flattened():
+        if iface.__identifier__ == provided:
+            return iface
+    return None
+
+
+class BulkUtilityRegistration(BrowserPage):
+    """View for registering many components of a folder as utilities
+
+    All the selected components are registered for the same provided
+    interface, given by its dotted name, in one operation.  They are
+    registered under their names in the folder unless ``noname`` is
+    checked.
+    """
+
+    render = zope.app.pagetemplate.ViewPageTemplateFile(
+        'registerutilities.pt')
+
+    status = None
+    skipped = ()
+
+    def items(self):
+        return sorted(self.context.keys())
+
+    def update(self):
+        form = self.request.form
+        if 'register' not in form:
+            return
+        provided = form.get('provided', '').strip()
+        use_names = not form.get('noname')
+        comment = form.get('comment', '')
+        utilities = []
+        skipped = []
+        for id in form.get('ids', ()):
+            ob = self.context.get(id)
+            iface = None
+            if ob is not None:
+                # We have to remove the security proxy to save the
+                # registration
+                ob = removeSecurityProxy(ob)
+                iface = _providedInterface(ob, provided)
+            if iface is None:
+                skipped.append(id)
+                continue
+            utilities.append((ob, iface, id if use_names else '', comment))
+
+        sm = component.getSiteManager(self.context)
+        count = registerUtilities(sm, utilities)
+        self.skipped = skipped
+        self.status = _("Registered ${count} utilities.",
+                        mapping={"count": count})
+
+    def __call__(self):
+        self.update()
+        return self.render()
+
+
+class RegistrationSnapshot(BrowserPage):
+    """Download a snapshot of the registrations of a local site manager"""
+
+    def __call__(self):
+        sm = removeSecurityProxy(self.context)
+        response = self.request.response
+        response.setHeader('Content-Type', 'application/x-ndjson')
+        response.setHeader('Content-Disposition',
+                           'attachment; filename="registrations.ndjson"')
+        return _spooledResult(
+            response,
+            (line.encode('utf-8') for line in exportRegistrations(sm)))
+
+
+class LoadRegistrationSnapshot(BrowserPage):
+    """View for loading a snapshot into a local site manager"""
+
+    render = zope.app.pagetemplate.ViewPageTemplateFile(
+        'loadregistrations.pt')
+
+    status = None
+
+    def update(self):
+        if 'load' not in self.request.form:
+            return
+        upload = self.request.form.get('snapshot')
+        if not getattr(upload, 'filename', None):
+            self.status = _("Please select a snapshot file.")
+            return
+        sm = removeSecurityProxy(self.context)
+        try:
+            count = loadRegistrations(sm, iter(upload.readline, b''))
+        except (ValueError, LookupError, ImportError) as e:
+            self.status = _("The snapshot could not be loaded: ${error}",
+                            mapping={"error": str(e)})
+            return
+        self.status = _("Loaded ${count} registrations.",
+                        mapping={"count": count})
+
+    def __call__(self):
+        self.update()
+        return self.render()
+
+
+class SiteManagerStatistics(BrowserPage):
+    """Show statistics about a site manager
+
+    The numbers of registrations per kind and provided interface are
+    shown, and the adaptations made in the site manager counted by the
+    installed `zope.app.component.stats.LookupSampler`, if any.  The sizes
+    of the lookup caches are only shown with the Python implementation of
+    `zope.interface`; its C optimizations don't expose them.
+    """
+
+    render = zope.app.pagetemplate.ViewPageTemplateFile('statistics.pt')
+
+    # The number of provided interfaces and lookups shown
+    max_rows = 100
+
+    _stats = None
+
+    def _registrationStats(self):
+        if self._stats is None:
+            self._stats = registrationStats(removeSecurityProxy(self.context))
+        return self._stats
+
+    def kinds(self):
+        return sorted(self._registrationStats()['kinds'].items())
+
+    def provided(self):
+        items = self._registrationStats()['provided'].items()
+        return list(itertools.islice(items, self.max_rows))
+
+    def caches(self):
+        caches = self._registrationStats()['caches']
+        return [(registry, sizes) for registry, sizes in sorted(caches.items())
+                if sizes is not None]
+
+    def sampling(self):
+        return installedSampler() is not None
+
+    def lookups(self):
+        sampler = installedSampler()
+        if sampler is None:
+            return []
+        sm = removeSecurityProxy(self.context)
+        lookups = sampler.stats(sm)[:self.max_rows]
+        for lookup in lookups:
+            for key in ('mean', 'slowest'):
+                if lookup[key] is not None:
+                    lookup[key] = '%.1f' % (lookup[key] * 1e6)
+        return lookups
+
+    def __call__(self):
+        return self.render()
@@ -0,0 +1,62 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Component adding tests
+"""
+import unittest
+
+from zope.component.factory import Factory
+from zope.component.interfaces import IFactory
+from zope.component.testing import PlacelessSetup
+
+from zope import component
+from zope.app.component import browser
+from zope.app.component.browser.tests import ISample
+from zope.app.component.browser.tests import ISampleBase
+from zope.app.component.browser.tests import Sample
+
+
+class CountingFactory(Factory):
+
+    calls = 0
+
+    def getInterfaces(self):
+        self.calls += 1
+        return super().getInterfaces()
+
+
+class TestFactoryExtends(PlacelessSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.factory = CountingFactory(Sample)
+        component.provideUtility(self.factory, IFactory, 'sample')
+
+    def test_decisions(self):
+        self.assertTrue(browser._factoryExtends('sample', ISampleBase))
+        self.assertTrue(browser._factoryExtends('sample', ISample))
+        self.assertFalse(browser._factoryExtends('sample', IFactory))
+
+    def test_cached(self):
+        for i in range(3):
+            self.assertTrue(browser._factoryExtends('sample', ISample))
+        self.assertEqual(self.factory.calls, 1)
+
+    def test_invalidated_by_registrations(self):
+        self.assertTrue(browser._factoryExtends('sample', ISample))
+        component.provideUtility(Factory(object), IFactory, 'sample')
+        self.assertFalse(browser._factoryExtends('sample', ISample))
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
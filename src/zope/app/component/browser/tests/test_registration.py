@@ -0,0 +1,448 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Registration view tests
+"""
+import heapq
+import json
+import unittest
+import urllib.parse
+from unittest import mock
+
+from zope.configuration import xmlconfig
+from zope.interface.interfaces import IUtilityRegistration
+from zope.location.interfaces import IRoot
+from zope.publisher.browser import TestRequest
+from zope.publisher.interfaces.browser import IBrowserRequest
+from zope.site.folder import Folder
+from zope.site.interfaces import IFolder
+from zope.site.site import SiteManagerAdapter
+from zope.traversing.browser.absoluteurl import AbsoluteURL
+from zope.traversing.browser.absoluteurl import SiteAbsoluteURL
+from zope.traversing.browser.interfaces import IAbsoluteURL
+
+from zope import component
+from zope import interface
+from zope.app.component import testing
+from zope.app.component.browser import registration
+from zope.app.component.browser.tests import ISample
+
+
+def _request(**form):
+    # A request of the host the expected URLs are on
+    request = TestRequest(form=form)
+    request._app_server = 'http://127.0.0.1'
+    return request
+
+
+class RegistrationSetup(testing.PlacefulSetup):
+    """A site with the registration displays and a folder to register"""
+
+    def setUp(self):
+        self.sm = super().setUp(site=True)
+        component.provideAdapter(SiteManagerAdapter)
+        component.provideAdapter(registration.UtilityRegistrationDisplay)
+        component.provideAdapter(
+            registration.UtilitySiteRegistrationDisplay,
+            (IUtilityRegistration, IBrowserRequest),
+            registration.ISiteRegistrationDisplay)
+        self.utility = self.rootFolder['utility'] = Folder()
+
+
+class TestRegistrationView(RegistrationSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.sm.registerUtility(self.utility, IFolder, 'one')
+        self.sm.registerUtility(self.utility, IFolder, 'two')
+
+    def _view(self, form=None):
+        return registration.RegistrationView(
+            self.utility, _request(**(form or {})))
+
+    def test_registrations(self):
+        view = self._view()
+        displays = view.registrations()
+        self.assertEqual([d.context.name for d in displays], ['one', 'two'])
+
+    def test_registrations_memoized(self):
+        view = self._view()
+        self.assertIs(view.registrations(), view.registrations())
+
+    def test_update_without_changes_keeps_registrations(self):
+        view = self._view({'ids': ['Rnothere']})
+        displays = view.registrations()
+        view.update()
+        self.assertIs(view.registrations(), displays)
+
+    def test_update_invalidates_registrations(self):
+        view = self._view()
+        one = view.registrations()[0]
+        view.request.form['ids'] = [one.id()]
+        view.update()
+        self.assertEqual([d.context.name for d in view.registrations()],
+                         ['two'])
+
+    def test_update_ignores_other_components(self):
+        other = self.rootFolder['other'] = Folder()
+        self.sm.registerUtility(other, IFolder, 'other')
+        view = self._view({'ids': [
+            registration._utilityId(IFolder.__identifier__, 'other')]})
+        view.update()
+        self.assertIs(self.sm.getUtility(IFolder, 'other'), other)
+
+    def test_render(self):
+        self.sm.registerUtility(self.utility, IFolder, 'three', 'a comment')
+        one, three, two = self._view().registrations()
+        self.assertEqual(three.render(), (
+            "${provided} utility named '${name}'", "comment: ${comment}"))
+        self.assertEqual(three.render().comment.mapping,
+                         {"comment": "a comment"})
+        self.assertEqual(one.render().comment, '')
+        self.assertIs(three.render().info, three.render().info)
+        self.assertFalse(hasattr(one, '__dict__'))
+
+    def test_ids(self):
+        for name in ('', 'one', 'with spaces', '\N{CYRILLIC SMALL LETTER PE}'):
+            id = registration._utilityId('zope.site.interfaces.IFolder', name)
+            self.assertEqual(registration._parseUtilityId(id),
+                             ('zope.site.interfaces.IFolder', name))
+        for id in ('', 'R', 'R!!', 'Rbm9zcGFjZQ', 'X' + id[1:]):
+            self.assertIsNone(registration._parseUtilityId(id))
+
+
+class TestSiteRegistrationView(RegistrationSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        for i in range(5):
+            self.sm.registerUtility(self.utility, IFolder, 'f%d' % i)
+        self.sm.registerUtility(self.utility, ISample)
+
+    def _view(self, **form):
+        return registration.SiteRegistrationView(self.sm, _request(**form))
+
+    def _names(self, view):
+        return [d.context.name for d in view.registrations()]
+
+    def test_all(self):
+        view = self._view()
+        self.assertEqual(len(view.registrations()), 6)
+        self.assertEqual(view.batchInfo(),
+                         {'first': 1, 'last': 6, 'total': 6})
+        self.assertIsNone(view.previousURL())
+        self.assertIsNone(view.nextURL())
+
+    def test_batches(self):
+        view = self._view(start='2', size='2', provided=IFolder.__identifier__)
+        self.assertEqual(self._names(view), ['f2', 'f3'])
+        self.assertEqual(view.total, 5)
+        self.assertIn('start=0', view.previousURL())
+        self.assertIn('start=4', view.nextURL())
+        self.assertIn('provided=zope.site.interfaces.IFolder',
+                      view.nextURL())
+
+    def test_update_outside_of_batch(self):
+        view = self._view(size='1', ids=[
+            registration._utilityId(IFolder.__identifier__, 'f4'),
+            registration._utilityId(IFolder.__identifier__, 'missing')])
+        self.assertEqual(self._names(view), [''])
+        view.update()
+        self.assertIsNone(self.sm.queryUtility(IFolder, 'f4'))
+        self.assertEqual(len(self._view().registrations()), 5)
+
+    def test_bad_parameters(self):
+        view = self._view(start='-3', size='x', kind='nothing')
+        self.assertEqual(view.start, 0)
+        self.assertEqual(view.size, view.batch_size)
+        self.assertIsNone(view.kind)
+
+    def test_render(self):
+        display = self._view().registrations()[0]
+        self.assertFalse(hasattr(display, '__dict__'))
+        info = display.render()
+        self.assertEqual(info.url, 'http://127.0.0.1/utility'
+                                   '/@@SelectedManagementView.html')
+        self.assertEqual(info.cname, 'utility')
+        self.assertEqual(info.info.mapping,
+                         {'provided': ISample.__identifier__})
+
+    def test_urls_shared_through_request(self):
+        view = self._view()
+        displays = view.registrations()
+        for display in displays:
+            display.render()
+        urls = registration.requestURLResolver(view.request)
+        self.assertIsInstance(urls, registration.URLResolver)
+        self.assertEqual(list(urls._urls.values()),
+                         [(self.rootFolder, 'http://127.0.0.1')])
+
+    def test_other_displays(self):
+        @component.adapter(IUtilityRegistration, IBrowserRequest)
+        @interface.implementer(registration.ISiteRegistrationDisplay)
+        class Display:
+            __slots__ = ('context', 'request')
+
+            def __init__(self, context, request):
+                self.context = context
+                self.request = request
+
+        component.provideAdapter(Display)
+        self.assertEqual(self._names(self._view()),
+                         ['', 'f0', 'f1', 'f2', 'f3', 'f4'])
+
+    def test_orderings(self):
+        self.assertEqual(self._names(self._view()),
+                         ['', 'f0', 'f1', 'f2', 'f3', 'f4'])
+        self.sm.registerUtility(self.utility, ISample,
+                                info='sample')
+        view = self._view(order='comment', size='2')
+        self.assertEqual(self._names(view), ['f0', 'f1'])
+        self.assertIn('order=comment', view.nextURL())
+        self.assertEqual(self._view(order='nothing').order, 'registration')
+
+    def test_filter_kind(self):
+        self.assertEqual(len(self._view(kind='utility').registrations()), 6)
+        self.assertEqual(self._view(start='10').batchInfo(),
+                         {'first': 0, 'last': 0, 'total': 6})
+
+    def test_kinds_without_display_not_listed(self):
+        self.sm.registerAdapter(Folder, (IFolder,), ISample)
+        self.assertEqual(self._view().kinds, ('utility',))
+        self.assertIsNone(self._view(kind='adapter').kind)
+        self.assertEqual(len(self._view(kind='adapter').registrations()), 6)
+        self.assertEqual(len(self._view().registrations()), 6)
+        data = json.loads(registration.SiteRegistrationData(
+            self.sm, _request(kind='adapter'))())
+        self.assertEqual([r['kind'] for r in data['registrations']],
+                         ['adapter'])
+
+
+class TestRegistrationData(RegistrationSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        for i in range(5):
+            self.sm.registerUtility(self.utility, IFolder, 'f%d' % i)
+        self.sm.registerUtility(self.utility, ISample, info='sample')
+        self.sm.registerHandler(_handler, (IFolder,))
+
+    def _data(self, view_class, context, **form):
+        request = _request(**form)
+        result = view_class(context, request)()
+        self.assertEqual(request.response.getHeader('Content-Type'),
+                         'application/json')
+        return json.loads(result)
+
+    def test_site(self):
+        data = self._data(registration.SiteRegistrationData, self.sm,
+                          kind='utility', start='1', size='2')
+        self.assertEqual((data['first'], data['last'], data['total']),
+                         (2, 3, 6))
+        self.assertIn('start=3', data['next'])
+        self.assertIn('kind=utility', data['next'])
+        self.assertEqual(data['registrations'][0], {
+            "id": registration._utilityId(IFolder.__identifier__, 'f0'),
+            "kind": "utility",
+            "provided": IFolder.__identifier__,
+            "name": "f0",
+            "comment": "",
+            "path": "/utility",
+        })
+
+    def _follow(self, url):
+        form = dict(urllib.parse.parse_qsl(url.split('?', 1)[1]))
+        return self._data(registration.SiteRegistrationData, self.sm, **form)
+
+    def test_cursor_batches(self):
+        # Handlers for different interfaces only differ by what they adapt
+        for iface in (ISample, interface.Interface, IRoot):
+            self.sm.registerHandler(_handler, (iface,))
+        expected = self._data(registration.SiteRegistrationData, self.sm,
+                              size='100')['registrations']
+        self.assertEqual(len(expected), 10)
+        data = self._data(registration.SiteRegistrationData, self.sm,
+                          size='3')
+        pages = [data]
+        with mock.patch.object(registration.heapq, 'nsmallest',
+                               wraps=heapq.nsmallest) as nsmallest:
+            while data['next']:
+                self.assertIn('after=', data['next'])
+                data = self._follow(data['next'])
+                pages.append(data)
+        # Only a batch is kept in memory to find the next one
+        self.assertEqual({c.args[0] for c in nsmallest.call_args_list}, {3})
+        self.assertEqual([(d['first'], d['last']) for d in pages],
+                         [(1, 3), (4, 6), (7, 9), (10, 10)])
+        self.assertEqual(
+            [r for d in pages for r in d['registrations']], expected)
+        backwards = [data]
+        while data['previous']:
+            data = self._follow(data['previous'])
+            backwards.append(data)
+        self.assertEqual(backwards[::-1], pages)
+
+    def test_bad_cursor(self):
+        for after in ('x', '[1, 2]', '"f1"', '{}'):
+            data = self._data(registration.SiteRegistrationData, self.sm,
+                              start='1', size='2', after=after)
+            self.assertEqual((data['first'], data['last']), (2, 3))
+
+    def test_handlers_have_no_id_or_path(self):
+        data = self._data(registration.SiteRegistrationData, self.sm,
+                          kind='handler')
+        self.assertEqual(data['registrations'], [{
+            "id": None, "kind": "handler", "provided": None,
+            "name": "", "comment": "", "path": None}])
+
+    def test_component(self):
+        data = self._data(registration.RegistrationData, self.utility,
+                          provided=ISample.__identifier__)
+        self.assertEqual([r['comment'] for r in data['registrations']],
+                         ['sample'])
+        self.assertEqual(
+            self._data(registration.RegistrationData, self.utility,
+                       kind='adapter')['registrations'], [])
+
+    def test_stream(self):
+        request = _request(kind='utility', start='4', size='10')
+        result = registration.SiteRegistrationStream(self.sm, request)()
+        lines = [json.loads(line) for line in b''.join(result).splitlines()]
+        self.assertEqual([r['kind'] for r in lines], ['utility', 'utility'])
+        request = _request()
+        result = registration.SiteRegistrationStream(self.sm, request)()
+        # The body is written before the view returns
+        self.sm.unregisterUtility(self.utility, ISample)
+        self.assertEqual(len(b''.join(result).splitlines()), 7)
+
+    def test_snapshot(self):
+        request = _request()
+        result = registration.RegistrationSnapshot(self.sm, request)()
+        # The body is written before the view returns
+        self.sm.unregisterUtility(self.utility, ISample)
+        body = b''.join(result)
+        self.assertEqual(len(body.splitlines()), 8)
+        self.assertEqual(request.response.getHeader('Content-Length'),
+                         str(len(body)))
+
+    def test_snapshot_error(self):
+        self.sm.registerHandler(lambda ob: None, (ISample,))
+        view = registration.RegistrationSnapshot(self.sm, _request())
+        self.assertRaises(ValueError, view)
+
+
+def _handler(ob):
+    pass  # pragma: no cover
+
+
+class TestURLResolver(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp(folders=True)
+        for factory, required in ((AbsoluteURL, (None, IBrowserRequest)),
+                                  (SiteAbsoluteURL, (IRoot, IBrowserRequest))):
+            for provided, name in ((IAbsoluteURL, ''),
+                                   (interface.Interface, 'absolute_url')):
+                component.provideAdapter(factory, required, provided, name)
+        self.request = TestRequest()
+
+    def _expected(self, ob):
+        return component.getMultiAdapter(
+            (ob, self.request), name='absolute_url')()
+
+    def test_same_urls(self):
+        urls = registration.URLResolver(self.request)
+        for ob in (self.rootFolder, self.folder1, self.folder1_1,
+                   self.folder1_1_1, self.folder2_1):
+            self.assertEqual(urls.url(ob), self._expected(ob))
+        self.assertEqual(urls.url(self.folder1_1_1),
+                         'http://127.0.0.1/folder1/folder1_1/folder1_1_1')
+
+    def test_default_view_detected(self):
+        urls = registration.URLResolver(self.request)
+        self.assertTrue(urls._usesDefault(self.folder1))
+        self.assertFalse(urls._usesDefault(self.rootFolder))
+
+    def test_containers_remembered(self):
+        urls = registration.URLResolver(self.request)
+        urls.url(self.folder1_1_1)
+        sibling = self.folder1_1['folder1_1_2']
+        self.folder1_1.__name__ = 'renamed'
+        self.assertEqual(urls.url(sibling),
+                         'http://127.0.0.1/folder1/folder1_1/folder1_1_2')
+        self.assertEqual(registration.URLResolver(self.request).url(sibling),
+                         'http://127.0.0.1/folder1/renamed/folder1_1_2')
+
+    def test_other_url_views_used(self):
+        @component.adapter(IFolder, IBrowserRequest)
+        class URL:
+            def __init__(self, context, request):
+                self.context = context
+
+            def __call__(self):
+                return 'url:' + self.context.__name__
+
+        component.provideAdapter(URL, provides=interface.Interface,
+                                 name='absolute_url')
+        urls = registration.URLResolver(self.request)
+        self.assertEqual(urls.url(self.folder1_1), 'url:folder1_1')
+
+
+class TestURLResolverProtectedViews(TestURLResolver):
+    # The URL views registered with a permission, as by zope.traversing
+
+    def setUp(self):
+        testing.PlacefulSetup.setUp(self, folders=True)
+        xmlconfig.string("""
+        <configure xmlns="http://namespaces.zope.org/zope">
+          <include package="zope.component" file="meta.zcml" />
+          <view for="*" name="absolute_url" permission="zope.Public"
+                factory="zope.traversing.browser.AbsoluteURL"
+                type="zope.publisher.interfaces.browser.IBrowserRequest"
+                provides="zope.interface.Interface" />
+          <view for="zope.location.interfaces.IRoot" name="absolute_url"
+                permission="zope.Public"
+                factory="zope.traversing.browser.SiteAbsoluteURL"
+                type="zope.publisher.interfaces.browser.IBrowserRequest"
+                provides="zope.interface.Interface" />
+        </configure>
+        """)
+        self.request = TestRequest()
+
+
+class TestUtilityInterfacesSearch(unittest.TestCase):
+
+    def _search(self, **form):
+        request = TestRequest(form=form)
+        view = registration.UtilityInterfacesSearch(Folder(), request)
+        result = json.loads(view())
+        self.assertEqual(request.response.getHeader('Content-Type'),
+                         'application/json')
+        return [term['token'] for term in result['terms']], result['more']
+
+    def test_search(self):
+        tokens, more = self._search(q='ifolder')
+        self.assertEqual(tokens, ['zope.site.interfaces.IFolder'])
+        self.assertFalse(more)
+
+    def test_batches(self):
+        all_tokens, more = self._search(limit='1000')
+        self.assertFalse(more)
+        self.assertEqual(all_tokens, sorted(all_tokens))
+        tokens, more = self._search(start='1', limit='2')
+        self.assertEqual(tokens, all_tokens[1:3])
+        self.assertTrue(more)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
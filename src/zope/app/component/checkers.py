@@ -0,0 +1,190 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Share the security checkers of classes with the same permissions.
+
+The ``class`` and ``browser:page`` directives define a checker with its own
+permission dictionaries for every class, and the view, resource, adapter
+and subscriber directives of `zope.component` create one for every
+protected factory, even though many of them end up with the same
+permissions.  Once the configuration has been executed, `internCheckers`
+makes these classes and factories share one checker::
+
+    xmlconfig.file('site.zcml', mypackage)
+    stats = internCheckers()
+
+The shared permission dictionaries can't be changed anymore; protecting
+more names of a class afterwards (``zope.security.protectclass``) raises
+`TypeError` unless the class got its own checker again with
+`uninternChecker`.
+"""
+import functools
+import itertools
+import sys
+import types
+
+from zope.component import getGlobalSiteManager
+from zope.security.checker import Checker
+from zope.security.checker import _checkers
+from zope.security.checker import defineChecker
+from zope.security.checker import undefineChecker
+
+
+class InternedPermissions(dict):
+    """A read-only permission mapping shared by several checkers"""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(
+            "The permissions of a shared checker can't be changed",
+            self)
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+def _size(checker):
+    size = sys.getsizeof(checker) + sys.getsizeof(checker.get_permissions)
+    if checker.set_permissions is not None:
+        size += sys.getsizeof(checker.set_permissions)
+    return size
+
+
+def _key(checker):
+    sets = checker.set_permissions
+    return (frozenset(checker.get_permissions.items()),
+            frozenset(sets.items()) if sets is not None else None)
+
+
+def _isLocal(obj, module, qualname):
+    return (getattr(obj, '__module__', None) == module
+            and getattr(obj, '__qualname__', None) == qualname)
+
+
+def _setDefault(func, index, value):
+    defaults = list(func.__defaults__)
+    defaults[index] = value
+    func.__defaults__ = tuple(defaults)
+
+
+def _factoryChecker(factory):
+    # The checker of a protected factory made by the zope.component
+    # directives (or stored by zope.app.component.configcache) and a
+    # function replacing it, or None
+    from zope.app.component import configcache
+    if type(factory).__module__ == 'zope.security.adapter':
+        # The adapter factories wrapping protected adapter factories
+        return _factoryChecker(factory.factory)
+    if isinstance(factory, types.FunctionType):
+        if _isLocal(factory, 'zope.component.security',
+                    'protectedFactory.<locals>.factory'):
+            cell = factory.__closure__[
+                factory.__code__.co_freevars.index('checker')]
+            return cell.cell_contents, functools.partial(
+                setattr, cell, 'cell_contents')
+        if _isLocal(factory, 'zope.component.zcml',
+                    'resource.<locals>.proxyResource'):
+            return factory.__defaults__[1], functools.partial(
+                _setDefault, factory, 1)
+    elif (_isLocal(type(factory), 'zope.component.zcml',
+                   'view.<locals>.ProxyView')
+          or type(factory) in (configcache._ProxyView,
+                               configcache._ProtectedFactory,
+                               configcache._ProxyResource)):
+        return factory.checker, functools.partial(
+            setattr, factory, 'checker')
+    return None
+
+
+def _factoryCheckers():
+    # The checkers of the protected factories registered globally
+    sm = getGlobalSiteManager()
+    registrations = itertools.chain(sm.registeredAdapters(),
+                                    sm.registeredSubscriptionAdapters())
+    seen = set()
+    for registration in registrations:
+        factory = registration.factory
+        if id(factory) in seen:
+            continue
+        seen.add(id(factory))
+        found = _factoryChecker(factory)
+        if found is not None:
+            yield found
+
+
+def internCheckers():
+    """Make the classes and factories with equal checkers share one of them
+
+    Only checkers of the class `zope.security.checker.Checker` are shared:
+    the ones defined for classes and the ones of the protected view,
+    resource, adapter and subscriber factories registered in the global
+    site manager.  The checkers of utilities registered with a permission
+    are kept in their security proxies and aren't shared.  Return a
+    dictionary with the number of ``classes`` and ``factories`` that share
+    a checker now, the number of ``checkers`` they share and the memory
+    freed (``saved``) in bytes, as estimated by `sys.getsizeof`.
+    """
+    groups = {}
+
+    def add(kind, checker, replace):
+        if type(checker) is not Checker:
+            return
+        try:
+            key = _key(checker)
+        except TypeError:  # pragma: no cover
+            return  # unhashable permission
+        groups.setdefault(key, []).append((kind, checker, replace))
+
+    for class_, checker in list(_checkers.items()):
+        add('classes', checker,
+            functools.partial(_checkers.__setitem__, class_))
+    for checker, replace in _factoryCheckers():
+        add('factories', checker, replace)
+
+    counts = {'classes': 0, 'factories': 0}
+    checkers = saved = 0
+    for key, members in groups.items():
+        if len(members) < 2:
+            continue
+        first = members[0][1]
+        if isinstance(first.get_permissions, InternedPermissions):
+            shared = first
+        else:
+            sets = first.set_permissions
+            shared = Checker(
+                InternedPermissions(first.get_permissions),
+                InternedPermissions(sets) if sets is not None else None)
+            saved -= _size(shared)
+            checkers += 1
+        freed = set()
+        for kind, checker, replace in members:
+            if checker is not shared:
+                replace(shared)
+                if id(checker) not in freed:
+                    freed.add(id(checker))
+                    saved += _size(checker)
+            counts[kind] += 1
+    return dict(counts, checkers=checkers, saved=saved)
+
+
+def uninternChecker(class_):
+    """Give a class a checker of its own again, if it shares one"""
+    checker = _checkers.get(class_)
+    if (type(checker) is Checker
+            and isinstance(checker.get_permissions, InternedPermissions)):
+        sets = checker.set_permissions
+        undefineChecker(class_)
+        defineChecker(class_, Checker(
+            dict(checker.get_permissions),
+            dict(sets) if sets is not None else None))
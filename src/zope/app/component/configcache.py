@@ -0,0 +1,449 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Cache the actions of a ZCML configuration
+
+`loadConfiguration` is like `zope.configuration.xmlconfig.file`, but it
+stores the actions computed from the configuration files in a cache file.
+As long as none of the included files (or the directories they are in)
+changed and the distributions they come from have the same versions, the
+next call executes the stored actions without parsing any file::
+
+    loadConfiguration('site.zcml', mypackage, cache='var/site.zcml.cache')
+
+Only the actions are cached, not the directives and features defined by
+the configuration, so the loads are terminal: the actions are executed
+right away and no configuration context is returned to load more files
+with.  Cache the whole configuration of an application, not the
+``meta.zcml`` files it includes; these don't have actions and aren't
+cached.
+
+The actions are stored with `pickle`.  The factories and classes the view,
+page, resource and menu directives of zope.component, zope.browserpage and
+zope.browsermenu create on the fly are stored as picklable equivalents;
+the page classes are created again, with their security checkers, when
+the actions are loaded.  Actions with other arguments that can't be
+pickled make a configuration uncachable.  It is then parsed every time, as
+without the cache; `cacheStatus` tells why.
+"""
+import importlib
+import importlib.metadata
+import io
+import os
+import pickle
+import sys
+import types
+
+from zope.configuration import config
+from zope.configuration import xmlconfig
+from zope.interface.interface import InterfaceClass
+
+
+# Increase when the format of the cache files changes
+CACHE_VERSION = 1
+
+
+class _ProtectedFactory:
+    # Picklable replacement of the zope.component.security.protectedFactory
+    # closures; calls the factory and protects the result the same way.
+
+    def __init__(self, factory, checker):
+        self.factory = factory
+        self.checker = checker
+
+    def __call__(self, *args):
+        from zope.security.proxy import Proxy
+        ob = self.factory(*args)
+        try:
+            ob.__Security_checker__ = self.checker
+        except AttributeError:
+            ob = Proxy(ob, self.checker)
+        return ob
+
+
+class _ProxyView:
+    # Picklable replacement of the ProxyView classes the view directive of
+    # zope.component creates
+
+    def __init__(self, factory, checker):
+        self.factory = factory
+        self.checker = checker
+
+    def __call__(self, *objects):
+        from zope.component.security import proxify
+        return proxify(self.factory(*objects), self.checker)
+
+
+class _ChainedViewFactory:
+    # Picklable replacement of the factory the view directive of
+    # zope.component makes of several factories
+
+    def __init__(self, factories):
+        self.factories = factories
+        self.factory = factories[0]
+
+    def __call__(self, ob, request):
+        for f in self.factories[:-1]:
+            ob = f(ob)
+        return self.factories[-1](ob, request)
+
+
+class _ProxyResource:
+    # Picklable replacement of the proxyResource functions the resource
+    # directive of zope.component creates
+
+    def __init__(self, factory, checker):
+        self.factory = factory
+        self.checker = checker
+
+    def __call__(self, request):
+        from zope.component.security import proxify
+        return proxify(self.factory(request), self.checker)
+
+
+def _viewClass(name, bases, attributes, checker):
+    # Create a page class again, as the page directives of zope.browserpage
+    # do, with its security checker
+    from zope.security.checker import defineChecker
+    cls = type(name, bases, attributes)
+    if checker is not None:
+        defineChecker(cls, checker)
+    return cls
+
+
+class _Method:
+    # Base of the picklable replacements of functions defined in the
+    # classes of views; binds like a function
+
+    def __get__(self, inst, cls=None):
+        if inst is None:
+            return self
+        return types.MethodType(self, inst)
+
+
+class _PublishTraverse(_Method):
+    # Picklable replacement of the publishTraverse methods of the classes
+    # the view directive of zope.browserpage creates
+
+    def __init__(self, pages, class_=None):
+        self.pages = pages
+        self.class_ = class_
+
+    def __call__(self, view, request, name):
+        from zope.component import queryMultiAdapter
+        from zope.publisher.interfaces import NotFound
+        if name in self.pages:
+            return getattr(view, self.pages[name])
+        ob = queryMultiAdapter((view, request), name=name)
+        if ob is not None:
+            return ob
+        if self.class_ is None:
+            raise NotFound(view, name, request)
+        return self.class_.publishTraverse.__get__(view)(request, name)
+
+
+class _BrowserDefault(_Method):
+    # Picklable replacement of the browserDefault methods of the classes
+    # the view directive of zope.browserpage creates
+
+    def __init__(self, default=None):
+        self.default = default
+
+    def __call__(self, view, request):
+        if self.default is None:
+            return view, ()
+        return view, (self.default,)
+
+
+def _expression(source):
+    # Compile a menu item filter again
+    from zope.browsermenu.metaconfigure import Engine
+    return Engine.compile(source)
+
+
+def _expressionSource(expr):
+    # The source of an expression compiled by the engine of the menu
+    # directives of zope.browsermenu, if it can be found
+    from zope.browsermenu.metaconfigure import Engine
+    kinds = [name for name, kind in Engine.types.items()
+             if kind is type(expr)]
+    if not kinds:
+        return None
+    # The path expression types are used for several names
+    name = getattr(expr, '_name', kinds[0])
+    text = getattr(expr, '_s', None)
+    if text is None:
+        # The Python expressions put their text in parentheses
+        text = getattr(expr, 'text', None)
+        if not (isinstance(text, str) and text.startswith('(')
+                and text.endswith(')')):
+            return None
+        text = text[1:-1]
+    if name not in kinds or not isinstance(text, str):
+        return None
+    return '%s:%s' % (name, text)
+
+
+def _menuItemType(id):
+    # The menu item type of a menu with an id, as the menu directive of
+    # zope.browsermenu creates it at the time it is parsed
+    from zope.browsermenu.metaconfigure import menus
+    from zope.interface.interface import InterfaceClass
+    interface = getattr(menus, id, None)
+    if interface is None:
+        interface = InterfaceClass(id, (),
+                                   __doc__='Menu Item Type: %s' % id,
+                                   __module__='zope.app.menus')
+        setattr(menus, id, interface)
+    return interface
+
+
+def _isPageClass(cls):
+    # Whether a class was created by a page directive of zope.browserpage
+    from zope.browserpage import metaconfigure
+    from zope.browserpage import simpleviewclass
+    bases = cls.__mro__[1:]
+    if (simpleviewclass.simple not in bases
+            and metaconfigure.simple not in bases):
+        return False
+    module = sys.modules.get(cls.__module__)
+    return getattr(module, cls.__qualname__, None) is not cls
+
+
+# The class attributes zope.interface computes again
+_DERIVED_ATTRIBUTES = frozenset((
+    '__dict__', '__weakref__', '__implemented__', '__provides__',
+    '__providedBy__'))
+
+
+# The types of the types module, such as MethodType, which can't be pickled
+# by name
+_TYPES = {kind: name for name, kind in vars(types).items()
+          if isinstance(kind, type) and not name.startswith('_')}
+
+
+def _closureVars(func):
+    return dict(zip(func.__code__.co_freevars,
+                    (cell.cell_contents for cell in func.__closure__)))
+
+
+def _isLocal(obj, module, qualname):
+    return (getattr(obj, '__module__', None) == module
+            and getattr(obj, '__qualname__', None) == qualname)
+
+
+class _ActionPickler(pickle.Pickler):
+
+    def reducer_override(self, obj):
+        from zope.security import checker
+        if isinstance(obj, types.ModuleType):
+            return importlib.import_module, (obj.__name__,)
+        if obj is checker.CheckerPublic:
+            return getattr, (checker, 'CheckerPublic')
+        if type(obj) is checker.Checker:
+            return checker.Checker, (obj.get_permissions,
+                                     obj.set_permissions)
+        if isinstance(obj, types.FunctionType):
+            if _isLocal(obj, 'zope.component.security',
+                        'protectedFactory.<locals>.factory'):
+                cells = _closureVars(obj)
+                return _ProtectedFactory, (cells['original_factory'],
+                                           cells['checker'])
+            if _isLocal(obj, 'zope.component.zcml', 'view.<locals>.factory'):
+                return _ChainedViewFactory, (
+                    _closureVars(obj)['factories'],)
+            if _isLocal(obj, 'zope.component.zcml',
+                        'resource.<locals>.proxyResource'):
+                return _ProxyResource, obj.__defaults__
+            if _isLocal(obj, 'zope.browserpage.metaconfigure',
+                        'view.__call__.<locals>.publishTraverse'):
+                class_ = None
+                if obj.__closure__:
+                    class_ = _closureVars(obj)['class_']
+                return _PublishTraverse, (obj.__defaults__[0], class_)
+            if _isLocal(obj, 'zope.browserpage.metaconfigure',
+                        'view.__call__.<locals>.<lambda>'):
+                return _BrowserDefault, obj.__defaults__ or ()
+        elif isinstance(obj, type):
+            if obj in _TYPES:
+                return getattr, (types, _TYPES[obj])
+            if _isPageClass(obj):
+                attributes = {name: value
+                              for name, value in vars(obj).items()
+                              if name not in _DERIVED_ATTRIBUTES}
+                return _viewClass, (
+                    obj.__name__, obj.__bases__, attributes,
+                    checker.getCheckerForInstancesOf(obj))
+        elif _isLocal(type(obj), 'zope.component.zcml',
+                      'view.<locals>.ProxyView'):
+            return _ProxyView, (obj.factory, obj.checker)
+        elif _isLocal(type(obj), 'zope.browserpage.viewpagetemplatefile',
+                      'ViewPageTemplateFile'):
+            # The templates of the page classes; these are read again
+            return type(obj), (obj.filename, None,
+                               vars(obj).get('content_type'))
+        elif (isinstance(obj, InterfaceClass)
+              and obj.__module__ == 'zope.app.menus'):
+            return _menuItemType, (obj.__name__,)
+        elif _isLocal(type(obj), 'zope.browserpage.namedtemplate',
+                      'NamedTemplateImplementation'):
+            # Named templates defined with the implementation decorator
+            # replace their function in its module
+            func = obj.descriptor
+            module = sys.modules.get(getattr(func, '__module__', None))
+            name = getattr(func, '__name__', None)
+            if name and getattr(module, name, None) is obj:
+                return getattr, (module, name)
+        else:
+            source = _expressionSource(obj)
+            if source is not None:
+                return _expression, (source,)
+        return NotImplemented
+
+
+def _dumps(actions):
+    f = io.BytesIO()
+    _ActionPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(actions)
+    return f.getvalue()
+
+
+def _packageOf(path):
+    # The dotted name of the package a file is in, found from sys.path
+    path = os.path.dirname(os.path.abspath(path))
+    best = None
+    for entry in sys.path:
+        entry = os.path.abspath(entry or os.curdir)
+        if path.startswith(entry + os.sep) and (
+                best is None or len(entry) > len(best)):
+            best = entry
+    if best is None:
+        return None
+    return os.path.relpath(path, best).replace(os.sep, '.')
+
+
+def _versions(paths):
+    # The versions of the distributions of the packages the files are in
+    versions = {}
+    for name in {_packageOf(path) for path in paths}:
+        while name:
+            try:
+                versions[name] = importlib.metadata.version(name)
+                break
+            except importlib.metadata.PackageNotFoundError:
+                name = name.rpartition('.')[0]
+    return sorted(versions.items())
+
+
+def _stamps(paths, cache):
+    # The directories are included for the files added to them, except the
+    # one the cache is written to.
+    directories = {os.path.dirname(p) for p in paths}
+    directories.discard(os.path.dirname(os.path.abspath(cache)))
+    stamps = []
+    for path in sorted(set(paths) | directories):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stamps.append((path, stat.st_mtime_ns, stat.st_size))
+    return stamps
+
+
+def _key(paths, features, cache):
+    return {
+        'python': tuple(sys.version_info[:2]),
+        'features': sorted(features),
+        'files': paths,
+        'stamps': _stamps(paths, cache),
+        'versions': _versions(paths),
+    }
+
+
+def _read(cache, features):
+    try:
+        with open(cache, 'rb') as f:
+            stored = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(stored, dict) or stored.get(
+            'cache_version') != CACHE_VERSION:
+        return None
+    key = stored['key']
+    if (key['python'] != tuple(sys.version_info[:2])
+            or key['features'] != sorted(features)):
+        return None
+    paths = key['files']
+    if (_stamps(paths, cache) != key['stamps']
+            or _versions(paths) != key['versions']):
+        return None
+    return stored
+
+
+def _write(cache, stored):
+    tmp = '{}.{}.tmp'.format(cache, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(pickle.dumps(stored, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp, cache)
+
+
+def cacheStatus(cache):
+    """Return why a configuration couldn't be cached, or None"""
+    try:
+        with open(cache, 'rb') as f:
+            stored = pickle.load(f)
+    except Exception:
+        return None
+    return stored.get('uncachable')
+
+
+def loadConfiguration(filename, package=None, cache=None, features=()):
+    """Load and execute a configuration, using the cached actions if current
+
+    Return whether the cached actions were executed; if not, the
+    configuration was parsed.  Without a `cache` file name, the
+    configuration is always parsed.
+    """
+    context = config.ConfigurationMachine()
+    for feature in features:
+        context.provideFeature(feature)
+
+    stored = _read(cache, features) if cache else None
+    actions = None
+    if stored is not None and stored['actions'] is not None:
+        try:
+            actions = pickle.loads(stored['actions'])
+        except Exception:
+            stored = None
+
+    if actions is not None:
+        context.actions.extend(actions)
+    else:
+        xmlconfig.registerCommonDirectives(context)
+        xmlconfig.file(filename, package, context=context, execute=False)
+        if cache and stored is None:
+            paths = sorted(context._seen_files)
+            stored = {'cache_version': CACHE_VERSION,
+                      'key': _key(paths, features, cache),
+                      'actions': None,
+                      'uncachable': None}
+            if not context.actions:
+                stored['uncachable'] = "The configuration has no actions"
+            else:
+                try:
+                    stored['actions'] = _dumps(context.actions)
+                except Exception as e:
+                    stored['uncachable'] = str(e)
+            _write(cache, stored)
+
+    context.execute_actions()
+    return actions is not None
@@ -15,5 +15,11 @@
 `zope.security.metaconfigure`.
 """
 
-# BBB
-from zope.security.metaconfigure import ClassDirective
+from zope.app.component._bbb import lazyImports
+
+
+__getattr__, __dir__, __all__ = lazyImports(__name__, {
+    'zope.security.metaconfigure': (
+        'ClassDirective',
+    ),
+})
@@ -0,0 +1,151 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Keep the current site in a context variable
+
+`zope.component.hooks` keeps the current site in thread-local state, which
+asyncio tasks running in the same thread share.  After
+`useContextSites()`, `zope.component.hooks.setSite` and `getSite` use a
+`contextvars.ContextVar` instead, so every task has its own current site::
+
+    from zope.app.component import contextsite
+    contextsite.useContextSites()
+
+    async def handle(site):
+        with contextsite.site(site):
+            ...
+
+Work submitted to thread pools doesn't run in the context of the caller.
+`submit` and `runInExecutor` pass it along.
+"""
+import contextlib
+import contextvars
+import functools
+
+from zope.component import getGlobalSiteManager
+from zope.component import hooks
+
+
+class _State:
+    # What is current in a context; replaced, never changed.
+
+    __slots__ = ('site', 'sm', 'adapter_hook')
+
+    def __init__(self, site, sm):
+        self.site = site
+        self.sm = sm
+        self.adapter_hook = sm.adapters.adapter_hook
+
+
+_state = contextvars.ContextVar('zope.app.component.contextsite._state')
+
+
+def _current():
+    try:
+        return _state.get()
+    except LookupError:
+        state = _State(None, getGlobalSiteManager())
+        _state.set(state)
+        return state
+
+
+class ContextSiteInfo:
+    """Replaces `zope.component.hooks.siteinfo` to use a context variable
+
+    It has the same attributes as `zope.component.hooks.SiteInfo`.
+    """
+
+    @property
+    def site(self):
+        return _current().site
+
+    @site.setter
+    def site(self, site):
+        _state.set(_State(site, _current().sm))
+
+    @property
+    def sm(self):
+        return _current().sm
+
+    @sm.setter
+    def sm(self, sm):
+        _state.set(_State(_current().site, sm))
+
+    @property
+    def adapter_hook(self):
+        return _current().adapter_hook
+
+    @adapter_hook.deleter
+    def adapter_hook(self):
+        # Always computed from the site manager
+        pass
+
+
+_thread_siteinfo = None
+
+
+def useContextSites():
+    """Keep the current site in a context variable
+
+    The current site of the calling thread stays current.
+    """
+    global _thread_siteinfo
+    if isinstance(hooks.siteinfo, ContextSiteInfo):
+        return
+    _thread_siteinfo = hooks.siteinfo
+    _state.set(_State(_thread_siteinfo.site, _thread_siteinfo.sm))
+    hooks.siteinfo = ContextSiteInfo()
+
+
+def useThreadSites():
+    """Keep the current site in thread-local state again"""
+    global _thread_siteinfo
+    if _thread_siteinfo is not None:
+        hooks.siteinfo = _thread_siteinfo
+        _thread_siteinfo = None
+
+
+@contextlib.contextmanager
+def site(site):
+    """Make `site` the current site in the ``with`` body
+
+    Unlike `zope.component.hooks.site`, the site that was current before
+    is restored even if the body changed it in another way.
+    """
+    if not isinstance(hooks.siteinfo, ContextSiteInfo):
+        with hooks.site(site):
+            yield
+        return
+    token = _state.set(_current())
+    try:
+        hooks.setSite(site)
+        yield
+    finally:
+        _state.reset(token)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """Submit ``fn(*args, **kwargs)`` to run in a copy of this context
+
+    The current site of the caller is current when `fn` runs.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
+
+
+def runInExecutor(loop, executor, fn, *args):
+    """Like ``loop.run_in_executor``, but run `fn` in a copy of this context
+    """
+    context = contextvars.copy_context()
+    return loop.run_in_executor(
+        executor, functools.partial(context.run, fn, *args))
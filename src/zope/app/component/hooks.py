@@ -17,13 +17,12 @@ The real public API is now zope.component.hooks
 """
 __docformat__ = 'restructuredtext'
 
-from zope.component.hooks import SiteInfo  # BBB
-from zope.component.hooks import adapter_hook
-from zope.component.hooks import clearSite
-from zope.component.hooks import getSite
-from zope.component.hooks import getSiteManager
-from zope.component.hooks import read_property
-from zope.component.hooks import resetHooks
-from zope.component.hooks import setHooks
-from zope.component.hooks import setSite
-from zope.component.hooks import siteinfo
+from zope.app.component._bbb import lazyImports
+
+
+__getattr__, __dir__, __all__ = lazyImports(__name__, {
+    'zope.component.hooks': (
+        'SiteInfo', 'adapter_hook', 'clearSite', 'getSite', 'getSiteManager',
+        'read_property', 'resetHooks', 'setHooks', 'setSite', 'siteinfo',
+    ),
+})
@@ -12,11 +12,16 @@
 #
 ##############################################################################
 
+from zope.app.component._bbb import lazyImports
+
+
 # BBB
-from zope.component.interfaces import IPossibleSite
-from zope.component.interfaces import ISite
-# BBB
-from zope.site.interfaces import ILocalSiteManager
-from zope.site.interfaces import INewLocalSite
-from zope.site.interfaces import ISiteManagementFolder
-from zope.site.interfaces import NewLocalSite
+__getattr__, __dir__, __all__ = lazyImports(__name__, {
+    'zope.component.interfaces': (
+        'IPossibleSite', 'ISite',
+    ),
+    'zope.site.interfaces': (
+        'ILocalSiteManager', 'INewLocalSite', 'ISiteManagementFolder',
+        'NewLocalSite',
+    ),
+})
@@ -0,0 +1,153 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""A bounded cache of the adapter lookups made through the site hook
+
+The cache is optional.  Install it after `zope.component.hooks.setHooks`::
+
+    from zope.app.component import lookupcache
+    cache = lookupcache.install(maxsize=10000)
+
+Interface adaptation (``IFoo(ob)``) then looks up the adapter factories of
+the current site in the cache first.  The entries are keyed by the adapter
+registry of the site manager and the lookup, and are ignored once the
+registry or one of its bases changed: every call of ``changed()`` on a
+registry increases its generation, and the generations of the registry
+and its bases are compared on every lookup.
+
+Adapter registries already cache their lookups, so a warm registry answers
+faster without this cache.  It pays off where these caches are lost, as
+when persistent local registries are deactivated by the database and their
+lookups are computed again in every request (see the ``adapter_hook``
+benchmarks of `zope.app.component.benchmark`), and its counters tell how
+often the lookups of a site are repeated.
+"""
+import collections
+import threading
+
+from zope.component import _api
+from zope.component import hooks
+from zope.interface import providedBy
+from zope.interface.interfaces import ComponentLookupError
+
+
+class LookupCache:
+    """A least recently used cache of adapter factory lookups
+
+    `hits` and `misses` count the lookups answered with and without the
+    cache.
+    """
+
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, registry, required, provided, name=''):
+        """Look up an adapter factory for a single object
+
+        This is the cached equivalent of
+        ``registry.lookup((required,), provided, name)``.
+        """
+        stamp = tuple([r._generation for r in registry.ro])
+        key = (id(registry), required, provided, name)
+        entry = self._entries.get(key)
+        if (entry is not None and entry[0] is registry
+                and entry[1] == stamp):
+            self.hits += 1
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:  # pragma: no cover
+                pass  # removed by another thread
+            return entry[2]
+
+        self.misses += 1
+        factory = registry.lookup((required,), provided, name)
+        with self._lock:
+            self._entries[key] = (registry, stamp, factory)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return factory
+
+    def adapter_hook(self, interface, object, name='', default=None):
+        """Adapt `object` to `interface` using the current site manager"""
+        try:
+            registry = hooks.getSiteManager().adapters
+        except ComponentLookupError:  # pragma: no cover
+            return default
+        factory = self.lookup(registry, providedBy(object), interface, name)
+        if factory is not None:
+            if isinstance(object, super):
+                # Like the adapter hook of the registry
+                object = object.__self__
+            result = factory(object)
+            if result is not None:
+                return result
+        return default
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self):
+        """Return the counters and the size of the cache"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+
+# The installed cache and the hook it replaced
+_installed = None
+
+
+def install(maxsize=1000):
+    """Look up adapters through a new `LookupCache` and return it"""
+    global _installed
+    uninstall()
+    cache = LookupCache(maxsize)
+    _installed = (cache, _api.adapter_hook.implementation)
+    _api.adapter_hook.sethook(cache.adapter_hook)
+    return cache
+
+
+def uninstall():
+    """Look up adapters through the hook the cache replaced again
+
+    A hook installed on top of the cache that calls it through its
+    ``hook`` attribute, such as a `zope.app.component.stats.LookupSampler`,
+    is kept and calls the replaced hook instead.
+    """
+    global _installed
+    if _installed is None:
+        return
+    cache, previous = _installed
+    _installed = None
+    outer = None
+    hook = _api.adapter_hook.implementation
+    while hook != cache.adapter_hook:
+        outer = getattr(hook, '__self__', None)
+        hook = getattr(outer, 'hook', None)
+        if hook is None:
+            # The cache was replaced by an unrelated hook
+            return
+    if outer is None:
+        _api.adapter_hook.sethook(previous)
+    else:
+        outer.hook = previous
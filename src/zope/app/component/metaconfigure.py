@@ -11,9 +11,15 @@
 # FOR A PARTICULAR PURPOSE.
 #
 ##############################################################################
+from zope.app.component._bbb import lazyImports
+
+
 # BBB
-from zope.component.security import PublicPermission
-from zope.component.security import _checker
-from zope.component.zcml import resource
-from zope.component.zcml import subscriber
-from zope.component.zcml import view
+__getattr__, __dir__, __all__ = lazyImports(__name__, {
+    'zope.component.security': (
+        'PublicPermission', '_checker',
+    ),
+    'zope.component.zcml': (
+        'resource', 'subscriber', 'view',
+    ),
+})
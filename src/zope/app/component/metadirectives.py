@@ -12,14 +12,17 @@
 #
 ##############################################################################
 
+from zope.app.component._bbb import lazyImports
+
+
 # BBB
-from zope.component.zcml import IBasicResourceInformation
-from zope.component.zcml import IBasicViewInformation
-from zope.component.zcml import IResourceDirective
-from zope.component.zcml import IViewDirective
-# BBB
-from zope.security.metadirectives import IAllowSubdirective
-from zope.security.metadirectives import IClassDirective
-from zope.security.metadirectives import IFactorySubdirective
-from zope.security.metadirectives import IImplementsSubdirective
-from zope.security.metadirectives import IRequireSubdirective
+__getattr__, __dir__, __all__ = lazyImports(__name__, {
+    'zope.component.zcml': (
+        'IBasicResourceInformation', 'IBasicViewInformation',
+        'IResourceDirective', 'IViewDirective',
+    ),
+    'zope.security.metadirectives': (
+        'IAllowSubdirective', 'IClassDirective', 'IFactorySubdirective',
+        'IImplementsSubdirective', 'IRequireSubdirective',
+    ),
+})
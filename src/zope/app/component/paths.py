@@ -0,0 +1,124 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Resolve the absolute paths of components, such as the values of
+`zope.app.component.interfaces.registration.Component` fields.
+
+A `PathResolver` remembers the objects found at every path it traversed,
+including the paths leading to them, so resolving many paths traverses
+each container on the way only once::
+
+    resolver = requestPathResolver(request, root)
+    objects = resolver.resolveMany(paths)
+
+The objects are remembered as long as the resolver is used: during one
+request (`requestPathResolver`) or one transaction
+(`transactionPathResolver`).  Use `clear` after moving or removing objects
+that may have been resolved.
+"""
+import transaction
+from zope.location.interfaces import LocationError
+from zope.traversing.api import traverse
+from zope.traversing.api import traversePathElement
+
+
+_marker = object()
+
+
+def _names(path):
+    # The names of an absolute path, None if it is relative or has '.' or
+    # '..' elements
+    if not path.startswith('/'):
+        return None
+    names = tuple(name for name in path.split('/') if name)
+    if '.' in names or '..' in names:
+        return None
+    return names
+
+
+class PathResolver:
+    """Resolve absolute paths from a root folder, remembering the objects
+
+    The paths are traversed like by `zope.traversing.api.traverse`, with
+    the `request` given, if any, for the traversal namespaces.
+    """
+
+    def __init__(self, root, request=None):
+        self.root = root
+        self.request = request
+        self.clear()
+
+    def clear(self):
+        """Forget the objects found"""
+        self._objects = {(): self.root}
+
+    def resolve(self, path, default=_marker):
+        """Return the object at the absolute `path`
+
+        `LocationError` is raised if there is none, unless a `default` is
+        given.
+        """
+        names = _names(path)
+        if names is None:
+            # Not remembered; resolved relative to the root
+            return traverse(self.root, path, default=default,
+                            request=self.request)
+        objects = self._objects
+        ob = objects.get(names)
+        if ob is not None:
+            return ob
+        # Start from the longest path traversed before
+        found = len(names) - 1
+        while names[:found] not in objects:
+            found -= 1
+        ob = objects[names[:found]]
+        try:
+            for i in range(found, len(names)):
+                ob = traversePathElement(ob, names[i], [],
+                                         request=self.request)
+                objects[names[:i + 1]] = ob
+        except LocationError:
+            if default is _marker:
+                raise
+            return default
+        return ob
+
+    def resolveMany(self, paths, default=_marker):
+        """Return the objects at many absolute paths, in the same order
+
+        The containers on the paths are traversed only once.
+        """
+        return [self.resolve(path, default) for path in paths]
+
+
+_REQUEST_KEY = __name__ + '.PathResolver'
+
+
+def requestPathResolver(request, root):
+    """Return the resolver of the paths from `root` for a request"""
+    resolver = request.annotations.get(_REQUEST_KEY)
+    if resolver is None or resolver.root is not root:
+        resolver = request.annotations[_REQUEST_KEY] = PathResolver(
+            root, request)
+    return resolver
+
+
+def transactionPathResolver(root):
+    """Return the resolver of the paths from `root` for this transaction"""
+    txn = transaction.get()
+    try:
+        return txn.data(root)
+    except KeyError:
+        resolver = PathResolver(root)
+        txn.set_data(root, resolver)
+        return resolver
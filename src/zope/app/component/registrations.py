@@ -0,0 +1,366 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Helpers for working with the registrations of a component registry.
+"""
+import contextlib
+import weakref
+
+import zope.event
+from zope.interface.interfaces import IAdapterRegistration
+from zope.interface.interfaces import IHandlerRegistration
+from zope.interface.interfaces import IRegistered
+from zope.interface.interfaces import IRegistrationEvent
+from zope.interface.interfaces import ISubscriptionAdapterRegistration
+from zope.interface.interfaces import IUtilityRegistration
+from zope.interface.interfaces import Registered
+from zope.interface.registry import UtilityRegistration
+from zope.security.proxy import removeSecurityProxy
+
+from zope import component
+
+
+# (kind, registry method listing the registrations, registered attribute)
+KINDS = (
+    ('utility', 'registeredUtilities', 'component'),
+    ('adapter', 'registeredAdapters', 'factory'),
+    ('subscriber', 'registeredSubscriptionAdapters', 'factory'),
+    ('handler', 'registeredHandlers', 'factory'),
+)
+
+KIND_NAMES = tuple(kind for kind, meth, attrname in KINDS)
+
+_KIND_INTERFACES = (
+    ('utility', IUtilityRegistration),
+    ('adapter', IAdapterRegistration),
+    ('subscriber', ISubscriptionAdapterRegistration),
+    ('handler', IHandlerRegistration),
+)
+
+
+_KIND_ORDER = {kind: position for position, kind in enumerate(KIND_NAMES)}
+
+
+def registrationKind(registration):
+    """Return the kind of a registration, one of the names in `KINDS`."""
+    for kind, iface in _KIND_INTERFACES:
+        if iface.providedBy(registration):
+            return kind
+    raise TypeError("Not a registration", registration)
+
+
+def sortKey(registration):
+    """Return the key to sort registrations by
+
+    Registrations are ordered by kind (in the order of `KINDS`), the dotted
+    name of the provided interface and their name.  Sorting by this key,
+    computed once per registration, is much cheaper than comparing the
+    registrations themselves, which compare their representations.
+    """
+    return (_KIND_ORDER[registrationKind(registration)],
+            getattr(registration.provided, '__identifier__', None) or '',
+            registration.name)
+
+
+def registeredObject(registration):
+    """Return the utility component or factory of a registration."""
+    if IUtilityRegistration.providedBy(registration):
+        return registration.component
+    return registration.factory
+
+
+def iterRegistrations(registry, kind=None, provided=None):
+    """Iterate over the registrations made directly in `registry`.
+
+    If `kind` is given, only registrations of that kind are included.  If
+    `provided` is given, only registrations providing the interface with
+    that dotted name are included.
+    """
+    if kind is not None and kind not in KIND_NAMES:
+        raise ValueError("Unknown registration kind", kind)
+    for name, meth, attrname in KINDS:
+        if kind is not None and name != kind:
+            continue
+        for registration in getattr(registry, meth)():
+            if provided is not None and getattr(
+                    registration.provided, '__identifier__', None) != provided:
+                continue
+            yield registration
+
+
+def _size(registry):
+    return (len(registry._utility_registrations)
+            + len(registry._adapter_registrations)
+            + len(registry._subscription_registrations)
+            + len(registry._handler_registrations))
+
+
+def _stamp(registry):
+    # Every registration change bumps the generation of one of the
+    # underlying adapter registries.  For persistent registries the
+    # generation is stored with the registry, so changes committed by other
+    # connections are noticed as well.
+    return (registry.utilities._generation,
+            registry.adapters._generation,
+            _size(registry))
+
+
+def _utilityKey(registration):
+    provided = registration.provided
+    return provided.__module__ + '.' + provided.__name__, registration.name
+
+
+def _matches(kind, registration, other):
+    if kind == 'utility':
+        return (registration.provided == other.provided
+                and registration.name == other.name)
+    if kind == 'adapter':
+        return (registration.required == other.required
+                and registration.provided == other.provided
+                and registration.name == other.name)
+    if kind == 'subscriber':
+        return (registration.required == other.required
+                and registration.provided == other.provided)
+    return registration.required == other.required
+
+
+class RegistrationIndex:
+    """Reverse index from registered objects to their registrations.
+
+    Utility components and adapter, subscriber and handler factories are
+    indexed by identity, so finding the registrations of an object doesn't
+    depend on the total number of registrations in the registry.
+
+    Use `getRegistrationIndex` to get an up-to-date index for a registry.
+    """
+
+    def __init__(self, registry):
+        self.rebuild(registry)
+
+    def rebuild(self, registry):
+        self._byobject = {}
+        self._adapters = {}
+        self._utilities = {}
+        self._size = 0
+        for registration in iterRegistrations(registry):
+            self._add(registration)
+        self.stamp = _stamp(registry)
+
+    def current(self, registry):
+        return self.stamp == _stamp(registry)
+
+    def registrationsFor(self, obj):
+        """Return a list of the registrations of `obj`."""
+        return list(self._byobject.get(id(obj), ()))
+
+    def utilityRegistration(self, provided, name):
+        """Return the utility registration for a provided interface and name
+
+        `provided` is the dotted name of the interface.  None is returned
+        if there is no such registration.
+        """
+        return self._utilities.get((provided, name))
+
+    def update(self, registry, event):
+        """Apply a registration event to the index."""
+        if self.stamp is None:
+            return
+        registration = event.object
+        kind = registrationKind(registration)
+        if IRegistered.providedBy(event):
+            if kind == 'adapter':
+                key = (registration.required, registration.provided,
+                       registration.name)
+                # Re-registering an adapter replaces the old registration
+                # without an unregistration event.
+                old = self._adapters.get(key)
+                if old is not None:
+                    self._remove(kind, old)
+            self._add(registration)
+        elif registeredObject(registration) is None:
+            # All the subscribers or handlers for a specification were
+            # removed at once; we don't know which ones.
+            self.stamp = None
+            return
+        else:
+            self._remove(kind, registration)
+
+        if self._size == _size(registry):
+            self.stamp = _stamp(registry)
+        else:
+            # Registrations were made without events.
+            self.stamp = None
+
+    def _add(self, registration):
+        self._byobject.setdefault(
+            id(registeredObject(registration)), []).append(registration)
+        if IUtilityRegistration.providedBy(registration):
+            self._utilities[_utilityKey(registration)] = registration
+        elif IAdapterRegistration.providedBy(registration):
+            self._adapters[(registration.required, registration.provided,
+                            registration.name)] = registration
+        self._size += 1
+
+    def _remove(self, kind, registration):
+        key = id(registeredObject(registration))
+        registrations = self._byobject.get(key, ())
+        remaining = [r for r in registrations
+                     if not _matches(kind, r, registration)]
+        self._size -= len(registrations) - len(remaining)
+        if remaining:
+            self._byobject[key] = remaining
+        else:
+            self._byobject.pop(key, None)
+        if kind == 'utility':
+            self._utilities.pop(_utilityKey(registration), None)
+        elif kind == 'adapter':
+            self._adapters.pop((registration.required, registration.provided,
+                                registration.name), None)
+
+
+_indexes = weakref.WeakKeyDictionary()
+
+
+def getRegistrationIndex(registry):
+    """Return an up-to-date `RegistrationIndex` for `registry`.
+
+    The index is built on first use and kept in sync by
+    `registrationChanged`.  It is rebuilt if the registry was changed in a
+    way the index couldn't follow.
+    """
+    registry = removeSecurityProxy(registry)
+    index = _indexes.get(registry)
+    if index is None:
+        index = _indexes[registry] = RegistrationIndex(registry)
+    elif not index.current(registry):
+        index.rebuild(registry)
+    return index
+
+
+@component.adapter(IRegistrationEvent)
+def registrationChanged(event):
+    """Keep the registration index of the changed registry in sync."""
+    registry = event.object.registry
+    index = _indexes.get(registry)
+    if index is not None:
+        index.update(registry, event)
+
+
+class _DeferredLookup:
+    # Stands in for the lookup object (``_v_lookup``) of an adapter
+    # registry inside a bulkChanges block: notes the changes instead of
+    # clearing the lookup caches.
+
+    def __init__(self, lookup):
+        self._lookup = lookup
+        self._changed = False
+
+    def changed(self, originally_changed):
+        self._changed = True
+
+    def __getattr__(self, name):
+        return getattr(self._lookup, name)
+
+
+@contextlib.contextmanager
+def bulkChanges(registry):
+    """Invalidate the lookup caches of `registry` only once for many changes
+
+    Normally every registration change invalidates the lookup caches of the
+    adapter and utility registries of `registry` and of the registries
+    based on them.  Inside this block the invalidation is deferred until
+    the block is left, and skipped if nothing changed.  Lookups made with
+    `registry` inside the block may give outdated results.
+
+    Only the volatile (``_v_``) attributes of the registries are replaced,
+    so persistent registries aren't modified by the block itself.
+    """
+    registry = removeSecurityProxy(registry)
+    deferred = []
+    for r in (registry.utilities, registry.adapters):
+        lookup = r._v_lookup
+        if isinstance(lookup, _DeferredLookup):
+            # Already inside a bulkChanges block for this registry.
+            continue
+        subregistries = getattr(r, '_v_subregistries', None)
+        r._v_lookup = _DeferredLookup(lookup)
+        if subregistries is not None:
+            r._v_subregistries = weakref.WeakKeyDictionary()
+        deferred.append((r, lookup, subregistries))
+    try:
+        yield registry
+    finally:
+        for r, lookup, subregistries in deferred:
+            changed = r._v_lookup._changed
+            r._v_lookup = lookup
+            if subregistries is not None:
+                # Keep the registries based on r inside the block
+                subregistries.update(r._v_subregistries)
+                r._v_subregistries = subregistries
+            if changed:
+                lookup.changed(r)
+                for sub in list(subregistries or ()):
+                    sub.changed(r)
+
+
+def registerUtilities(registry, utilities, event=True):
+    """Register many utilities in one operation
+
+    `utilities` is an iterable of ``(component, provided, name, info)``
+    tuples; unlike for `registerUtility` the provided interface is
+    required.  The lookup caches are invalidated once (see `bulkChanges`)
+    and, if `event` is true, the `Registered` events are sent after all the
+    utilities have been registered.
+
+    Returns the number of new registrations.
+    """
+    registry = removeSecurityProxy(registry)
+    registered = []
+    with bulkChanges(registry):
+        for component_, provided, name, info in utilities:
+            if provided is None:
+                raise TypeError("The provided interface is required",
+                                component_)
+            if name == '':
+                # Same rule as registerUtility
+                name = getattr(component_, '__component_name__', '')
+            old = registry._utility_registrations.get((provided, name))
+            if old is not None and old[:2] == (component_, info):
+                continue
+            registry.registerUtility(component_, provided, name, info,
+                                     event=False)
+            registered.append(UtilityRegistration(
+                registry, provided, name, component_, info))
+    if event:
+        for registration in registered:
+            zope.event.notify(Registered(registration))
+    return len(registered)
+
+
+def unregisterUtilities(registry, utilities):
+    """Unregister many utilities in one operation
+
+    `utilities` is an iterable of ``(component, provided, name)`` tuples
+    as accepted by `unregisterUtility`.  The lookup caches are invalidated
+    once (see `bulkChanges`).  The `Unregistered` events are sent by the
+    registry as each utility is unregistered.
+
+    Returns the number of removed registrations.
+    """
+    registry = removeSecurityProxy(registry)
+    count = 0
+    with bulkChanges(registry):
+        for component_, provided, name in utilities:
+            if registry.unregisterUtility(component_, provided, name):
+                count += 1
+    return count
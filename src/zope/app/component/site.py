@@ -15,17 +15,17 @@
 
 The real public API is now zope.site
 """
-# on the side of caution for backwards compatibility we
-# import everything defined
-from zope.component.hooks import setSite
-from zope.site.site import LocalSiteManager
-from zope.site.site import SiteManagementFolder
-from zope.site.site import SiteManagerAdapter
-from zope.site.site import SiteManagerContainer
-from zope.site.site import SMFolderFactory
-from zope.site.site import _findNextSiteManager
-from zope.site.site import _LocalAdapterRegistry
-from zope.site.site import changeSiteConfigurationAfterMove  # BBB
-from zope.site.site import clearSite
-from zope.site.site import clearThreadSiteSubscriber
-from zope.site.site import threadSiteSubscriber
+from zope.app.component._bbb import lazyImports
+
+
+__getattr__, __dir__, __all__ = lazyImports(__name__, {
+    'zope.component.hooks': (
+        'setSite',
+    ),
+    'zope.site.site': (
+        'LocalSiteManager', 'SiteManagementFolder', 'SiteManagerAdapter',
+        'SiteManagerContainer', 'SMFolderFactory', '_findNextSiteManager',
+        '_LocalAdapterRegistry', 'changeSiteConfigurationAfterMove',
+        'clearSite', 'clearThreadSiteSubscriber', 'threadSiteSubscriber',
+    ),
+})
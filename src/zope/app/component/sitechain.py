@@ -0,0 +1,101 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""The site managers of the sites above locations.
+
+`zope.site` bases the site manager of a new site on the one of the nearest
+site above it, found by walking up the ``__parent__`` chain for every new
+site.  A `SiteManagerChains` remembers the site managers found above each
+container it passed, so the folders of a subtree that are made sites
+parents first are resolved top-down once::
+
+    chains = SiteManagerChains()
+    for folder in folders:
+        base = chains.nextSiteManager(folder)
+        ...  # make folder a site with a site manager based on base
+        chains.siteMade(folder)
+
+The chains are meant to be used for one batch of changes.  They follow
+the sites made (`siteMade`) and moved (`siteMoved`) that they are told
+about.
+"""
+from zope.component.interfaces import ISite
+from zope.location.interfaces import IRoot
+
+from zope import component
+
+
+class SiteManagerChains:
+    """The local site managers above locations, remembered per container
+    """
+
+    def __init__(self):
+        # id(container) -> (container, chain)
+        self._chains = {}
+
+    def chain(self, ob):
+        """Return the local site managers used inside `ob`, nearest first
+
+        These are the site manager of `ob`, if it is a site, and the ones of
+        the sites above it, up to the root.  The global site manager isn't
+        included.
+        """
+        chains = self._chains
+        # Walk up to a container seen before, then compute the chains of
+        # the containers passed top-down
+        passed = []
+        chain = ()
+        while ob is not None:
+            cached = chains.get(id(ob))
+            if cached is not None and cached[0] is ob:
+                chain = cached[1]
+                break
+            passed.append(ob)
+            if IRoot.providedBy(ob):
+                break
+            ob = getattr(ob, '__parent__', None)
+        for ob in reversed(passed):
+            if ISite.providedBy(ob):
+                chain = (ob.getSiteManager(),) + chain
+            chains[id(ob)] = (ob, chain)
+        return chain
+
+    def nextSiteManager(self, site):
+        """Return the site manager the one of `site` is based on
+
+        This is the site manager of the nearest site above `site`, or the
+        global site manager, like zope.site finds it.
+        """
+        chain = ()
+        if not IRoot.providedBy(site):
+            chain = self.chain(getattr(site, '__parent__', None))
+        if chain:
+            return chain[0]
+        return component.getGlobalSiteManager()
+
+    def siteMade(self, site):
+        """Note that `site` was made a site
+
+        The chain of `site` is computed again.  The chains of the
+        containers below it are not: make sites parents first, before
+        looking up anything below them.
+        """
+        self._chains.pop(id(site), None)
+        self.chain(site)
+
+    def siteMoved(self, site):
+        """Forget the chains of a moved site and of everything below it"""
+        sm = site.getSiteManager()
+        for key, (ob, chain) in list(self._chains.items()):
+            if any(other is sm for other in chain):
+                del self._chains[key]
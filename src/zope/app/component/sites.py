@@ -0,0 +1,153 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Make many folders sites at once.
+
+`makeSites` makes sites of a list of folders, for example all the folders
+`possibleSites` finds in a subtree::
+
+    makeSites(possibleSites(tenants), template=model.getSiteManager())
+
+The new site managers can be seeded from the site manager of a template
+site: the contents of its site management folders are copied and its
+registrations are made again, as by loading a snapshot of them
+(`zope.app.component.snapshot`).
+"""
+import collections
+import json
+
+import zope.event
+from zope.component.interfaces import IPossibleSite
+from zope.component.interfaces import ISite
+from zope.container.interfaces import IReadContainer
+from zope.copy import copy
+from zope.lifecycleevent import ObjectCreatedEvent
+from zope.security.proxy import removeSecurityProxy
+from zope.site.site import LocalSiteManager
+from zope.site.site import SiteManagementFolder
+from zope.traversing.api import traverse
+
+from zope.app.component.sitechain import SiteManagerChains
+from zope.app.component.snapshot import exportRegistrations
+from zope.app.component.snapshot import loadRegistrations
+
+
+def possibleSites(container):
+    """Iterate over the folders below `container` that can become sites
+
+    The folders that are sites already aren't included, but the folders
+    below them are.  The folders nearer to `container` come first.
+    """
+    queue = collections.deque([removeSecurityProxy(container)])
+    while queue:
+        for ob in queue.popleft().values():
+            ob = removeSecurityProxy(ob)
+            if IPossibleSite.providedBy(ob) and not ISite.providedBy(ob):
+                yield ob
+            if IReadContainer.providedBy(ob):
+                queue.append(ob)
+
+
+def _depth(ob):
+    depth = 0
+    while ob is not None:
+        ob = getattr(ob, '__parent__', None)
+        depth += 1
+    return depth
+
+
+def _references(snapshot):
+    # The paths of the components and factories a snapshot refers to
+    for line in snapshot[1:]:
+        record = json.loads(line)
+        reference = record.get('component', record.get('factory'))
+        if 'path' in reference:
+            yield reference['path']
+
+
+def _checkTemplate(folders, template, snapshot):
+    # Raise LookupError if a component registered in the template isn't
+    # found for one of the folders.  The contents of the site management
+    # folders are copied, so they are looked up in the template site.
+    for path in set(_references(snapshot)):
+        if path.split('/', 1)[0] == '++etc++site':
+            traverse(template.__parent__, path)
+            continue
+        for folder in folders:
+            traverse(folder, path)
+
+
+def _seed(sm, template, snapshot):
+    for name, folder in template.items():
+        target = sm.get(name)
+        if target is None:
+            sm[name] = copy(folder)
+            continue
+        for key, ob in folder.items():
+            if key not in target:
+                target[key] = copy(ob)
+    return loadRegistrations(sm, snapshot, trusted=True)
+
+
+def _localSiteManager(folder, base):
+    # Like LocalSiteManager(folder), with the given base instead of the one
+    # found by walking up from the folder
+    sm = LocalSiteManager(None, default_folder=False)
+    sm.__parent__ = folder
+    sm.__bases__ = (base,)
+    default = SiteManagementFolder()
+    zope.event.notify(ObjectCreatedEvent(default))
+    sm['default'] = default
+    return sm
+
+
+def makeSites(folders, template=None):
+    """Make sites of `folders` and return their new site managers
+
+    Folders that are sites already are skipped.  The parents are made
+    sites before their children, so each new site manager is based on the
+    one of the nearest site above it, new or not.  The site managers above
+    the folders are looked up once per container (see
+    `zope.app.component.sitechain`).  A `NewLocalSite` event is sent as
+    each site is made.
+
+    If `template` (a local site manager) is given, the contents of its site
+    management folders are copied into each new site manager, and its
+    registrations are made there.  The components it registers must be in
+    its site management folders or at the same paths in the new sites;
+    `LookupError` is raised otherwise, before any site is made.  Other
+    errors may leave some of the sites made; abort the transaction then.
+    """
+    unique = {}
+    for folder in folders:
+        folder = removeSecurityProxy(folder)
+        if not ISite.providedBy(folder):
+            unique[id(folder)] = folder
+    ordered = sorted(unique.values(), key=_depth)
+
+    snapshot = None
+    if template is not None:
+        template = removeSecurityProxy(template)
+        snapshot = list(exportRegistrations(template))
+        _checkTemplate(ordered, template, snapshot)
+
+    chains = SiteManagerChains()
+    managers = []
+    for folder in ordered:
+        sm = _localSiteManager(folder, chains.nextSiteManager(folder))
+        folder.setSiteManager(sm)
+        chains.siteMade(folder)
+        if snapshot is not None:
+            _seed(sm, template, snapshot)
+        managers.append(sm)
+    return managers
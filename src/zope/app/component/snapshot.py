@@ -0,0 +1,279 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Snapshots of the registrations of a local site manager.
+
+A snapshot is written one JSON document per line.  The first line tells
+the format and its version, every other line describes one registration::
+
+    {"format": "zope.app.component.snapshot", "version": 1}
+    {"kind": "utility", "provided": "zope.site.interfaces.IFolder",
+     "name": "", "info": "", "component": {"path": "++etc++site/default/f"}}
+    {"kind": "adapter", "required": ["zope.site.interfaces.IFolder"],
+     "provided": "...", "name": "", "info": "", "factory": {"global": "..."}}
+
+Interfaces and global objects (classes, functions) are referred to by their
+dotted names, the classes of required specifications with a ``class:``
+prefix.  Other components are referred to by their path, relative to the
+site if they are in it.  Loading a snapshot into another site therefore
+registers the objects found at the same paths in that site.
+
+Snapshots that don't come from a trusted source, such as uploaded files,
+may only refer to global objects in modules that are imported already:
+interfaces, classes for required specifications, and components and
+factories that declare the interfaces they implement, provide or adapt.
+The paths they refer to must be in the site: relative paths without
+``..``, views or namespaces other than the site manager (``++etc++site``)
+of the site.
+"""
+import json
+import sys
+import types
+
+from zope.dottedname.resolve import resolve
+from zope.interface import implementedBy
+from zope.interface import providedBy
+from zope.interface.declarations import Implements
+from zope.interface.interfaces import IInterface
+from zope.location.interfaces import ILocation
+from zope.security.proxy import removeSecurityProxy
+from zope.traversing.api import getPath
+from zope.traversing.api import traverse
+
+from zope.app.component.registrations import bulkChanges
+from zope.app.component.registrations import iterRegistrations
+from zope.app.component.registrations import registerUtilities
+from zope.app.component.registrations import registrationKind
+
+
+FORMAT = 'zope.app.component.snapshot'
+VERSION = 1
+
+
+def _globalName(ob):
+    name = '{}.{}'.format(getattr(ob, '__module__', None),
+                          getattr(ob, '__qualname__', None))
+    try:
+        if resolve(name) is ob:
+            return name
+    except (ImportError, AttributeError, ValueError):
+        pass
+    return None
+
+
+def _reference(ob, site_path):
+    ob = removeSecurityProxy(ob)
+    if ILocation.providedBy(ob) and ob.__parent__ is not None:
+        path = getPath(ob)
+        if site_path == '/':
+            return {'path': path[1:]}
+        if path == site_path:
+            return {'path': ''}
+        if path.startswith(site_path + '/'):
+            return {'path': path[len(site_path) + 1:]}
+        return {'path': path}
+    name = _globalName(ob)
+    if name is None:
+        raise ValueError("Can't refer to the object in a snapshot", ob)
+    return {'global': name}
+
+
+def _specName(spec):
+    if isinstance(spec, Implements) and isinstance(spec.inherit, type):
+        name = _globalName(spec.inherit)
+        if name is not None:
+            return 'class:' + name
+    elif IInterface.providedBy(spec):
+        return spec.__identifier__
+    raise ValueError("Can't refer to the specification in a snapshot", spec)
+
+
+def _record(registration, site_path):
+    kind = registrationKind(registration)
+    record = {'kind': kind}
+    if kind != 'utility':
+        record['required'] = [_specName(s) for s in registration.required]
+    if kind != 'handler':
+        record['provided'] = _specName(registration.provided)
+    record['name'] = registration.name
+    info = registration.info
+    record['info'] = info if isinstance(info, str) else str(info)
+    if kind == 'utility':
+        record['component'] = _reference(registration.component, site_path)
+    else:
+        record['factory'] = _reference(registration.factory, site_path)
+    return record
+
+
+def exportRegistrations(sm):
+    """Return an iterator over the lines of a snapshot of `sm`
+
+    All the registrations made in the site manager are included, not the
+    ones inherited from its bases.  `ValueError` is raised for components
+    that can't be referred to.
+    """
+    site_path = getPath(sm.__parent__)
+    yield json.dumps({'format': FORMAT, 'version': VERSION}) + '\n'
+    for registration in iterRegistrations(sm):
+        yield json.dumps(_record(registration, site_path),
+                         separators=(',', ':')) + '\n'
+
+
+def _importedGlobal(name):
+    # Like resolve, but only finds objects of modules imported already
+    parts = name.split('.')
+    for i in range(len(parts) - 1, 0, -1):
+        module = sys.modules.get('.'.join(parts[:i]))
+        if module is not None:
+            break
+    else:
+        raise LookupError("No such global object", name)
+    ob = module
+    for part in parts[i:]:
+        try:
+            ob = getattr(ob, part)
+        except AttributeError:
+            raise LookupError("No such global object", name)
+    return ob
+
+
+def _declared(ob):
+    # Whether ob is declared to be used as a component
+    if isinstance(ob, (type, types.FunctionType)):
+        return (getattr(ob, '__component_adapts__', None) is not None
+                or bool(list(implementedBy(ob))))
+    return bool(list(providedBy(ob)))
+
+
+def _resolveSpec(name, trusted):
+    if name.startswith('class:'):
+        if trusted:
+            return implementedBy(resolve(name[6:]))
+        ob = _importedGlobal(name[6:])
+        if not isinstance(ob, type):
+            raise ValueError("Not a class", name[6:])
+        return implementedBy(ob)
+    if trusted:
+        return resolve(name)
+    ob = _importedGlobal(name)
+    if not IInterface.providedBy(ob):
+        raise ValueError("Not an interface", name)
+    return ob
+
+
+def _checkPath(path):
+    # Untrusted paths may only lead to objects in the site: they are
+    # relative, and the only namespace allowed is the site manager of the
+    # site itself
+    names = path.split('/') if path else []
+    if names and names[0] == '++etc++site':
+        names = names[1:]
+    for name in names:
+        if name in ('', '.', '..') or name.startswith(('++', '@@')):
+            raise ValueError("Path outside of the site", path)
+
+
+def _resolveReference(reference, site, trusted):
+    if 'path' in reference:
+        path = reference['path']
+        if not trusted:
+            _checkPath(path)
+        return removeSecurityProxy(traverse(site, path))
+    name = reference['global']
+    if trusted:
+        return resolve(name)
+    ob = _importedGlobal(name)
+    if not _declared(ob):
+        raise ValueError("Not a declared component or factory", name)
+    return ob
+
+
+def _checkRecord(record):
+    # Whether the parts of a record have the expected types
+    if not isinstance(record, dict):
+        return False
+    kind = record.get('kind')
+    strings = ['kind', 'name', 'info']
+    if kind != 'handler':
+        strings.append('provided')
+    if kind == 'utility':
+        required, reference = [], record.get('component')
+    else:
+        required, reference = record.get('required'), record.get('factory')
+    return (all(isinstance(record.get(name), str) for name in strings)
+            and isinstance(required, list)
+            and all(isinstance(name, str) for name in required)
+            and isinstance(reference, dict) and len(reference) == 1
+            and isinstance(reference.get('path', reference.get('global')),
+                           str))
+
+
+def loadRegistrations(sm, lines, trusted=False):
+    """Register in `sm` what a snapshot describes and return the count
+
+    `lines` is an iterable over the lines of the snapshot, for example an
+    open file.  All the referred objects are looked up before anything is
+    registered; the registrations are then made in one bulk operation.
+
+    Unless the snapshot is `trusted`, the global objects it refers to are
+    restricted as described above.  `ValueError` is raised for invalid
+    snapshots and `LookupError` for objects that aren't found.
+    """
+    site = sm.__parent__
+    lines = (line for line in lines if line.strip())
+    try:
+        header = json.loads(next(lines))
+    except (StopIteration, ValueError):
+        header = None
+    if not isinstance(header, dict) or header.get('format') != FORMAT:
+        raise ValueError("Not a registration snapshot")
+    if header.get('version') != VERSION:
+        raise ValueError("Unsupported snapshot version",
+                         header.get('version'))
+
+    utilities = []
+    others = []
+    for number, line in enumerate(lines, 1):
+        record = json.loads(line)
+        if not _checkRecord(record):
+            raise ValueError("Invalid snapshot record", number)
+        kind = record['kind']
+        if kind == 'utility':
+            utilities.append((
+                _resolveReference(record['component'], site, trusted),
+                _resolveSpec(record['provided'], trusted),
+                record['name'], record['info']))
+            continue
+        factory = _resolveReference(record['factory'], site, trusted)
+        required = [_resolveSpec(name, trusted)
+                    for name in record['required']]
+        if kind == 'handler':
+            others.append((sm.registerHandler, (
+                factory, required, record['name'], record['info'])))
+            continue
+        if kind == 'adapter':
+            register = sm.registerAdapter
+        elif kind == 'subscriber':
+            register = sm.registerSubscriptionAdapter
+        else:
+            raise ValueError("Unknown registration kind", kind)
+        others.append((register, (
+            factory, required, _resolveSpec(record['provided'], trusted),
+            record['name'], record['info'])))
+
+    with bulkChanges(sm):
+        count = registerUtilities(sm, utilities)
+        for register, args in others:
+            register(*args)
+        count += len(others)
+    return count
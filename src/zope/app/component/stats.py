@@ -0,0 +1,226 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Statistics about site managers and the adapter lookups made in them
+
+`registrationStats` tells how many registrations a site manager has::
+
+    from zope.app.component import stats
+    stats.registrationStats(sm)['kinds']
+
+A `LookupSampler` counts the adaptations (``IFoo(ob)``) made through the
+site hook, per site manager, provided interface and name, and times a
+sample of them.
+It is installed and removed like `zope.app.component.lookupcache`::
+
+    sampler = stats.install(rate=100)
+    ...
+    sampler.stats()
+    stats.uninstall()
+
+The counters aren't locked, so they may miss some calls made by
+concurrent threads.
+"""
+import collections
+import time
+
+from zope.component import _api
+from zope.component import hooks
+from zope.location.interfaces import IRoot
+
+from zope.app.component.registrations import KIND_NAMES
+from zope.app.component.registrations import iterRegistrations
+from zope.app.component.registrations import registrationKind
+
+
+def _cacheSize(cache):
+    if not isinstance(cache, dict):
+        return 1
+    return sum(_cacheSize(value) for value in cache.values())
+
+
+def cacheSizes(registry):
+    """Return the number of lookups cached by an adapter registry
+
+    The result maps the cache names ``lookup``, ``multi`` and
+    ``subscriptions`` to their number of entries.  Only the Python
+    implementation of `zope.interface` exposes the caches: None is returned
+    with its C optimizations, which are used by default on CPython.
+    """
+    lookup = registry._v_lookup
+    caches = {}
+    for name, attr in (('lookup', '_cache'),
+                       ('multi', '_mcache'),
+                       ('subscriptions', '_scache')):
+        cache = getattr(lookup, attr, None)
+        if cache is None:
+            return None
+        caches[name] = _cacheSize(cache)
+    return caches
+
+
+def registrationStats(sm):
+    """Return counts of the registrations made in a site manager
+
+    The result has the number of registrations per kind (``kinds``), per
+    provided interface dotted name (``provided``, the most registered
+    first) and the sizes of the lookup caches of the ``adapters`` and
+    ``utilities`` registries (see `cacheSizes`).
+    """
+    kinds = dict.fromkeys(KIND_NAMES, 0)
+    provided = collections.Counter()
+    for registration in iterRegistrations(sm):
+        kinds[registrationKind(registration)] += 1
+        name = getattr(registration.provided, '__identifier__', None)
+        if name is not None:
+            provided[name] += 1
+    return {
+        'kinds': kinds,
+        'provided': dict(sorted(provided.items(),
+                                key=lambda item: (-item[1], item[0]))),
+        'caches': {
+            'adapters': cacheSizes(sm.adapters),
+            'utilities': cacheSizes(sm.utilities),
+        },
+    }
+
+
+def _siteManagerKey(sm):
+    # Persistent site managers are loaded by every connection to the
+    # database; they are counted together by their database id.
+    oid = getattr(sm, '_p_oid', None)
+    return id(sm) if oid is None else oid
+
+
+def _siteName(sm):
+    # The path of the site of a local site manager, else its name.  The
+    # path isn't computed by adaptation, which the sampler would count.
+    ob = getattr(sm, '__parent__', None)
+    if ob is None:
+        return getattr(sm, '__name__', None) or repr(sm)
+    names = []
+    while ob is not None and not IRoot.providedBy(ob):
+        names.append(str(getattr(ob, '__name__', None)))
+        ob = getattr(ob, '__parent__', None)
+    return '/' + '/'.join(reversed(names))
+
+
+class LookupSampler:
+    """Count the adaptations made through the site hook
+
+    Every call is counted, per current site manager, and found (a hit) if
+    the result isn't the default.  Every `rate`-th call is timed.  The
+    adaptations are made by `hook`, by default the current implementation
+    of the adapter hook.
+    """
+
+    def __init__(self, rate=100, hook=None):
+        self.rate = max(int(rate), 1)
+        if hook is None:
+            hook = _api.adapter_hook.implementation
+        self.hook = hook
+        self.clear()
+
+    def clear(self):
+        self._calls = 0
+        # (site manager key, provided, name) ->
+        #     [site, calls, hits, timed, seconds, slowest]
+        self._counters = {}
+
+    def adapter_hook(self, interface, object, name='', default=None):
+        """Adapt `object` to `interface` using the sampled hook"""
+        sm = hooks.getSiteManager()
+        key = (_siteManagerKey(sm), interface, name)
+        counters = self._counters.get(key)
+        if counters is None:
+            counters = self._counters[key] = [
+                _siteName(sm), 0, 0, 0, 0.0, 0.0]
+        self._calls += 1
+        if self._calls % self.rate:
+            result = self.hook(interface, object, name, default)
+        else:
+            start = time.perf_counter()
+            result = self.hook(interface, object, name, default)
+            elapsed = time.perf_counter() - start
+            counters[3] += 1
+            counters[4] += elapsed
+            if elapsed > counters[5]:
+                counters[5] = elapsed
+        counters[1] += 1
+        if result is not default:
+            counters[2] += 1
+        return result
+
+    def stats(self, sm=None):
+        """Return the counters per site manager, provided interface and name
+
+        ``site`` is the path of the site of the site manager, or the name
+        of a global site manager.  With `sm`, only the adaptations made in
+        that site manager are returned.  The list has the most called
+        first.  ``mean`` and ``slowest`` are in seconds, None if no call
+        was timed.
+        """
+        only = None if sm is None else _siteManagerKey(sm)
+        stats = []
+        for (key, provided, name), counters in list(self._counters.items()):
+            if only is not None and key != only:
+                continue
+            site, calls, hits, timed, seconds, slowest = counters
+            stats.append({
+                'site': site,
+                'provided': getattr(provided, '__identifier__', None),
+                'name': name,
+                'calls': calls,
+                'hits': hits,
+                'timed': timed,
+                'mean': seconds / timed if timed else None,
+                'slowest': slowest if timed else None,
+            })
+        stats.sort(key=lambda s: (-s['calls'], s['site'],
+                                  s['provided'] or '', s['name']))
+        return stats
+
+
+_sampler = None
+
+
+def install(rate=100):
+    """Count the adaptations with a new `LookupSampler` and return it
+
+    The sampler calls the adapter hook that was installed before, such as
+    the one of a `zope.app.component.lookupcache.LookupCache`.
+    """
+    global _sampler
+    uninstall()
+    sampler = LookupSampler(rate)
+    _api.adapter_hook.sethook(sampler.adapter_hook)
+    _sampler = sampler
+    return sampler
+
+
+def uninstall():
+    """Remove the installed sampler, if any
+
+    The hook it called is installed again, unless another hook replaced
+    the sampler in the meantime.
+    """
+    global _sampler
+    if _sampler is not None:
+        if _api.adapter_hook.implementation == _sampler.adapter_hook:
+            _api.adapter_hook.sethook(_sampler.hook)
+        _sampler = None
+
+
+def installedSampler():
+    """Return the installed sampler or None"""
+    return _sampler
@@ -16,14 +16,17 @@ Test helpers.
 
 This is part of the public API of this package.
 """
+import pickle
 
 from zope.component.hooks import setSite
 from zope.component.interfaces import ISite
 from zope.component.testing import PlacelessSetup
 from zope.container.interfaces import ISimpleReadContainer
 from zope.container.traversal import ContainerTraversable
+from zope.interface.registry import Components
 from zope.site.folder import Folder
 from zope.site.folder import rootFolder
+from zope.site.interfaces import IFolder
 from zope.site.site import LocalSiteManager
 from zope.traversing.api import traverse
 from zope.traversing.interfaces import ITraversable
@@ -73,6 +76,48 @@ def buildSampleFolderTree():
     return root
 
 
+def buildFolderTree(depth, fanout, site_levels=(), registrations=0,
+                    provided=IFolder):
+    r"""
+    Create a tree of folders `depth` levels deep and return the root.
+
+    Every folder has `fanout` subfolders, named like the folders of
+    `buildSampleFolderTree`::
+
+           rootFolder
+          /          \
+       folder1      folder2
+        |    \         |   \
+    folder1_1 folder1_2 ...
+
+    The folders at the levels in `site_levels` are made sites (the root
+    folder is at level 0).  In each of those sites, the site folder is
+    registered `registrations` times as a utility providing `provided`,
+    named ``utility0``, ``utility1`` and so on, so the same names are
+    registered at each site level.
+
+    Making sites needs the traversal set up by `setUpTraversal`.
+    """
+    root = rootFolder()
+    levels = [[('folder', root)]]
+    for level in range(1, depth + 1):
+        children = []
+        for prefix, parent in levels[-1]:
+            sep = '_' if parent is not root else ''
+            for i in range(1, fanout + 1):
+                name = '%s%s%d' % (prefix, sep, i)
+                child = parent[name] = Folder()
+                children.append((name, child))
+        levels.append(children)
+
+    for level in sorted(site_levels):
+        for name, folder in levels[level]:
+            sm = createSiteManager(folder)
+            for i in range(registrations):
+                sm.registerUtility(folder, provided, 'utility%d' % i)
+    return root
+
+
 def createSiteManager(folder, setsite=False):
     "Make the given folder a site, and optionally make it the current site."
     if not ISite.providedBy(folder):
@@ -91,10 +136,23 @@ def setUpTraversal():
                              ITraversable)
 
 
+def _stillPlaced(ob, root):
+    # Whether ob is still reachable from root through its __parent__ chain
+    while ob is not root:
+        parent = getattr(ob, '__parent__', None)
+        if parent is None or parent.get(ob.__name__) is not ob:
+            return False
+        ob = parent
+    return True
+
+
 class Place:
     """A property-like descriptor that traverses its name starting from
 
     rootFolder.
+
+    The traversed object is remembered per test instance and root folder;
+    it is traversed again if it has been removed from the tree since.
     """
 
     def __init__(self, path):
@@ -110,7 +168,90 @@ class Place:
         except KeyError:
             root = inst.rootFolder = buildSampleFolderTree()
 
-        return traverse(root, self.path)
+        places = inst.__dict__.get('_places')
+        if places is None or places[0] is not root:
+            places = inst.__dict__['_places'] = (root, {})
+        ob = places[1].get(self.path)
+        if ob is None or not _stillPlaced(ob, root):
+            ob = places[1][self.path] = traverse(root, self.path)
+        return ob
+
+
+class PlacefulSnapshot:
+    """The global registrations and sample folders used by `PlacefulSetup`,
+    made once and restored for every test
+
+    The first time it is restored, the traversal adapters are registered
+    and `setUp`, if given, is called to register more components in the
+    global site manager.  These registrations are then moved into a
+    separate registry, which the global site manager extends from then on
+    until it is cleaned up.  The registrations made by the tests go to the
+    global site manager itself, so they don't change the snapshot; they
+    can't replace or unregister the registrations of the snapshot, though.
+
+    Only the registrations are kept.  `setUp` must not change other global
+    state cleaned up by `zope.testing.cleanup`, like security checkers.
+
+    Use the same snapshot in the test cases of a layer::
+
+        snapshot = PlacefulSnapshot(registerMyAdapters)
+
+        class MyTests(PlacefulSetup, unittest.TestCase):
+            snapshot = snapshot
+    """
+
+    def __init__(self, setUp=None):
+        self.setUp = setUp
+        self._registry = None
+        self._trees = {}  # site -> pickled sample folder tree
+
+    def _capture(self, gsm):
+        setUpTraversal()
+        if self.setUp is not None:
+            self.setUp()
+        registry = Components('snapshot')
+        for r in gsm.registeredUtilities():
+            registry.registerUtility(r.component, r.provided, r.name,
+                                     r.info, event=False)
+        for r in gsm.registeredAdapters():
+            registry.registerAdapter(r.factory, r.required, r.provided,
+                                     r.name, r.info, event=False)
+        for r in gsm.registeredSubscriptionAdapters():
+            registry.registerSubscriptionAdapter(
+                r.factory, r.required, r.provided, r.name, r.info,
+                event=False)
+        for r in gsm.registeredHandlers():
+            registry.registerHandler(r.handler, r.required, r.name, r.info,
+                                     event=False)
+        gsm.__init__(gsm.__name__)
+        return registry
+
+    def restore(self):
+        """Make the global site manager extend the registrations
+
+        The global site manager must have been cleaned up, as by
+        `PlacelessSetup.setUp`.
+        """
+        gsm = component.getGlobalSiteManager()
+        if self._registry is None:
+            self._registry = self._capture(gsm)
+        gsm.__bases__ = (self._registry,)
+
+    def sampleFolderTree(self, site=False):
+        """Return a new copy of the sample folder tree
+
+        The root folder is a site if `site` is true.  The tree is built
+        by `buildSampleFolderTree` the first time, once the registrations
+        have been restored.
+        """
+        data = self._trees.get(site)
+        if data is None:
+            root = buildSampleFolderTree()
+            if site:
+                createSiteManager(root)
+            data = self._trees[site] = pickle.dumps(
+                root, pickle.HIGHEST_PROTOCOL)
+        return pickle.loads(data)
 
 
 class PlacefulSetup(PlacelessSetup):
@@ -151,14 +292,24 @@ class PlacefulSetup(PlacelessSetup):
                       "\N{CYRILLIC SMALL LETTER KA}"
                       "\N{CYRILLIC SMALL LETTER A}3_1")
 
+    # A `PlacefulSnapshot` restored by `setUp` instead of registering the
+    # traversal adapters and building the sample folders for every test
+    snapshot = None
+
     def setUp(self, folders=False, site=False):
         PlacelessSetup.setUp(self)
-        setUpTraversal()
+        if self.snapshot is None:
+            setUpTraversal()
+        else:
+            self.snapshot.restore()
         if folders or site:
             return self.buildFolders(site)
 
     def buildFolders(self, site=False):
-        self.rootFolder = buildSampleFolderTree()
+        if self.snapshot is None:
+            self.rootFolder = buildSampleFolderTree()
+        else:
+            self.rootFolder = self.snapshot.sampleFolderTree(site)
         if site:
             return self.makeSite()
 
@@ -0,0 +1,68 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from zope.app.component import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+
+    args = ['--utilities', '10', '--adapters', '2', '--subscribers', '2',
+            '--handlers', '2', '--repeat', '1']
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def _main(self, *args):
+        out = io.StringIO()
+        status = benchmark.main(self.args + list(args), out)
+        return status, out.getvalue()
+
+    def test_all_benchmarks(self):
+        output = os.path.join(self.tmp, 'results.json')
+        status, out = self._main('--output', output)
+        self.assertEqual(status, 0)
+        with open(output) as f:
+            results = json.load(f)
+        self.assertEqual(sorted(results),
+                         sorted(name for name, b in benchmark.BENCHMARKS))
+        for name, result in results.items():
+            self.assertIn(name, out)
+            self.assertGreater(result['ops_per_second'], 0)
+
+    def test_baseline(self):
+        name = 'MakeSite.addSiteManager'
+        baseline = os.path.join(self.tmp, 'baseline.json')
+        with open(baseline, 'w') as f:
+            json.dump({name: {'ops_per_second': 1e12}}, f)
+        status, out = self._main('--benchmark', name, '--baseline', baseline)
+        self.assertEqual(status, 1)
+        self.assertIn('REGRESSION: ' + name, out)
+
+        with open(baseline, 'w') as f:
+            json.dump({name: {'ops_per_second': 1e-6}}, f)
+        status, out = self._main('--benchmark', name, '--baseline', baseline)
+        self.assertEqual(status, 0)
+        self.assertNotIn('REGRESSION', out)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
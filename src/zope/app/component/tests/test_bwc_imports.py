@@ -13,13 +13,21 @@
 ##############################################################################
 
 import importlib
+import sys
+import types
 import unittest
+import warnings
+
+from zope.app.component import _bbb
 
 
 def _make_import_test(mod_name, attrname):
     def test(self):
         mod = importlib.import_module('zope.app.component.' + mod_name)
         self.assertIsNotNone(getattr(mod, attrname))
+        namespace = {}
+        exec('from zope.app.component.%s import *' % mod_name, namespace)
+        self.assertIs(namespace[attrname], getattr(mod, attrname))
 
     return test
 
@@ -36,5 +44,65 @@ class TestBWCImports(unittest.TestCase):
         locals()['test_' + mod_name] = _make_import_test(mod_name, attrname)
 
 
+class TestLazyImports(unittest.TestCase):
+
+    def setUp(self):
+        self.module = types.ModuleType('zope.app.component.tests.lazy')
+        getattr_, dir_, all_ = _bbb.lazyImports(self.module.__name__, {
+            'zope.component.hooks': ('getSite', 'setSite', '_private'),
+        })
+        self.module.__getattr__ = getattr_
+        self.module.__dir__ = dir_
+        self.module.__all__ = all_
+        sys.modules[self.module.__name__] = self.module
+
+    def tearDown(self):
+        del sys.modules[self.module.__name__]
+        for name in list(_bbb.resolved):
+            if name.startswith(self.module.__name__ + '.'):
+                del _bbb.resolved[name]
+        _bbb.warn = False
+
+    def test_resolved_once(self):
+        from zope.component.hooks import getSite
+        self.assertNotIn('getSite', vars(self.module))
+        self.assertIn('getSite', dir(self.module))
+        self.assertIs(self.module.getSite, getSite)
+        self.assertIs(vars(self.module)['getSite'], getSite)
+        self.assertIs(self.module.getSite, getSite)
+        self.assertEqual(
+            _bbb.resolved['zope.app.component.tests.lazy.getSite'], 1)
+
+    def test_star_import(self):
+        from zope.component.hooks import getSite
+        self.assertEqual(self.module.__all__, ['getSite', 'setSite'])
+        namespace = {}
+        exec('from %s import *' % self.module.__name__, namespace)
+        self.assertIs(namespace['getSite'], getSite)
+        self.assertNotIn('_private', namespace)
+
+    def test_vocabulary_star_import(self):
+        from zope.app.component import vocabulary
+        namespace = {}
+        exec('from zope.app.component.vocabulary import *', namespace)
+        self.assertIs(namespace['CachedUtilityVocabulary'],
+                      vocabulary.CachedUtilityVocabulary)
+        self.assertIs(namespace['UtilityVocabulary'],
+                      vocabulary.UtilityVocabulary)
+
+    def test_unknown(self):
+        self.assertRaises(AttributeError, getattr, self.module, 'nothing')
+
+    def test_warn(self):
+        _bbb.warn = True
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.module.setSite
+        self.assertEqual(len(w), 1)
+        self.assertIs(w[0].category, DeprecationWarning)
+        self.assertIn('import it from zope.component.hooks',
+                      str(w[0].message))
+
+
 def test_suite():
     return unittest.defaultTestLoader.loadTestsFromName(__name__)
@@ -0,0 +1,168 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import unittest
+
+from zope.component.testing import PlacelessSetup
+from zope.configuration import xmlconfig
+from zope.publisher.browser import TestRequest
+from zope.publisher.interfaces.browser import IBrowserRequest
+from zope.security.checker import getCheckerForInstancesOf
+from zope.security.protectclass import protectName
+from zope.security.protectclass import protectSetAttribute
+
+from zope import component
+from zope import interface
+from zope.app.component import checkers
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class C:
+    pass
+
+
+class D:
+    pass
+
+
+class IContent(interface.Interface):
+    pass
+
+
+@interface.implementer(IContent)
+class Content:
+    pass
+
+
+class Adapter:
+
+    def __init__(self, *args):
+        self.args = args
+
+
+FACTORIES = """\
+<configure xmlns="http://namespaces.zope.org/zope">
+  <include package="zope.component" file="meta.zcml" />
+  <include package="zope.security" file="meta.zcml" />
+  <permission id="zope.View" title="View" />
+  <adapter for="{module}.IContent" provides="{module}.IContent"
+           factory="{module}.Adapter" permission="zope.View" name="one" />
+  <adapter for="{module}.IContent" provides="{module}.IContent"
+           factory="{module}.Adapter" permission="zope.View" name="two" />
+  <view for="{module}.IContent" factory="{module}.Adapter" name="one"
+        type="zope.publisher.interfaces.browser.IBrowserRequest"
+        permission="zope.View" />
+  <view for="{module}.IContent" factory="{module}.Adapter" name="two"
+        type="zope.publisher.interfaces.browser.IBrowserRequest"
+        permission="zope.View" />
+  <resource factory="{module}.Adapter" name="one"
+            type="zope.publisher.interfaces.browser.IBrowserRequest"
+            permission="zope.View" />
+  <resource factory="{module}.Adapter" name="two"
+            type="zope.publisher.interfaces.browser.IBrowserRequest"
+            permission="zope.View" />
+</configure>
+"""
+
+
+class TestInternCheckers(PlacelessSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        for class_ in (A, B, C, D):
+            protectName(class_, 'title', 'zope.View')
+            protectSetAttribute(class_, 'title', 'zope.ManageContent')
+        protectName(D, 'body', 'zope.View')
+
+    def test_intern(self):
+        stats = checkers.internCheckers()
+        # Some of the checkers defined by zope.security are shared, too
+        self.assertGreaterEqual(stats['classes'], 3)
+        self.assertGreaterEqual(stats['checkers'], 1)
+        self.assertGreater(stats['saved'], 0)
+
+        checker = getCheckerForInstancesOf(A)
+        self.assertIs(getCheckerForInstancesOf(B), checker)
+        self.assertIs(getCheckerForInstancesOf(C), checker)
+        self.assertIsNot(getCheckerForInstancesOf(D), checker)
+        self.assertEqual(checker.permission_id('title'), 'zope.View')
+        self.assertEqual(checker.setattr_permission_id('title'),
+                         'zope.ManageContent')
+
+        # Nothing more to share
+        again = checkers.internCheckers()
+        self.assertEqual(again['classes'], stats['classes'])
+        self.assertEqual(again['checkers'], 0)
+        self.assertEqual(again['saved'], 0)
+
+    def test_factories(self):
+        xmlconfig.string(FACTORIES.format(module=__name__))
+        adapters = component.getGlobalSiteManager().adapters
+        factories = [
+            adapters.lookup((IContent,), IContent, name)
+            for name in ('one', 'two')
+        ] + [
+            adapters.lookup((IContent, IBrowserRequest), interface.Interface,
+                            name)
+            for name in ('one', 'two')
+        ] + [
+            adapters.lookup((IBrowserRequest,), interface.Interface, name)
+            for name in ('one', 'two')
+        ]
+        before = [checkers._factoryChecker(f)[0] for f in factories]
+        self.assertEqual(len({id(c) for c in before}), 6)
+
+        stats = checkers.internCheckers()
+        self.assertGreaterEqual(stats['factories'], 6)
+        after = [id(checkers._factoryChecker(f)[0]) for f in factories]
+        # The adapters protect the names of the provided interface, the
+        # views and resources __call__
+        self.assertEqual(len(set(after[:2])), 1)
+        self.assertEqual(len(set(after[2:])), 1)
+
+        # The shared checker protects what the factories make
+        ob = factories[0](Content())
+        self.assertIsNone(ob.__Security_checker__.permission_id('args'))
+        view = factories[2](Content(), TestRequest())
+        self.assertEqual(view.__Security_checker__.permission_id('__call__'),
+                         'zope.View')
+
+    def test_read_only(self):
+        checkers.internCheckers()
+        self.assertRaises(TypeError, protectName, A, 'body', 'zope.View')
+        checkers.uninternChecker(A)
+        protectName(A, 'body', 'zope.View')
+        self.assertEqual(
+            getCheckerForInstancesOf(A).permission_id('body'), 'zope.View')
+        self.assertIsNone(
+            getCheckerForInstancesOf(B).permission_id('body'))
+        self.assertEqual(
+            getCheckerForInstancesOf(A).setattr_permission_id('title'),
+            'zope.ManageContent')
+
+        # Classes with a checker of their own are left alone
+        checker = getCheckerForInstancesOf(D)
+        checkers.uninternChecker(D)
+        self.assertIs(getCheckerForInstancesOf(D), checker)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
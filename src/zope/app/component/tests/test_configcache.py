@@ -0,0 +1,195 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from zope.component.testing import PlacelessSetup
+from zope.schema.interfaces import IVocabularyFactory
+
+from zope import component
+from zope.app.component import configcache
+
+
+class Unpicklable:
+
+    def __reduce__(self):
+        raise TypeError("Not picklable")
+
+
+unpicklable = Unpicklable()
+
+CONFIGURATION = """\
+<configure xmlns="http://namespaces.zope.org/zope">
+  <include package="zope.component" file="meta.zcml" />
+  <include package="zope.app.component" />
+  %s
+</configure>
+"""
+
+META_CONFIGURATION = """\
+<configure xmlns="http://namespaces.zope.org/zope">
+  <include package="zope.component" file="meta.zcml" />
+</configure>
+"""
+
+VIEWS_CONFIGURATION = """\
+<configure xmlns="http://namespaces.zope.org/zope"
+           xmlns:browser="http://namespaces.zope.org/browser"
+           i18n_domain="zope">
+  <include package="zope.component" file="meta.zcml" />
+  <include package="zope.security" file="meta.zcml" />
+  <include package="zope.browserpage" file="meta.zcml" />
+  <include package="zope.browsermenu" file="meta.zcml" />
+  <permission id="zope.ManageSite" title="Manage" />
+  <view for="*" type="zope.publisher.interfaces.browser.IBrowserRequest"
+        name="proxied" permission="zope.ManageSite"
+        factory="{module}.View" />
+  <browser:menu id="test_menu" title="Test" />
+  <browser:page for="*" name="page.html" permission="zope.ManageSite"
+                class="{module}.View" template="page.pt"
+                menu="test_menu" title="Page" />
+  <browser:view for="*" name="pages" permission="zope.ManageSite"
+                class="{module}.View">
+    <browser:page name="index.html" attribute="index" />
+  </browser:view>
+  <browser:menuItem menu="test_menu" title="Filtered" for="*"
+                    action="@@page.html" filter="python: True" />
+</configure>
+"""
+
+
+class View:
+
+    def __init__(self, context, request):
+        self.context = context
+        self.request = request
+
+    def index(self):
+        return 'index'
+
+
+class TestConfigCache(PlacelessSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.cache = os.path.join(self.tmp, 'configure.cache')
+        self.zcml = os.path.join(self.tmp, 'configure.zcml')
+        self._write('')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+        super().tearDown()
+
+    def _write(self, extra):
+        with open(self.zcml, 'w') as f:
+            f.write(CONFIGURATION % extra)
+
+    def _vocabulary(self):
+        return component.queryUtility(
+            IVocabularyFactory, 'Cached Utility Component Interfaces')
+
+    def test_replayed(self):
+        self.assertFalse(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+        self.assertIsNone(configcache.cacheStatus(self.cache))
+        self.assertIsNotNone(self._vocabulary())
+
+        component.getGlobalSiteManager().__init__('base')
+        self.assertIsNone(self._vocabulary())
+        self.assertTrue(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+        self.assertIsNotNone(self._vocabulary())
+
+    def test_changed_file(self):
+        configcache.loadConfiguration(self.zcml, cache=self.cache)
+        stat = os.stat(self.zcml)
+        os.utime(self.zcml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertFalse(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+        self.assertTrue(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+
+    def test_uncachable(self):
+        self._write(
+            '<utility component="%s.unpicklable" provides="%s" />' % (
+                __name__, 'zope.interface.Interface'))
+        configcache.loadConfiguration(self.zcml, cache=self.cache)
+        self.assertEqual(configcache.cacheStatus(self.cache),
+                         "Not picklable")
+        self.assertFalse(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+
+    def test_meta_configuration_not_cached(self):
+        with open(self.zcml, 'w') as f:
+            f.write(META_CONFIGURATION)
+        configcache.loadConfiguration(self.zcml, cache=self.cache)
+        self.assertEqual(configcache.cacheStatus(self.cache),
+                         "The configuration has no actions")
+        self.assertFalse(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+
+    def _views(self):
+        from zope.app.menus import test_menu
+        from zope.browsermenu.interfaces import IBrowserMenuItem
+        from zope.publisher.browser import TestRequest
+        from zope.security.checker import getCheckerForInstancesOf
+        ob = object()
+        request = TestRequest()
+        proxied = component.getMultiAdapter((ob, request), name='proxied')
+        self.assertEqual(
+            proxied.__Security_checker__.permission_id('__call__'),
+            'zope.ManageSite')
+        page = component.getMultiAdapter((ob, request), name='page.html')
+        self.assertIsInstance(page, View)
+        self.assertEqual(page().strip(), '<p>page</p>')
+        self.assertEqual(getCheckerForInstancesOf(type(page)).permission_id(
+            '__call__'), 'zope.ManageSite')
+        pages = component.getMultiAdapter((ob, request), name='pages')
+        self.assertEqual(pages.publishTraverse(request, 'index.html')(),
+                         'index')
+        self.assertEqual(pages.browserDefault(request),
+                         (pages, ('index.html',)))
+        items = dict(component.getAdapters((ob, request), test_menu))
+        self.assertEqual(sorted(items), ['Filtered', 'Page'])
+        self.assertEqual(str(items['Filtered'].filter),
+                         'Python expression "( True)"')
+        self.assertTrue(IBrowserMenuItem.providedBy(items['Page']))
+
+    def test_views_replayed(self):
+        with open(os.path.join(self.tmp, 'page.pt'), 'w') as f:
+            f.write('<p>page</p>\n')
+        with open(self.zcml, 'w') as f:
+            f.write(VIEWS_CONFIGURATION.format(module=__name__))
+        self.assertFalse(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+        self.assertIsNone(configcache.cacheStatus(self.cache))
+        self._views()
+
+        component.getGlobalSiteManager().__init__('base')
+        self.assertTrue(
+            configcache.loadConfiguration(self.zcml, cache=self.cache))
+        self._views()
+
+    def test_without_cache(self):
+        self.assertFalse(configcache.loadConfiguration(self.zcml))
+        self.assertIsNotNone(self._vocabulary())
+        self.assertIsNone(configcache.cacheStatus(self.cache))
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
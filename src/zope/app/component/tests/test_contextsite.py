@@ -0,0 +1,93 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import asyncio
+import concurrent.futures
+import unittest
+
+from zope.component import hooks
+
+from zope.app.component import contextsite
+from zope.app.component import testing
+
+
+class TestContextSite(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp(site=True)
+        self.other = self.folder1
+        testing.createSiteManager(self.other)
+        hooks.setSite(self.rootFolder)
+        contextsite.useContextSites()
+
+    def tearDown(self):
+        contextsite.useThreadSites()
+        hooks.setSite()
+        super().tearDown()
+
+    def test_switch(self):
+        self.assertIsInstance(hooks.siteinfo, contextsite.ContextSiteInfo)
+        self.assertIs(hooks.getSite(), self.rootFolder)
+        self.assertIs(hooks.getSiteManager(),
+                      self.rootFolder.getSiteManager())
+        contextsite.useContextSites()
+        contextsite.useThreadSites()
+        self.assertNotIsInstance(hooks.siteinfo,
+                                 contextsite.ContextSiteInfo)
+        contextsite.useThreadSites()
+        with contextsite.site(self.other):
+            self.assertIs(hooks.getSite(), self.other)
+        self.assertIs(hooks.getSite(), self.rootFolder)
+
+    def test_site(self):
+        with contextsite.site(self.other):
+            self.assertIs(hooks.getSite(), self.other)
+            self.assertIs(hooks.getSiteManager(),
+                          self.other.getSiteManager())
+            hooks.setSite()
+        self.assertIs(hooks.getSite(), self.rootFolder)
+
+    def test_tasks(self):
+        seen = {}
+
+        async def work(site, name):
+            with contextsite.site(site):
+                await asyncio.sleep(0)
+                seen[name] = hooks.getSite()
+
+        async def main():
+            await asyncio.gather(work(self.other, 'other'),
+                                 work(None, 'none'))
+
+        asyncio.run(main())
+        self.assertEqual(seen, {'other': self.other, 'none': None})
+        self.assertIs(hooks.getSite(), self.rootFolder)
+
+    def test_executors(self):
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            self.assertIsNone(executor.submit(hooks.getSite).result())
+            with contextsite.site(self.other):
+                future = contextsite.submit(executor, hooks.getSite)
+            self.assertIs(future.result(), self.other)
+
+            async def main():
+                with contextsite.site(self.other):
+                    return await contextsite.runInExecutor(
+                        asyncio.get_running_loop(), executor, hooks.getSite)
+
+            self.assertIs(asyncio.run(main()), self.other)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
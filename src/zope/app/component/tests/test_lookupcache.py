@@ -0,0 +1,157 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import unittest
+
+from zope.component import _api
+from zope.component import hooks
+
+from zope import component
+from zope import interface
+from zope.app.component import lookupcache
+from zope.app.component import stats
+from zope.app.component import testing
+
+
+class IFoo(interface.Interface):
+    pass
+
+
+class IBar(interface.Interface):
+    pass
+
+
+@interface.implementer(IFoo)
+class Foo:
+    pass
+
+
+@interface.implementer(IBar)
+@component.adapter(IFoo)
+class Bar:
+
+    def __init__(self, context):
+        self.context = context
+
+
+@interface.implementer(IBar)
+@component.adapter(IFoo)
+class LocalBar(Bar):
+    pass
+
+
+class TestLookupCache(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp(site=True)
+        hooks.setHooks()
+        self.cache = lookupcache.install(maxsize=2)
+
+    def tearDown(self):
+        lookupcache.uninstall()
+        hooks.resetHooks()
+        hooks.setSite()
+        super().tearDown()
+
+    def test_cached(self):
+        foo = Foo()
+        self.assertIsNone(IBar(foo, None))
+        component.provideAdapter(Bar)
+        self.assertIsInstance(IBar(foo), Bar)
+        self.assertIs(IBar(foo).context, foo)
+        self.assertEqual(self.cache.stats(),
+                         {'hits': 1, 'misses': 2, 'size': 1, 'maxsize': 2})
+
+    def test_invalidated_by_local_changes(self):
+        component.provideAdapter(Bar)
+        foo = Foo()
+        sm = testing.createSiteManager(self.folder1, setsite=True)
+        registry = sm.adapters
+        spec = interface.providedBy(foo)
+        lookup = self.cache.lookup
+        self.assertIs(lookup(registry, spec, IBar), Bar)
+        sm.registerAdapter(LocalBar)
+        self.assertIs(type(IBar(foo)), LocalBar)
+        self.assertIs(lookup(registry, spec, IBar), LocalBar)
+        sm.unregisterAdapter(LocalBar)
+        self.assertIs(lookup(registry, spec, IBar), Bar)
+
+        # Each site has its own entries
+        self.assertIs(lookup(registry.__bases__[0], spec, IBar), Bar)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_invalidated_by_base_changes(self):
+        foo = Foo()
+        sm = testing.createSiteManager(self.folder1, setsite=True)
+        spec = interface.providedBy(foo)
+        self.assertIsNone(self.cache.lookup(sm.adapters, spec, IBar))
+        component.provideAdapter(Bar)
+        self.assertIs(self.cache.lookup(sm.adapters, spec, IBar), Bar)
+
+    def test_super(self):
+        component.provideAdapter(Bar)
+
+        class SubFoo(Foo):
+            def adapted(self):
+                return IBar(super())
+
+        foo = SubFoo()
+        self.assertIs(foo.adapted().context, foo)
+
+    def test_bounded(self):
+        registry = component.getSiteManager().adapters
+        for name in ('a', 'b', 'c', 'a'):
+            self.cache.lookup(registry, IFoo, IBar, name)
+        self.assertEqual(self.cache.stats()['size'], 2)
+        self.assertEqual(self.cache.misses, 4)
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(),
+                         {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2})
+
+    def test_registries_unchanged(self):
+        from zope.interface.adapter import BaseAdapterRegistry
+        self.assertEqual(BaseAdapterRegistry.changed.__module__,
+                         'zope.interface.adapter')
+
+    def test_uninstall(self):
+        lookupcache.uninstall()
+        self.assertIs(_api.adapter_hook.implementation, hooks.adapter_hook)
+        lookupcache.uninstall()
+        self.assertIs(_api.adapter_hook.implementation, hooks.adapter_hook)
+
+    def test_uninstall_below_sampler(self):
+        component.provideAdapter(Bar)
+        sampler = stats.install()
+        self.assertEqual(sampler.hook, self.cache.adapter_hook)
+        lookupcache.uninstall()
+        self.assertEqual(_api.adapter_hook.implementation,
+                         sampler.adapter_hook)
+        self.assertIs(sampler.hook, hooks.adapter_hook)
+        IBar(Foo())
+        self.assertEqual(sampler.stats()[0]['calls'], 1)
+        self.assertEqual(self.cache.misses, 0)
+        stats.uninstall()
+        self.assertIs(_api.adapter_hook.implementation, hooks.adapter_hook)
+
+    def test_uninstall_replaced(self):
+        def hook(interface, object, name='', default=None):
+            return default  # pragma: no cover
+
+        _api.adapter_hook.sethook(hook)
+        lookupcache.uninstall()
+        self.assertIs(_api.adapter_hook.implementation, hook)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
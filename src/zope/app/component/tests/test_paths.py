@@ -0,0 +1,130 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+import unittest
+
+import transaction
+from zope.location.interfaces import LocationError
+from zope.publisher.browser import TestRequest
+from zope.traversing.interfaces import ITraversable
+
+from zope import component
+from zope.app.component import paths
+from zope.app.component import testing
+
+
+class CountingTraversable:
+
+    def __init__(self, traversable, names):
+        self.traversable = traversable
+        self.names = names
+
+    def __call__(self, ob):
+        adapter = self.traversable(ob)
+        names = self.names
+
+        class Counting:
+            def traverse(self, name, furtherPath):
+                names.append(name)
+                return adapter.traverse(name, furtherPath)
+        return Counting()
+
+
+class TestPathResolver(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp(folders=True)
+        # Traverse to the places before counting
+        self.places = (self.folder1, self.folder1_1, self.folder1_1_1,
+                       self.folder1_2, self.folder2)
+        self.names = []
+        traversable = component.getSiteManager().adapters.lookup(
+            (testing.ISimpleReadContainer,), ITraversable)
+        component.provideAdapter(
+            CountingTraversable(traversable, self.names),
+            (testing.ISimpleReadContainer,), ITraversable)
+
+    def test_resolve(self):
+        resolver = paths.PathResolver(self.rootFolder)
+        self.assertIs(resolver.resolve('/'), self.rootFolder)
+        self.assertIs(resolver.resolve('/folder1/folder1_1/folder1_1_1'),
+                      self.folder1_1_1)
+        self.assertIs(resolver.resolve('/folder1/folder1_1/'),
+                      self.folder1_1)
+        self.assertEqual(self.names, ['folder1', 'folder1_1', 'folder1_1_1'])
+
+    def test_resolve_many_shares_prefixes(self):
+        resolver = paths.PathResolver(self.rootFolder)
+        found = resolver.resolveMany([
+            '/folder1/folder1_1/folder1_1_1',
+            '/folder1/folder1_1/folder1_1_2',
+            '/folder1/folder1_2',
+            '/folder1/folder1_1/folder1_1_1',
+        ])
+        self.assertEqual(found, [
+            self.folder1_1_1, self.folder1_1['folder1_1_2'],
+            self.folder1_2, self.folder1_1_1])
+        self.assertEqual(self.names, [
+            'folder1', 'folder1_1', 'folder1_1_1', 'folder1_1_2',
+            'folder1_2'])
+
+    def test_missing(self):
+        resolver = paths.PathResolver(self.rootFolder)
+        self.assertRaises(LocationError, resolver.resolve,
+                          '/folder1/missing/folder')
+        self.assertIsNone(resolver.resolve('/folder1/missing', None))
+        self.assertIs(resolver.resolve('/folder1'), self.folder1)
+        self.assertEqual(self.names, ['folder1', 'missing', 'missing'])
+
+    def test_relative_paths_not_remembered(self):
+        resolver = paths.PathResolver(self.rootFolder)
+        self.assertIs(resolver.resolve('folder1/../folder2'), self.folder2)
+        self.assertIs(resolver.resolve('/folder1/./folder1_1'),
+                      self.folder1_1)
+        self.assertEqual(resolver._objects, {(): self.rootFolder})
+
+    def test_clear(self):
+        resolver = paths.PathResolver(self.rootFolder)
+        folder1 = resolver.resolve('/folder1')
+        del self.rootFolder['folder1']
+        self.assertIs(resolver.resolve('/folder1'), folder1)
+        resolver.clear()
+        self.assertIsNone(resolver.resolve('/folder1', None))
+
+    def test_request_resolver(self):
+        request = TestRequest()
+        resolver = paths.requestPathResolver(request, self.rootFolder)
+        self.assertIs(resolver.request, request)
+        self.assertIs(paths.requestPathResolver(request, self.rootFolder),
+                      resolver)
+        other = paths.requestPathResolver(request, self.folder1)
+        self.assertIsNot(other, resolver)
+        self.assertIs(other.root, self.folder1)
+
+    def test_transaction_resolver(self):
+        transaction.begin()
+        try:
+            resolver = paths.transactionPathResolver(self.rootFolder)
+            self.assertIs(paths.transactionPathResolver(self.rootFolder),
+                          resolver)
+            self.assertIsNot(paths.transactionPathResolver(self.folder1),
+                             resolver)
+        finally:
+            transaction.abort()
+        self.assertIsNot(paths.transactionPathResolver(self.rootFolder),
+                         resolver)
+        transaction.abort()
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
@@ -0,0 +1,227 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import unittest
+
+from zope.component.testing import PlacelessSetup
+from zope.interface.interfaces import IRegistrationEvent
+from zope.interface.registry import Components
+
+from zope import component
+from zope import interface
+from zope.app.component import registrations
+
+
+class IFoo(interface.Interface):
+    pass
+
+
+class IBar(interface.Interface):
+    pass
+
+
+@interface.implementer(IFoo)
+class Foo:
+    pass
+
+
+class Bar(Foo):
+    pass
+
+
+def handler(event):
+    raise AssertionError("Not called")  # pragma: no cover
+
+
+class TestRegistrationIndex(PlacelessSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        component.provideHandler(registrations.registrationChanged)
+        self.registry = Components('test')
+
+    def _index(self):
+        return registrations.getRegistrationIndex(self.registry)
+
+    def test_registrations_for(self):
+        foo = Foo()
+        self.registry.registerUtility(foo, IFoo, 'one', 'first')
+        self.registry.registerUtility(Foo(), IFoo, 'two')
+        self.registry.registerAdapter(Foo, (IBar,), IFoo)
+        self.registry.registerSubscriptionAdapter(Foo, (IBar,), IFoo)
+        self.registry.registerHandler(handler, (IBar,))
+
+        index = self._index()
+        found = index.registrationsFor(foo)
+        self.assertEqual(len(found), 1)
+        self.assertIs(found[0].component, foo)
+        self.assertEqual(found[0].info, 'first')
+        self.assertEqual(
+            sorted(registrations.registrationKind(r)
+                   for r in index.registrationsFor(Foo)),
+            ['adapter', 'subscriber'])
+        self.assertEqual(len(index.registrationsFor(handler)), 1)
+        self.assertEqual(index.registrationsFor(object()), [])
+
+    def test_kept_in_sync_by_events(self):
+        index = self._index()
+        foo = Foo()
+        self.registry.registerUtility(foo, IFoo)
+        self.assertTrue(index.current(self.registry))
+        self.assertEqual(len(index.registrationsFor(foo)), 1)
+
+        self.registry.registerAdapter(Foo, (IBar,), IFoo, info='old')
+        self.registry.registerAdapter(Foo, (IBar,), IFoo, info='new')
+        self.assertTrue(index.current(self.registry))
+        [reg] = index.registrationsFor(Foo)
+        self.assertEqual(reg.info, 'new')
+
+        self.registry.unregisterUtility(foo, IFoo)
+        self.registry.unregisterAdapter(Foo, (IBar,), IFoo)
+        self.assertTrue(index.current(self.registry))
+        self.assertEqual(index.registrationsFor(foo), [])
+        self.assertEqual(index.registrationsFor(Foo), [])
+        self.assertIs(self._index(), index)
+
+    def test_rebuilt_after_silent_changes(self):
+        index = self._index()
+        foo = Foo()
+        self.registry.registerUtility(foo, IFoo, event=False)
+        self.assertFalse(index.current(self.registry))
+        self.assertEqual(len(self._index().registrationsFor(foo)), 1)
+
+        self.registry.registerSubscriptionAdapter(Foo, (IBar,), IFoo)
+        self.registry.unregisterSubscriptionAdapter(
+            required=(IBar,), provided=IFoo)
+        self.assertFalse(index.current(self.registry))
+        self.assertEqual(self._index().registrationsFor(Foo), [])
+
+    def test_current_after_bulk_changes(self):
+        foo = Foo()
+        self.registry.registerUtility(foo, IFoo, 'a')
+        self.registry.registerUtility(foo, IFoo, 'b')
+        index = self._index()
+        registrations.unregisterUtilities(self.registry, [(foo, IFoo, 'a')])
+        self.assertTrue(index.current(self.registry))
+        registrations.registerUtilities(self.registry, [(foo, IFoo, 'c', '')])
+        self.assertTrue(index.current(self.registry))
+        self.assertEqual(sorted(r.name for r in index.registrationsFor(foo)),
+                         ['b', 'c'])
+
+        # Changes without events inside the block still make it stale
+        with registrations.bulkChanges(self.registry):
+            self.registry.registerUtility(foo, IFoo, 'd', event=False)
+        self.assertFalse(index.current(self.registry))
+
+    def test_replaced_without_events_in_bulk_changes(self):
+        self.registry.registerAdapter(Foo, (IBar,), IFoo, 'n')
+        self._index()
+        component.getGlobalSiteManager().unregisterHandler(
+            registrations.registrationChanged)
+        with registrations.bulkChanges(self.registry):
+            self.registry.registerAdapter(Bar, (IBar,), IFoo, 'n')
+        self.assertEqual(self._index().registrationsFor(Foo), [])
+        self.assertEqual(len(self._index().registrationsFor(Bar)), 1)
+
+    def test_kind(self):
+        self.assertRaises(TypeError, registrations.registrationKind, None)
+
+    def test_sort_key(self):
+        foo = Foo()
+        self.registry.registerUtility(foo, IFoo, 'b')
+        self.registry.registerUtility(foo, IFoo, 'a')
+        self.registry.registerUtility(foo, IBar)
+        self.registry.registerHandler(handler, (IFoo,))
+        self.registry.registerAdapter(Foo, (IBar,), IFoo)
+        ordered = sorted(registrations.iterRegistrations(self.registry),
+                         key=registrations.sortKey)
+        self.assertEqual(
+            [(registrations.registrationKind(r), r.name) for r in ordered],
+            [('utility', ''), ('utility', 'a'), ('utility', 'b'),
+             ('adapter', ''), ('handler', '')])
+
+
+class TestBulkRegistration(PlacelessSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.events = []
+        component.provideHandler(self.events.append, (IRegistrationEvent,))
+        self.registry = Components('test')
+
+    def _subregistry(self):
+        # A registry based on self.registry, and the number of times its
+        # utility lookup caches were invalidated
+        sub = Components('sub', bases=(self.registry,))
+        generation = sub.utilities._generation
+        return lambda: sub.utilities._generation - generation
+
+    def test_register_utilities(self):
+        invalidations = self._subregistry()
+        foos = [Foo() for i in range(3)]
+        self.assertIsNone(self.registry.queryUtility(IFoo, '2'))
+        with registrations.bulkChanges(self.registry):
+            count = registrations.registerUtilities(
+                self.registry,
+                [(foo, IFoo, str(i), 'bulk') for i, foo in enumerate(foos)])
+            # Nested blocks are fine; the lookup caches are outdated
+            self.assertIsNone(self.registry.queryUtility(IFoo, '2'))
+            self.assertEqual(invalidations(), 0)
+        self.assertEqual(count, 3)
+        self.assertEqual(invalidations(), 1)
+        self.assertIs(self.registry.getUtility(IFoo, '2'), foos[2])
+        self.assertEqual([e.object.name for e in self.events],
+                         ['0', '1', '2'])
+        self.assertEqual([e.object.info for e in self.events],
+                         ['bulk'] * 3)
+
+        # Registering the same utilities again does nothing
+        self.assertEqual(
+            registrations.registerUtilities(
+                self.registry, [(foos[0], IFoo, '0', 'bulk')]),
+            0)
+        self.assertRaises(TypeError, registrations.registerUtilities,
+                          self.registry, [(foos[0], None, '', '')])
+
+    def test_register_utilities_without_events(self):
+        registrations.registerUtilities(
+            self.registry, [(Foo(), IFoo, '', '')], event=False)
+        self.assertEqual(self.events, [])
+        self.assertIsNotNone(self.registry.queryUtility(IFoo))
+
+    def test_unregister_utilities(self):
+        foo = Foo()
+        registrations.registerUtilities(
+            self.registry, [(foo, IFoo, 'a', ''), (foo, IFoo, 'b', '')])
+        invalidations = self._subregistry()
+        count = registrations.unregisterUtilities(
+            self.registry,
+            [(foo, IFoo, 'a'), (None, IFoo, 'b'), (None, IFoo, 'c')])
+        self.assertEqual(count, 2)
+        self.assertEqual(invalidations(), 1)
+        self.assertEqual(list(self.registry.getUtilitiesFor(IFoo)), [])
+
+    def test_no_changes(self):
+        invalidations = self._subregistry()
+        generation = self.registry.utilities._generation
+        with registrations.bulkChanges(self.registry):
+            self.registry.queryUtility(IFoo)
+        self.assertEqual(invalidations(), 0)
+        self.assertEqual(self.registry.utilities._generation, generation)
+        self.assertNotIsInstance(self.registry.utilities._v_lookup,
+                                 registrations._DeferredLookup)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
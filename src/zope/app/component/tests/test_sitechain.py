@@ -0,0 +1,72 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+import unittest
+
+from zope.site.folder import Folder
+
+from zope import component
+from zope.app.component import sitechain
+from zope.app.component import testing
+
+
+class TestSiteManagerChains(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.root = testing.buildFolderTree(3, 2, site_levels=(0, 2))
+        self.folder1 = self.root['folder1']
+        self.site = self.folder1['folder1_1']
+        self.chains = sitechain.SiteManagerChains()
+
+    def test_chain(self):
+        deep = self.site['folder1_1_1']
+        self.assertEqual(self.chains.chain(deep), (
+            self.site.getSiteManager(), self.root.getSiteManager()))
+        self.assertEqual(self.chains.chain(self.folder1),
+                         (self.root.getSiteManager(),))
+        self.assertEqual(self.chains.chain(Folder()), ())
+
+    def test_next_site_manager(self):
+        self.assertIs(self.chains.nextSiteManager(self.site),
+                      self.root.getSiteManager())
+        self.assertIs(self.chains.nextSiteManager(self.root),
+                      component.getGlobalSiteManager())
+        self.assertIs(self.chains.nextSiteManager(Folder()),
+                      component.getGlobalSiteManager())
+
+    def test_remembered(self):
+        folder = self.folder1['plain'] = Folder()
+        root_sm = self.root.getSiteManager()
+        self.assertEqual(self.chains.chain(folder), (root_sm,))
+        # Not looked up again until told about the new site
+        sm = testing.createSiteManager(self.folder1)
+        self.assertEqual(self.chains.chain(folder), (root_sm,))
+        self.chains.siteMade(self.folder1)
+        self.assertEqual(self.chains.chain(self.folder1), (sm, root_sm))
+        self.assertIs(self.chains.nextSiteManager(folder), sm)
+
+    def test_site_moved(self):
+        deep = self.site['folder1_1_1']
+        self.chains.chain(deep)
+        target = self.root['folder2']['folder2_1']
+        target['moved'] = self.site
+        del self.folder1['folder1_1']
+        self.chains.siteMoved(self.site)
+        self.assertEqual(self.chains.chain(deep), (
+            self.site.getSiteManager(), target.getSiteManager(),
+            self.root.getSiteManager()))
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
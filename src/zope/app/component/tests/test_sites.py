@@ -0,0 +1,117 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+import unittest
+from unittest import mock
+
+import zope.site.site
+from zope.component.interfaces import ISite
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+from zope.site.folder import Folder
+from zope.site.interfaces import IFolder
+from zope.site.interfaces import INewLocalSite
+
+from zope import component
+from zope.app.component import sites
+from zope.app.component import testing
+
+
+class TestMakeSites(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.root = testing.buildFolderTree(2, 2)
+        testing.createSiteManager(self.root['folder1'])
+        self.events = []
+        component.provideHandler(self._newSite, (INewLocalSite,))
+        component.provideAdapter(LocationCopyHook, (ILocation,))
+
+    def _newSite(self, event):
+        self.events.append(event.manager)
+
+    def test_possible_sites(self):
+        names = [f.__name__ for f in sites.possibleSites(self.root)]
+        self.assertEqual(names, [
+            'folder2', 'folder1_1', 'folder1_2', 'folder2_1', 'folder2_2'])
+
+    def test_make_sites(self):
+        folders = list(sites.possibleSites(self.root))
+        managers = sites.makeSites(reversed(folders + [self.root['folder1']]))
+        self.assertEqual([sm.__parent__.__name__ for sm in managers], [
+            'folder2', 'folder2_2', 'folder2_1', 'folder1_2', 'folder1_1'])
+        self.assertEqual(self.events, managers)
+
+        site1 = self.root['folder1'].getSiteManager()
+        site2 = self.root['folder2'].getSiteManager()
+        self.assertEqual(
+            self.root['folder1']['folder1_2'].getSiteManager().__bases__,
+            (site1,))
+        self.assertEqual(
+            self.root['folder2']['folder2_1'].getSiteManager().__bases__,
+            (site2,))
+        self.assertEqual(site2.__bases__,
+                         (component.getGlobalSiteManager(),))
+        self.assertEqual(list(site2.keys()), ['default'])
+        self.assertIs(site2.__parent__, self.root['folder2'])
+        self.assertEqual(site1.subs, (
+            self.root['folder1']['folder1_2'].getSiteManager(),
+            self.root['folder1']['folder1_1'].getSiteManager()))
+
+    def test_events_sent_as_sites_are_made(self):
+        folders = list(sites.possibleSites(self.root))
+        made = []
+        component.provideHandler(
+            lambda event: made.append(sum(map(ISite.providedBy, folders))),
+            (INewLocalSite,))
+        sites.makeSites(folders)
+        self.assertEqual(made, [1, 2, 3, 4, 5])
+
+    def test_bases_resolved_once(self):
+        # The bases aren't looked up by walking up from every folder
+        find = mock.Mock(wraps=zope.site.site._findNextSiteManager)
+        with mock.patch('zope.site.site._findNextSiteManager', find):
+            sites.makeSites(sites.possibleSites(self.root))
+        self.assertEqual(
+            [call for call in find.call_args_list if call.args[0]], [])
+
+    def test_template(self):
+        template = self.root['folder1'].getSiteManager()
+        template['default']['util'] = util = Folder()
+        template.registerUtility(util, IFolder, 'util', 'seeded')
+        template.registerUtility(self.root['folder1'], IFolder, 'site')
+        sub = self.root['folder1']['folder1_1']
+        managers = sites.makeSites([sub], template)
+        sm = managers[0]
+        copied = sm['default']['util']
+        self.assertIsNot(copied, util)
+        self.assertIs(sm.getUtility(IFolder, 'util'), copied)
+        self.assertIs(sm.getUtility(IFolder, 'site'), sub)
+        self.assertEqual(
+            [r.info for r in sm.registeredUtilities() if r.name == 'util'],
+            ['seeded'])
+
+    def test_template_missing_component(self):
+        template = self.root['folder1'].getSiteManager()
+        template.registerUtility(self.root['folder1']['folder1_1'], IFolder)
+        with self.assertRaises(LookupError):
+            sites.makeSites(
+                [self.root['folder1']['folder1_2'], self.root['folder2']],
+                template)
+        # No site was made
+        self.assertEqual(self.events, [])
+        self.assertFalse(ISite.providedBy(self.root['folder2']))
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
@@ -0,0 +1,188 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import json
+import sys
+import unittest
+
+from zope.interface.interfaces import IRegistrationEvent
+from zope.site.folder import Folder
+from zope.site.interfaces import IFolder
+
+from zope import component
+from zope import interface
+from zope.app.component import snapshot
+from zope.app.component import testing
+
+
+class IFoo(interface.Interface):
+    pass
+
+
+@interface.implementer(IFoo)
+@component.adapter(IFolder)
+class FolderFoo:
+
+    def __init__(self, context):
+        self.context = context
+
+
+@component.adapter(Folder)
+def handler(folder):
+    raise AssertionError("Not called")  # pragma: no cover
+
+
+class TestSnapshot(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp(site=True)
+        self.site = self.folder1
+        self.sm = testing.createSiteManager(self.site)
+        self.tool = self.sm['default']['tool'] = Folder()
+        self.sm.registerUtility(self.tool, IFolder, 'tool', 'the tool')
+        self.sm.registerUtility(self.folder2, IFolder, 'outside')
+        self.sm.registerAdapter(FolderFoo, name='foo')
+        self.sm.registerSubscriptionAdapter(FolderFoo)
+        self.sm.registerHandler(handler)
+
+    def _clone(self):
+        clone = self.rootFolder['clone'] = Folder()
+        sm = testing.createSiteManager(clone)
+        tool = sm['default']['tool'] = Folder()
+        return sm, tool
+
+    def test_export(self):
+        lines = list(snapshot.exportRegistrations(self.sm))
+        self.assertTrue(all(line.endswith('\n') for line in lines))
+        header, records = json.loads(lines[0]), [
+            json.loads(line) for line in lines[1:]]
+        self.assertEqual(header, {'format': snapshot.FORMAT, 'version': 1})
+        self.assertEqual(len(records), 5)
+        by_name = {r['name']: r for r in records if r['kind'] == 'utility'}
+        self.assertEqual(by_name['tool'], {
+            'kind': 'utility', 'provided': 'zope.site.interfaces.IFolder',
+            'name': 'tool', 'info': 'the tool',
+            'component': {'path': '++etc++site/default/tool'}})
+        self.assertEqual(by_name['outside']['component'],
+                         {'path': '/folder2'})
+        [handler_record] = [r for r in records if r['kind'] == 'handler']
+        self.assertEqual(handler_record['required'],
+                         ['class:zope.site.folder.Folder'])
+        self.assertEqual(
+            handler_record['factory'],
+            {'global': 'zope.app.component.tests.test_snapshot.handler'})
+
+    def test_export_unreferenceable(self):
+        self.sm.registerUtility(Folder(), IFolder, 'unlocated')
+        self.assertRaises(ValueError, list,
+                          snapshot.exportRegistrations(self.sm))
+
+    def test_load(self):
+        events = []
+        component.provideHandler(events.append, (IRegistrationEvent,))
+        sm, tool = self._clone()
+        count = snapshot.loadRegistrations(
+            sm, snapshot.exportRegistrations(self.sm), trusted=True)
+        self.assertEqual(count, 5)
+        self.assertEqual(len(events), 5)
+        self.assertIs(sm.getUtility(IFolder, 'tool'), tool)
+        self.assertIs(sm.getUtility(IFolder, 'outside'), self.folder2)
+        self.assertEqual(
+            [r.info for r in sm.registeredUtilities() if r.name == 'tool'],
+            ['the tool'])
+        self.assertIsInstance(sm.queryAdapter(tool, IFoo, 'foo'), FolderFoo)
+        self.assertEqual(len(list(sm.registeredSubscriptionAdapters())), 1)
+        self.assertEqual(len(list(sm.registeredHandlers())), 1)
+
+    def test_load_invalid(self):
+        sm, tool = self._clone()
+        self.assertRaises(ValueError, snapshot.loadRegistrations, sm, [])
+        self.assertRaises(ValueError, snapshot.loadRegistrations, sm,
+                          ['{"format": "other"}'])
+        self.assertRaises(ValueError, snapshot.loadRegistrations, sm,
+                          ['{"format": "%s", "version": 2}'
+                           % snapshot.FORMAT])
+        lines = list(snapshot.exportRegistrations(self.sm))
+        del sm['default']['tool']
+        self.assertRaises(LookupError, snapshot.loadRegistrations, sm, lines)
+        self.assertEqual(list(sm.registeredUtilities()), [])
+
+    def _load(self, *records):
+        if 'clone' not in self.rootFolder:
+            self._clone()
+        sm = self.rootFolder['clone'].getSiteManager()
+        header = json.dumps({'format': snapshot.FORMAT, 'version': 1})
+        return snapshot.loadRegistrations(
+            sm, [header] + [json.dumps(r) for r in records])
+
+    def test_load_malformed(self):
+        record = {'kind': 'utility', 'provided': IFolder.__identifier__,
+                  'name': '', 'info': '', 'component': {'path': ''}}
+        self.assertEqual(self._load(record), 1)
+        for malformed in ([], dict(record, name=None),
+                          dict(record, component=''),
+                          dict(record, component={'path': 1}),
+                          {'kind': 'handler', 'name': '', 'info': '',
+                           'required': 'zope.site.interfaces.IFolder',
+                           'factory': {'global': 'os.system'}}):
+            self.assertRaises(ValueError, self._load, record, malformed)
+
+    def test_load_restricted_globals(self):
+        record = {'kind': 'adapter', 'required': [IFolder.__identifier__],
+                  'provided': IFoo.__identifier__, 'name': '', 'info': '',
+                  'factory': {'global': 'os.system'}}
+        # Functions that aren't declared to be components
+        self.assertRaises(ValueError, self._load, record)
+        self.assertEqual(self._load(dict(record, factory={
+            'global': __name__ + '.FolderFoo'})), 1)
+        # Modules that aren't imported aren't imported
+        self.assertNotIn('xml.dom.pulldom', sys.modules)
+        self.assertRaises(LookupError, self._load, dict(record, factory={
+            'global': 'xml.dom.pulldom.parse'}))
+        self.assertNotIn('xml.dom.pulldom', sys.modules)
+        # Required and provided specifications are classes and interfaces
+        self.assertRaises(ValueError, self._load, dict(
+            record, required=['os.system']))
+        self.assertRaises(ValueError, self._load, dict(
+            record, required=['class:os.system']))
+        self.assertRaises(ValueError, self._load, dict(
+            record, provided='zope.site.folder.Folder'))
+
+    def test_load_restricted_paths(self):
+        self._clone()
+        record = {'kind': 'utility', 'provided': IFolder.__identifier__,
+                  'name': '', 'info': ''}
+        for path in ('', '++etc++site/default/tool'):
+            self.assertEqual(
+                self._load(dict(record, component={'path': path})), 1)
+        for path in ('/folder2', '../folder2', '++etc++site/../../folder2',
+                     '++etc++site/default/./tool', '++etc++site/default/',
+                     '++etc++site/default/++etc++site', '@@absolute_url',
+                     '++resource++x', '++etc++site/++etc++site'):
+            self.assertRaises(ValueError, self._load,
+                              dict(record, component={'path': path}))
+
+    def test_load_trusted(self):
+        sm, tool = self._clone()
+        lines = [json.dumps({'format': snapshot.FORMAT, 'version': 1}),
+                 json.dumps({'kind': 'handler', 'required': [],
+                             'name': '', 'info': '',
+                             'factory': {'global': 'os.getcwd'}})]
+        self.assertRaises(ValueError, snapshot.loadRegistrations, sm, lines)
+        self.assertEqual(
+            snapshot.loadRegistrations(sm, lines, trusted=True), 1)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
@@ -0,0 +1,158 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+import unittest
+
+from zope.component import _api
+from zope.component import hooks
+from zope.site.interfaces import IFolder
+
+from zope import component
+from zope import interface
+from zope.app.component import lookupcache
+from zope.app.component import stats
+from zope.app.component import testing
+
+
+class IFoo(interface.Interface):
+    pass
+
+
+class IBar(interface.Interface):
+    pass
+
+
+@interface.implementer(IFoo)
+class Foo:
+    pass
+
+
+@interface.implementer(IBar)
+@component.adapter(IFoo)
+class Bar:
+
+    def __init__(self, context):
+        self.context = context
+
+
+def handler(event):
+    pass  # pragma: no cover
+
+
+class TestRegistrationStats(testing.PlacefulSetup, unittest.TestCase):
+
+    def test_counts(self):
+        sm = super().setUp(site=True)
+        sm.registerUtility(self.folder1, IFolder, 'one')
+        sm.registerUtility(self.folder1, IFolder, 'two')
+        sm.registerUtility(self.folder1, IFoo)
+        sm.registerAdapter(Bar)
+        sm.registerHandler(handler, (IFoo,))
+        result = stats.registrationStats(sm)
+        self.assertEqual(result['kinds'], {
+            'utility': 3, 'adapter': 1, 'subscriber': 0, 'handler': 1})
+        self.assertEqual(list(result['provided'].items()), [
+            (IFolder.__identifier__, 2), (IBar.__identifier__, 1),
+            (IFoo.__identifier__, 1)])
+        self.assertEqual(set(result['caches']), {'adapters', 'utilities'})
+
+    def test_cache_sizes(self):
+        class Lookup:
+            _cache = {IFoo: {'': 1, 'a': 2}}
+            _mcache = {}
+            _scache = {IFoo: {IBar: 3}}
+
+        class Registry:
+            _v_lookup = Lookup()
+
+        self.assertEqual(stats.cacheSizes(Registry()),
+                         {'lookup': 2, 'multi': 0, 'subscriptions': 1})
+        del Lookup._mcache
+        self.assertIsNone(stats.cacheSizes(Registry()))
+
+
+class TestLookupSampler(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp(site=True)
+        hooks.setHooks()
+        component.provideAdapter(Bar)
+        self.sampler = stats.install(rate=2)
+
+    def tearDown(self):
+        stats.uninstall()
+        lookupcache.uninstall()
+        hooks.resetHooks()
+        hooks.setSite()
+        super().tearDown()
+
+    def test_counted(self):
+        self.assertIs(stats.installedSampler(), self.sampler)
+        foo = Foo()
+        for i in range(3):
+            self.assertIs(IBar(foo).context, foo)
+        self.assertIsNone(_api.adapter_hook(IBar, foo, 'missing'))
+        self.assertEqual(self.sampler.stats(), [
+            {'site': '/', 'provided': IBar.__identifier__, 'name': '',
+             'calls': 3,
+             'hits': 3, 'timed': 1,
+             'mean': self.sampler.stats()[0]['mean'],
+             'slowest': self.sampler.stats()[0]['slowest']},
+            {'site': '/', 'provided': IBar.__identifier__,
+             'name': 'missing', 'calls': 1,
+             'hits': 0, 'timed': 1,
+             'mean': self.sampler.stats()[1]['mean'],
+             'slowest': self.sampler.stats()[1]['slowest']},
+        ])
+        self.assertGreater(self.sampler.stats()[0]['mean'], 0)
+        self.sampler.clear()
+        self.assertEqual(self.sampler.stats(), [])
+
+    def test_per_site_manager(self):
+        foo = Foo()
+        IBar(foo)
+        sm = testing.createSiteManager(self.folder1, setsite=True)
+        IBar(foo)
+        IBar(foo)
+        hooks.setSite()
+        IBar(foo)
+
+        def adapted(stats):
+            return [(s['site'], s['calls']) for s in stats
+                    if s['provided'] == IBar.__identifier__]
+        self.assertEqual(adapted(self.sampler.stats()),
+                         [('/folder1', 2), ('/', 1), ('base', 1)])
+        self.assertEqual(adapted(self.sampler.stats(sm)),
+                         [('/folder1', 2)])
+
+    def test_uninstall(self):
+        stats.uninstall()
+        self.assertIsNone(stats.installedSampler())
+        self.assertIs(_api.adapter_hook.implementation, hooks.adapter_hook)
+        IBar(Foo())
+        self.assertEqual(self.sampler.stats(), [])
+
+    def test_chained(self):
+        stats.uninstall()
+        cache = lookupcache.install()
+        sampler = stats.install()
+        IBar(Foo())
+        self.assertEqual(sampler.stats()[0]['calls'], 1)
+        self.assertEqual(cache.misses, 1)
+        stats.uninstall()
+        self.assertEqual(_api.adapter_hook.implementation,
+                         cache.adapter_hook)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
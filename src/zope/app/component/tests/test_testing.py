@@ -14,8 +14,13 @@
 
 import unittest
 
+from zope.component.hooks import getSite
 from zope.component.interfaces import ISite
+from zope.site.folder import Folder
+from zope.site.interfaces import IFolder
+from zope.traversing.api import traverse
 
+from zope import component
 from zope.app.component import testing
 
 
@@ -46,6 +51,69 @@ class TestTesting(testing.PlacefulSetup,
         f2 = self.folder1
         self.assertIsNot(f1, f2)
 
+    def test_place_cached(self):
+        f1 = self.folder1_1
+        self.assertIs(self.folder1_1, f1)
+        self.assertIsNot(self.folder1_2, f1)
+
+        # Replaced folders are traversed again
+        del self.folder1['folder1_1']
+        new = self.folder1['folder1_1'] = Folder()
+        self.assertIs(self.folder1_1, new)
+
+    def test_build_folder_tree(self):
+        root = testing.buildFolderTree(3, 2, site_levels=(1, 3),
+                                       registrations=2)
+        self.assertEqual(sorted(root), ['folder1', 'folder2'])
+        leaf = root['folder2']['folder2_1']['folder2_1_2']
+        self.assertEqual(list(leaf), [])
+        self.assertFalse(ISite.providedBy(root))
+        self.assertTrue(ISite.providedBy(root['folder1']))
+        self.assertFalse(ISite.providedBy(root['folder1']['folder1_1']))
+        self.assertTrue(ISite.providedBy(leaf))
+
+        sm = leaf.getSiteManager()
+        self.assertIs(sm.getUtility(IFolder, 'utility1'), leaf)
+        self.assertIs(sm.__bases__[0], root['folder2'].getSiteManager())
+        self.assertIs(sm.__bases__[0].getUtility(IFolder, 'utility0'),
+                      root['folder2'])
+
+
+def _registerSample():
+    component.provideUtility(Folder(), IFolder, 'sample')
+
+
+class TestTestingSnapshot(TestTesting):
+
+    snapshot = testing.PlacefulSnapshot(_registerSample)
+
+    def test_registrations_restored(self):
+        gsm = component.getGlobalSiteManager()
+        sample = component.getUtility(IFolder, 'sample')
+        self.assertEqual(list(gsm.registeredUtilities()), [])
+        self.assertIs(traverse(self.rootFolder, 'folder1'), self.folder1)
+
+        # Registrations made by the tests don't change the snapshot
+        gsm.registerUtility(Folder(), IFolder, 'sample')
+        self.assertIsNot(component.getUtility(IFolder, 'sample'), sample)
+        gsm.unregisterUtility(provided=IFolder, name='sample')
+        self.assertIs(component.getUtility(IFolder, 'sample'), sample)
+        gsm.registerUtility(Folder(), IFolder, 'other')
+        self.tearDown()
+        self.setUp()
+        self.assertIsNone(component.queryUtility(IFolder, 'other'))
+        self.assertIs(component.getUtility(IFolder, 'sample'), sample)
+
+    def test_sample_folder_tree_copied(self):
+        root = self.rootFolder
+        self.assertIsNot(self.snapshot.sampleFolderTree(True), root)
+        self.assertIs(root['folder1'].__parent__, root)
+        sm = root.getSiteManager()
+        self.assertIs(sm.__parent__, root)
+        self.assertIs(getSite(), root)
+        self.assertFalse(
+            ISite.providedBy(self.snapshot.sampleFolderTree(False)))
+
 
 def test_suite():
     return unittest.defaultTestLoader.loadTestsFromName(__name__)
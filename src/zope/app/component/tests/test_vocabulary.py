@@ -0,0 +1,149 @@
+#############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+
+import unittest
+
+from zope.interface.registry import UtilityRegistration
+from zope.site.site import SiteManagerAdapter
+
+from zope import component
+from zope import interface
+from zope.app.component import testing
+from zope.app.component import vocabulary
+
+
+class IB(interface.Interface):
+    pass
+
+
+class IA(interface.Interface):
+    pass
+
+
+class IC(interface.Interface):
+    pass
+
+
+@interface.implementer(IB, IA)
+class Sample:
+    pass
+
+
+class TestCachedUtilityComponentInterfacesVocabulary(unittest.TestCase):
+
+    def _tokens(self, context):
+        return [term.token for term in
+                vocabulary.CachedUtilityComponentInterfacesVocabulary(context)]
+
+    def test_terms(self):
+        self.assertEqual(self._tokens(Sample()), [
+            __name__ + '.IA', __name__ + '.IB',
+            'zope.interface.Interface'])
+        ob = Sample()
+        voc = vocabulary.CachedUtilityComponentInterfacesVocabulary(ob)
+        self.assertIn(IA, voc)
+        self.assertIs(voc.getTermByToken(__name__ + '.IB').value, IB)
+
+    def test_cached(self):
+        self.assertIs(
+            vocabulary.CachedUtilityComponentInterfacesVocabulary(Sample()),
+            vocabulary.CachedUtilityComponentInterfacesVocabulary(Sample()))
+
+    def test_utility_registration(self):
+        registration = UtilityRegistration(None, IA, '', Sample(), '')
+        self.assertEqual(self._tokens(registration), self._tokens(Sample()))
+
+    def test_declarations_change(self):
+        class Other(Sample):
+            pass
+
+        self.assertNotIn(__name__ + '.IC', self._tokens(Other()))
+        interface.classImplements(Other, IC)
+        self.assertIn(__name__ + '.IC', self._tokens(Other()))
+
+        ob = Other()
+        interface.alsoProvides(ob, interface.Interface)
+        self.assertIn(__name__ + '.IC', self._tokens(ob))
+
+
+class ISampleUtility(interface.Interface):
+    pass
+
+
+class SampleVocabulary(vocabulary.CachedUtilityVocabulary):
+    interface = ISampleUtility
+
+
+class TestCachedUtilityVocabularies(testing.PlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp(folders=True)
+        self.one = Sample()
+        self.two = Sample()
+        component.provideUtility(self.one, ISampleUtility, 'one')
+        component.provideUtility(self.two, ISampleUtility, 'two')
+
+    def test_vocabulary(self):
+        voc = SampleVocabulary(None)
+        self.assertEqual([term.token for term in voc], ['one', 'two'])
+        self.assertEqual(len(voc), 2)
+        self.assertIn(self.two, voc)
+        self.assertNotIn(Sample(), voc)
+        self.assertIs(voc.getTerm(self.two).value, self.two)
+        self.assertIs(voc.getTermByToken('one').value, self.one)
+        self.assertRaises(LookupError, voc.getTerm, Sample())
+        self.assertRaises(LookupError, voc.getTermByToken, 'three')
+        names = vocabulary.CachedUtilityVocabulary(
+            None, interface=ISampleUtility, nameOnly=True)
+        self.assertEqual([term.value for term in names], ['one', 'two'])
+
+    def test_vocabulary_terms_reused(self):
+        term = SampleVocabulary(None).getTermByToken('one')
+        self.assertIs(SampleVocabulary(None).getTermByToken('one'), term)
+        component.provideUtility(Sample(), ISampleUtility, 'three')
+        voc = SampleVocabulary(None)
+        self.assertEqual(len(voc), 3)
+        self.assertIsNot(voc.getTermByToken('one'), term)
+
+    def test_vocabulary_per_site(self):
+        component.provideAdapter(SiteManagerAdapter)
+        sm = testing.createSiteManager(self.folder1)
+        local = Sample()
+        sm.registerUtility(local, ISampleUtility, 'local')
+        self.assertEqual(len(SampleVocabulary(self.folder1)), 3)
+        self.assertEqual(len(SampleVocabulary(self.folder2)), 2)
+        component.provideUtility(Sample(), ISampleUtility, 'three')
+        self.assertEqual(len(SampleVocabulary(self.folder1)), 4)
+        sm.unregisterUtility(local, ISampleUtility, 'local')
+        self.assertEqual(len(SampleVocabulary(self.folder1)), 3)
+
+    def test_names(self):
+        voc = vocabulary.CachedUtilityNames(ISampleUtility)
+        self.assertEqual(sorted(term.value for term in voc), ['one', 'two'])
+        self.assertIn('one', voc)
+        self.assertNotIn('three', voc)
+        term = voc.getTerm('one')
+        self.assertIs(voc.getTermByToken(term.token), term)
+        self.assertIs(vocabulary.CachedUtilityNames(
+            ISampleUtility).getTerm('one'), term)
+        self.assertRaises(ValueError, voc.getTerm, 'three')
+        self.assertRaises(LookupError, voc.getTermByToken, 'tdGhyZWU=')
+        component.provideUtility(Sample(), ISampleUtility)
+        self.assertIn('', voc)
+        self.assertEqual(voc.getTermByToken('t').value, '')
+        self.assertEqual(len(voc), 3)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
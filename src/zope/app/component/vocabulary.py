@@ -11,13 +11,202 @@
 # FOR A PARTICULAR PURPOSE.
 #
 ##############################################################################
+import weakref
+
+import zope.component
+from zope.component.interface import interfaceToName
+from zope.interface import Interface
+from zope.interface import implementer
+from zope.interface import providedBy
+from zope.interface import provider
+from zope.interface.interfaces import IInterface
+from zope.interface.interfaces import IUtilityRegistration
+from zope.schema.interfaces import IVocabularyFactory
+from zope.schema.interfaces import IVocabularyTokenized
+from zope.schema.vocabulary import SimpleTerm
+from zope.schema.vocabulary import SimpleVocabulary
+from zope.security.proxy import removeSecurityProxy
+
+from zope.app.component._bbb import lazyImports
+
 
 # BBB
+__getattr__, __dir__, _bbb_all = lazyImports(__name__, {
+    'zope.componentvocabulary.vocabulary': (
+        'InterfacesVocabulary', 'UtilityComponentInterfacesVocabulary',
+        'UtilityNames', 'UtilityNameTerm', 'UtilityTerm', 'UtilityVocabulary',
+    ),
+})
+__all__ = _bbb_all + [
+    'CachedUtilityComponentInterfacesVocabulary', 'CachedUtilityNames',
+    'CachedUtilityVocabulary',
+]
+
+
+class _ProvidedInterfaces:
+    # The vocabulary of the interfaces of a specification.  It subscribes
+    # to the specification to be dropped from the cache when the
+    # declarations change.
+
+    def __init__(self, spec):
+        terms = [SimpleTerm(iface, interfaceToName(None, iface))
+                 for iface in spec.flattened()]
+        terms.sort(key=lambda term: term.token)
+        self.vocabulary = SimpleVocabulary(terms)
+        self._spec = weakref.ref(spec)
+        spec.subscribe(self)
+
+    def changed(self, originally_changed):
+        spec = self._spec()
+        if spec is not None and _provided_interfaces.get(spec) is self:
+            del _provided_interfaces[spec]
+
+
+_provided_interfaces = weakref.WeakKeyDictionary()
+
+
+@provider(IVocabularyFactory)
+def CachedUtilityComponentInterfacesVocabulary(context):
+    """Vocabulary of the interfaces provided by a (utility) component
+
+    This is like `UtilityComponentInterfacesVocabulary`, but the
+    vocabulary is computed only once for all the objects with the same
+    interface declarations.  The terms are sorted by token.
+    """
+    if IUtilityRegistration.providedBy(context):
+        context = context.component
+    spec = providedBy(removeSecurityProxy(context))
+    cached = _provided_interfaces.get(spec)
+    if cached is None:
+        cached = _provided_interfaces[spec] = _ProvidedInterfaces(spec)
+    return cached.vocabulary
+
+
+# The data of the utility vocabularies by utility registry: the
+# generations of the registry and its bases when it was computed, and the
+# data by vocabulary kind and interface.
+_utility_data = weakref.WeakKeyDictionary()
+
+
+def _utilityData(sm, key, factory):
+    utilities = removeSecurityProxy(sm).utilities
+    generations = tuple(r._generation for r in utilities.ro)
+    cached = _utility_data.get(utilities)
+    if cached is None or cached[0] != generations:
+        cached = _utility_data[utilities] = (generations, {})
+    data = cached[1].get(key)
+    if data is None:
+        data = cached[1][key] = factory()
+    return data
+
+
+class _UtilityTerms:
+    # The terms of the utilities providing an interface, sorted by token
+
+    def __init__(self, sm, interface, nameOnly):
+        from zope.componentvocabulary.vocabulary import UtilityTerm
+        terms = [UtilityTerm(name if nameOnly else util, name)
+                 for name, util in sm.getUtilitiesFor(interface)]
+        terms.sort(key=lambda term: term.token)
+        self.terms = tuple(terms)
+        self.by_token = {term.token: term for term in terms}
+
+
+class _UtilityNameTerms:
+    # The terms of the names of the utilities providing an interface
+
+    def __init__(self, sm, interface):
+        from zope.componentvocabulary.vocabulary import UtilityNameTerm
+        self.terms = tuple(UtilityNameTerm(name)
+                           for name, util in sm.getUtilitiesFor(interface))
+        self.by_value = {term.value: term for term in self.terms}
+        self.by_token = {term.token: term for term in self.terms}
+
+
+@implementer(IVocabularyTokenized)
+@provider(IVocabularyFactory)
+class CachedUtilityVocabulary:
+    """Vocabulary of the utilities providing an interface
+
+    This is like `zope.componentvocabulary.vocabulary.UtilityVocabulary`
+    and is customized the same way, but the terms are computed once per
+    site manager and interface.  They are reused until the utility
+    registrations of the site manager or of its bases change.
+    """
+
+    # override these in subclasses
+    interface = Interface
+    nameOnly = False
+
+    def __init__(self, context, **kw):
+        if kw:
+            self.nameOnly = bool(kw.get('nameOnly', False))
+            interface = kw.get('interface', Interface)
+            if isinstance(interface, str):
+                interface = zope.component.getUtility(IInterface, interface)
+            self.interface = interface
+        sm = zope.component.getSiteManager(context)
+        self._data = _utilityData(
+            sm, ('terms', self.interface, self.nameOnly),
+            lambda: _UtilityTerms(sm, self.interface, self.nameOnly))
+
+    def __contains__(self, value):
+        return any(term.value == value for term in self._data.terms)
+
+    def getTerm(self, value):
+        for term in self._data.terms:
+            if term.value == value:
+                return term
+        raise LookupError(value)
+
+    def getTermByToken(self, token):
+        try:
+            return self._data.by_token[token]
+        except KeyError:
+            raise LookupError(token)
+
+    def __iter__(self):
+        return iter(self._data.terms)
+
+    def __len__(self):
+        return len(self._data.terms)
+
+
+@implementer(IVocabularyTokenized)
+class CachedUtilityNames:
+    """Vocabulary of the names of the utilities providing an interface
+
+    This is like `zope.componentvocabulary.vocabulary.UtilityNames`, but
+    the terms are computed once per site manager and interface and reused
+    until the utility registrations of the site manager or of its bases
+    change.  Like there, the utilities of the current site are used.
+    """
+
+    def __init__(self, interface):
+        self.interface = interface
+
+    def _data(self):
+        sm = zope.component.getSiteManager()
+        return _utilityData(sm, ('names', self.interface),
+                            lambda: _UtilityNameTerms(sm, self.interface))
+
+    def __contains__(self, value):
+        return value in self._data().by_value
+
+    def getTerm(self, value):
+        try:
+            return self._data().by_value[value]
+        except KeyError:
+            raise ValueError(value)
+
+    def getTermByToken(self, token):
+        try:
+            return self._data().by_token[token]
+        except KeyError:
+            raise LookupError("no matching token: %r" % token)
+
+    def __iter__(self):
+        return iter(self._data().terms)
 
-from zope.componentvocabulary.vocabulary import InterfacesVocabulary
-from zope.componentvocabulary.vocabulary import \
-    UtilityComponentInterfacesVocabulary
-from zope.componentvocabulary.vocabulary import UtilityNames
-from zope.componentvocabulary.vocabulary import UtilityNameTerm
-from zope.componentvocabulary.vocabulary import UtilityTerm
-from zope.componentvocabulary.vocabulary import UtilityVocabulary
+    def __len__(self):
+        return len(self._data().terms)